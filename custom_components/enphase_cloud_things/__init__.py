@@ -1,6 +1,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import voluptuous as vol
@@ -32,10 +33,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry_data = data.setdefault(entry.entry_id, {})
 
     # Create and prime the coordinator once, used by all platforms
-    from .coordinator import EnphaseCoordinator  # local import to avoid heavy deps during non-HA imports
-    coord = EnphaseCoordinator(hass, entry.data, config_entry=entry)
+    from .coordinator import (  # local import to avoid heavy deps during non-HA imports
+        ChargerState,
+        EnphaseCoordinator,
+        async_get_enphase_session,
+        async_update_request_tracing,
+    )
+    # Enlighten traffic uses the integration's own connection pool; fall back
+    # to Home Assistant's shared session if it cannot be created
+    try:
+        session = async_get_enphase_session(hass)
+    except Exception as err:  # noqa: BLE001
+        _LOGGER.debug("Using shared HTTP session: %s", err)
+        session = None
+    coord = EnphaseCoordinator(hass, entry.data, config_entry=entry, session=session)
     entry_data["coordinator"] = coord
+    # Request tracing is shared by all entries; on while any of them opts in
+    async_update_request_tracing(hass)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     await coord.async_config_entry_first_refresh()
+    # Prime tariff/savings/VPP domains; their failures do not block setup
+    await coord.async_refresh_domains()
+    # Reuse the start/stop endpoint variants discovered before the restart
+    await coord.async_restore_variants()
+    # Renew credentials ahead of token expiry instead of after a rejected poll
+    coord.async_schedule_token_refresh()
+    entry.async_on_unload(coord.async_cancel_token_refresh)
 
     # Register a parent site device to link chargers via via_device
     site_id = entry.data.get("site_id")
@@ -56,10 +79,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # This harmonizes name/model/version and links chargers to the site via via_device
     serials: list[str] = list(coord.serials or (coord.data or {}).keys())
     for sn in serials:
-        d = (coord.data or {}).get(sn) or {}
-        display_name_raw = d.get("display_name")
+        d = ChargerState.from_mapping(sn, (coord.data or {}).get(sn))
+        display_name_raw = d.display_name
         display_name = str(display_name_raw) if display_name_raw else None
-        fallback_name_raw = d.get("name")
+        fallback_name_raw = d.name
         fallback_name = str(fallback_name_raw) if fallback_name_raw else None
         dev_name = display_name or fallback_name or f"Charger {sn}"
         kwargs = {
@@ -72,7 +95,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if site_dev is not None:
             # Link the charger device via the parent site using identifiers
             kwargs["via_device"] = (DOMAIN, f"site:{site_id}")
-        model_name_raw = d.get("model_name")
+        model_name_raw = d.model_name
         model_name = str(model_name_raw) if model_name_raw else None
         model_display = None
         if display_name and model_name:
@@ -85,12 +108,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             model_display = dev_name
         if model_display:
             kwargs["model"] = model_display
-        model_id = d.get("model_id")
+        model_id = d.model_id
         # Device registry does not support a separate model_id field; ignore it
-        hw = d.get("hw_version")
+        hw = d.hw_version
         if hw:
             kwargs["hw_version"] = str(hw)
-        sw = d.get("sw_version")
+        sw = d.sw_version
         if sw:
             kwargs["sw_version"] = str(sw)
         # Compare with existing device and only log if a change is needed
@@ -141,10 +164,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if isinstance(entry_data, dict) and "coordinator" in entry_data:
+            coord = entry_data["coordinator"]
+            # Other sites of the account stop deferring to this site's rate limits
+            coord.rate_limiter.release(coord.site_id)
+        from .coordinator import (
+            async_close_enphase_session,
+            async_update_request_tracing,
+        )
+
+        async_update_request_tracing(hass)
+        # Close the dedicated HTTP session once no site is using it
+        if not any(
+            isinstance(v, dict) and "coordinator" in v for v in hass.data[DOMAIN].values()
+        ):
+            await async_close_enphase_session(hass)
     return unload_ok
 
 
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    from .coordinator import async_update_request_tracing
+
+    async_update_request_tracing(hass)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if isinstance(entry_data, dict) and "coordinator" in entry_data:
+        entry_data["coordinator"].apply_options()
+
+
 def _register_services(hass: HomeAssistant) -> None:
     async def _resolve_sn(device_id: str) -> str | None:
         dev_reg = dr.async_get(hass)
@@ -186,6 +233,10 @@ def _register_services(hass: HomeAssistant) -> None:
                 return coord
         return None
 
+    async def _refresh_all(coords) -> None:
+        # One (coalesced) refresh per affected coordinator after all commands
+        await asyncio.gather(*(coord.async_request_refresh() for coord in coords))
+
     DEVICE_ID_LIST = vol.All(cv.ensure_list, [cv.string])
 
     START_SCHEMA = vol.Schema({
@@ -223,6 +274,7 @@ def _register_services(hass: HomeAssistant) -> None:
         if not device_ids:
             return
         connector_id = int(call.data.get("connector_id", 1))
+        to_refresh: dict[int, object] = {}
         for device_id in device_ids:
             sn = await _resolve_sn(device_id)
             if not sn:
@@ -234,15 +286,20 @@ def _register_services(hass: HomeAssistant) -> None:
             if level is None:
                 level = coord.last_set_amps.get(sn, 32)
             amps = int(level)
-            await coord.client.start_charging(sn, amps, connector_id)
+            result = await coord.client.start_charging(sn, amps, connector_id)
             coord.set_last_set_amps(sn, amps)
+            if not (isinstance(result, dict) and result.get("status") == "not_ready"):
+                coord.async_apply_optimistic(sn, charging=True)
             coord.kick_fast(90)
-            await coord.async_request_refresh()
+            coord.invalidate_summary_cache()
+            to_refresh[id(coord)] = coord
+        await _refresh_all(to_refresh.values())
 
     async def _svc_stop(call):
         device_ids = _extract_device_ids(call)
         if not device_ids:
             return
+        to_refresh: dict[int, object] = {}
         for device_id in device_ids:
             sn = await _resolve_sn(device_id)
             if not sn:
@@ -251,8 +308,11 @@ def _register_services(hass: HomeAssistant) -> None:
             if not coord:
                 continue
             await coord.client.stop_charging(sn)
+            coord.async_apply_optimistic(sn, charging=False)
             coord.kick_fast(60)
-            await coord.async_request_refresh()
+            coord.invalidate_summary_cache()
+            to_refresh[id(coord)] = coord
+        await _refresh_all(to_refresh.values())
 
     async def _svc_trigger(call):
         device_ids = _extract_device_ids(call)
@@ -260,6 +320,7 @@ def _register_services(hass: HomeAssistant) -> None:
             return {}
         message = call.data["requested_message"]
         results: list[dict[str, object]] = []
+        to_refresh: dict[int, object] = {}
         for device_id in device_ids:
             sn = await _resolve_sn(device_id)
             if not sn:
@@ -269,7 +330,8 @@ def _register_services(hass: HomeAssistant) -> None:
                 continue
             reply = await coord.client.trigger_message(sn, message)
             coord.kick_fast(60)
-            await coord.async_request_refresh()
+            coord.invalidate_summary_cache()
+            to_refresh[id(coord)] = coord
             results.append(
                 {
                     "device_id": device_id,
@@ -278,6 +340,7 @@ def _register_services(hass: HomeAssistant) -> None:
                     "response": reply,
                 }
             )
+        await _refresh_all(to_refresh.values())
         return {"results": results}
 
     hass.services.async_register(DOMAIN, "start_charging", _svc_start, schema=START_SCHEMA)
@@ -344,3 +407,23 @@ def _register_services(hass: HomeAssistant) -> None:
 
     hass.services.async_register(DOMAIN, "start_live_stream", _svc_start_stream)
     hass.services.async_register(DOMAIN, "stop_live_stream", _svc_stop_stream)
+
+    # Request phase timings (opt-in via options)
+    TIMINGS_SCHEMA = vol.Schema({vol.Optional("reset", default=False): cv.boolean})
+
+    async def _svc_request_timings(call):
+        from .coordinator import async_get_request_tracer
+
+        tracer = async_get_request_tracer(hass)
+        stats = tracer.stats()
+        if call.data.get("reset"):
+            tracer.reset()
+        return stats
+
+    timings_register_kwargs: dict[str, object] = {"schema": TIMINGS_SCHEMA}
+    if SupportsResponse is not None:
+        try:
+            timings_register_kwargs["supports_response"] = SupportsResponse.ONLY
+        except AttributeError:
+            timings_register_kwargs["supports_response"] = SupportsResponse
+    hass.services.async_register(DOMAIN, "get_request_timings", _svc_request_timings, **timings_register_kwargs)
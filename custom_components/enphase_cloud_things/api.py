@@ -1,11 +1,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import json
 import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any, Iterable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
 
 import aiohttp
 import async_timeout
@@ -17,6 +28,11 @@ from .const import (
     LOGIN_URL,
 )
 
+try:  # Faster decoder when available (bundled with Home Assistant)
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -104,6 +120,27 @@ def _decode_jwt_exp(token: str) -> int | None:
     return None
 
 
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    now = now or datetime.now(UTC)
+    return max(0.0, (when - now).total_seconds())
+
+
 async def _request_json(
     session: aiohttp.ClientSession,
     method: str,
@@ -350,6 +387,370 @@ async def async_fetch_chargers(
         return []
     return _normalize_chargers(payload)
 
+# Most recent GET responses kept for conditional requests / body-hash reuse
+MAX_CACHED_RESPONSES = 32
+# Responses larger than this are rejected without decoding
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+# Bodies are read in chunks of this size so oversized ones are abandoned early
+READ_CHUNK_BYTES = 64 * 1024
+# Bodies above this size are decoded in the executor instead of the event loop
+DECODE_IN_EXECUTOR_BYTES = 256 * 1024
+JSON_BACKEND = "orjson" if _orjson is not None else "json"
+
+
+class ResponseTooLarge(aiohttp.ClientError):
+    """Raised when a response body exceeds MAX_RESPONSE_BYTES."""
+
+
+def _loads(body: bytes) -> Any:
+    if not body.strip():
+        return None
+    if _orjson is not None:
+        return _orjson.loads(body)
+    return json.loads(body)
+
+
+@dataclass
+class _CachedResponse:
+    """Validators and decoded payload of the last GET response for a URL.
+
+    ``value`` is handed to every caller that gets a 304 or an identical body,
+    so GET payloads are shared and must be treated as read-only.
+    """
+
+    digest: bytes
+    value: Any
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class _TokenBucket:
+    """Requests-per-minute budget for one host; commands jump the queue."""
+
+    def __init__(self, rpm: float) -> None:
+        self.set_rate(rpm)
+        self._tokens = self._capacity
+        self._stamp = time.monotonic()
+        self.waiting = {True: 0, False: 0}
+        self.last_wait_ms = 0
+        self.max_wait_ms = 0
+        self.acquired = 0
+        self.delayed = 0
+        # Called whenever a request has to wait for a slot
+        self.on_queued: Callable[[], None] | None = None
+
+    def set_rate(self, rpm: float) -> None:
+        self.rpm = max(float(rpm), 1.0)
+        self._rate = self.rpm / 60.0
+        # Allow short bursts (a poll's fan-out) without exceeding the minute budget
+        self._capacity = max(1.0, self.rpm / 6.0)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._stamp) * self._rate)
+        self._stamp = now
+
+    async def acquire(self, priority: bool) -> float:
+        start = time.monotonic()
+        self.waiting[priority] += 1
+        try:
+            while True:
+                self._refill()
+                # Polls wait while a control command is queued for the same host
+                if self._tokens >= 1 and (priority or not self.waiting[True]):
+                    self._tokens -= 1
+                    break
+                shortfall = max(1 - self._tokens, 0.0)
+                if self.on_queued is not None:
+                    self.on_queued()
+                await asyncio.sleep(max(shortfall / self._rate, 0.05))
+        finally:
+            self.waiting[priority] -= 1
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.last_wait_ms = int(waited * 1000)
+        self.max_wait_ms = max(self.max_wait_ms, self.last_wait_ms)
+        if waited > 0.001:
+            self.delayed += 1
+        return waited
+
+    def stats(self) -> dict:
+        self._refill()
+        return {
+            "rpm": self.rpm,
+            "tokens": round(self._tokens, 2),
+            "queue_depth": self.waiting[True] + self.waiting[False],
+            "priority_waiting": self.waiting[True],
+            "last_wait_ms": self.last_wait_ms,
+            "max_wait_ms": self.max_wait_ms,
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+        }
+
+
+# Endpoint budgets entered via request_budget, with the task that owns each
+_BUDGETS: ContextVar[tuple[tuple[asyncio.Task | None, Any], ...]] = ContextVar("enphase_budgets", default=())
+
+
+@asynccontextmanager
+async def request_budget(seconds: float) -> AsyncIterator[Any]:
+    """Wall-clock budget for requests that excludes time queued on the rate limiter.
+
+    Local throttling is not a slow endpoint, so the budget is paused while a
+    request made within it waits for a limiter slot.
+    """
+    async with async_timeout.timeout(seconds) as cm:
+        token = _BUDGETS.set((*_BUDGETS.get(), (asyncio.current_task(), cm)))
+        try:
+            yield cm
+        finally:
+            _BUDGETS.reset(token)
+
+
+async def _outside_budgets(waiter: Awaitable[float]) -> float:
+    """Await ``waiter`` with this task's request budgets paused."""
+    task = asyncio.current_task()
+    budgets = [cm for owner, cm in _BUDGETS.get() if owner is task and cm.deadline is not None]
+    if not budgets:
+        return await waiter
+    loop = asyncio.get_running_loop()
+    paused_at = loop.time()
+    remaining = [(cm, cm.deadline - paused_at) for cm in budgets]
+    for cm in budgets:
+        cm.reject()
+    try:
+        return await waiter
+    finally:
+        resumed_at = loop.time()
+        for cm, left in remaining:
+            cm.update(resumed_at + left)
+
+
+class RequestRateLimiter:
+    """Token-bucket request limiter per API host, shared across clients.
+
+    Non-GET requests (start/stop, amps, charge mode, trigger) are treated as
+    control commands and served before queued polls.
+    """
+
+    def __init__(self, rates: dict[str, float] | None = None, default_rpm: float = 60) -> None:
+        self.default_rpm = default_rpm
+        self._buckets: dict[str, _TokenBucket] = {}
+        # Rate each sharer asked for per host; the lowest one is applied
+        self._requested: dict[str, dict[str, float]] = {}
+        # Deepest queue per reader since its last take_peak_queue_depth()
+        self._peaks: dict[str, int] = {}
+        for host, rpm in (rates or {}).items():
+            self.set_rate(host, rpm)
+
+    def _new_bucket(self, host: str, rpm: float) -> _TokenBucket:
+        bucket = self._buckets[host] = _TokenBucket(rpm)
+        bucket.on_queued = self._note_queue_depth
+        return bucket
+
+    def set_rate(self, host: str, rpm: float) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            self._new_bucket(host, rpm)
+        else:
+            bucket.set_rate(rpm)
+
+    def request_rate(self, owner: str, host: str, rpm: float) -> dict[str, float]:
+        """Record one sharer's budget for a host and apply the strictest.
+
+        Returns every sharer's requested rate for the host so callers can
+        report disagreement.
+        """
+        requested = self._requested.setdefault(host, {})
+        requested[owner] = float(rpm)
+        self.set_rate(host, min(requested.values()))
+        return dict(requested)
+
+    def release(self, owner: str) -> None:
+        """Drop a sharer's requests; the remaining sharers' limits apply."""
+        self._peaks.pop(owner, None)
+        for host, requested in self._requested.items():
+            if requested.pop(owner, None) is not None and requested:
+                self.set_rate(host, min(requested.values()))
+
+    async def acquire(self, url: str, *, priority: bool = False) -> float:
+        """Wait for a request slot on the URL's host; returns seconds waited."""
+        host = urlsplit(url).hostname or ""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._new_bucket(host, self.default_rpm)
+        return await bucket.acquire(priority)
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(b.waiting[True] + b.waiting[False] for b in self._buckets.values())
+
+    def _note_queue_depth(self) -> None:
+        depth = self.queue_depth
+        for reader, peak in self._peaks.items():
+            if depth > peak:
+                self._peaks[reader] = depth
+
+    def take_peak_queue_depth(self, reader: str) -> int:
+        """Deepest queue since this reader's previous call; starts a new window.
+
+        The queue is usually empty by the time anyone looks, so sampling
+        ``queue_depth`` would hide the bursts that actually waited.
+        """
+        depth = self.queue_depth
+        peak = max(self._peaks.get(reader, 0), depth)
+        self._peaks[reader] = depth
+        return peak
+
+    @property
+    def last_wait_ms(self) -> int:
+        return max((b.last_wait_ms for b in self._buckets.values()), default=0)
+
+    def stats(self) -> dict[str, dict]:
+        return {host: bucket.stats() for host, bucket in self._buckets.items()}
+
+
+# URL fragments identifying each endpoint family in request traces
+_TRACE_ENDPOINTS = (
+    ("/ev_chargers/status", "status"),
+    ("/summary", "summary_v2"),
+    ("/schedules", "charge_mode"),
+    ("/charge_mode", "charge_mode"),
+    ("vpp-mgr", "vpp_events"),
+    ("/savings", "savings"),
+    ("/tariff", "tariffs"),
+)
+_TRACE_PHASES = ("dns_ms", "connect_ms", "ttfb_ms", "download_ms", "total_ms")
+
+
+def _trace_endpoint(url: str) -> str:
+    for fragment, name in _TRACE_ENDPOINTS:
+        if fragment in url:
+            return name
+    return "other"
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of ``values``."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return round(ordered[rank - 1], 1)
+
+
+class RequestTracer:
+    """Opt-in per-request phase timings collected via aiohttp tracing.
+
+    Each request records DNS, connect (TCP + TLS), time to first byte after
+    the request was sent, body download, total time, status and bytes,
+    tagged by endpoint family. The last ``window`` samples per endpoint are
+    kept for rolling percentiles. Nothing is recorded while disabled.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        self.enabled = False
+        self._window = window
+        self._samples: dict[str, deque[dict]] = {}
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        config = aiohttp.TraceConfig()
+        config.on_request_start.append(self._on_request_start)
+        config.on_dns_resolvehost_start.append(self._mark("dns_start"))
+        config.on_dns_resolvehost_end.append(self._mark("dns_end"))
+        config.on_connection_create_start.append(self._mark("connect_start"))
+        config.on_connection_create_end.append(self._mark("connect_end"))
+        config.on_request_headers_sent.append(self._mark("sent"))
+        config.on_request_end.append(self._on_request_end)
+        config.on_response_chunk_received.append(self._on_chunk)
+        config.on_request_exception.append(self._on_exception)
+        return config
+
+    async def _on_request_start(self, _session, ctx, params) -> None:
+        ctx.enphase = None
+        if not self.enabled:
+            return
+        url = str(params.url)
+        ctx.enphase = {"endpoint": _trace_endpoint(url), "marks": {"start": time.monotonic()}}
+
+    def _mark(self, name: str):
+        async def _handler(_session, ctx, _params) -> None:
+            trace = getattr(ctx, "enphase", None)
+            if trace is not None:
+                trace["marks"][name] = time.monotonic()
+
+        return _handler
+
+    async def _on_request_end(self, _session, ctx, params) -> None:
+        trace = getattr(ctx, "enphase", None)
+        if trace is None:
+            return
+        marks = trace["marks"]
+        marks["end"] = time.monotonic()
+        sample = {"status": params.response.status, "bytes": 0}
+        self._finish(sample, marks)
+        trace["sample"] = sample
+        self._samples.setdefault(trace["endpoint"], deque(maxlen=self._window)).append(sample)
+
+    async def _on_chunk(self, _session, ctx, params) -> None:
+        trace = getattr(ctx, "enphase", None)
+        sample = trace.get("sample") if trace else None
+        if sample is None:
+            return
+        # Body reads happen after on_request_end; extend the same sample
+        trace["marks"]["body"] = time.monotonic()
+        sample["bytes"] += len(params.chunk)
+        self._finish(sample, trace["marks"])
+
+    async def _on_exception(self, _session, ctx, params) -> None:
+        trace = getattr(ctx, "enphase", None)
+        if trace is None:
+            return
+        trace["marks"]["end"] = time.monotonic()
+        sample = {"status": None, "bytes": 0, "error": type(params.exception).__name__}
+        self._finish(sample, trace["marks"])
+        self._samples.setdefault(trace["endpoint"], deque(maxlen=self._window)).append(sample)
+
+    @staticmethod
+    def _finish(sample: dict, marks: dict[str, float]) -> None:
+        def _span(start: str, end: str) -> float | None:
+            if start in marks and end in marks:
+                return (marks[end] - marks[start]) * 1000
+            return None
+
+        sample["dns_ms"] = _span("dns_start", "dns_end")
+        sample["connect_ms"] = _span("connect_start", "connect_end")
+        sample["ttfb_ms"] = _span("sent", "end")
+        sample["download_ms"] = _span("end", "body")
+        sample["total_ms"] = _span("start", "body" if "body" in marks else "end")
+
+    def stats(self) -> dict:
+        """Rolling p50/p90/p99 per endpoint and phase, plus status and byte counts."""
+        out: dict[str, Any] = {"enabled": self.enabled, "endpoints": {}}
+        for endpoint, samples in self._samples.items():
+            entry: dict[str, Any] = {"count": len(samples)}
+            for phase in _TRACE_PHASES:
+                values = [s[phase] for s in samples if s.get(phase) is not None]
+                if values:
+                    entry[phase] = {
+                        "p50": _percentile(values, 50),
+                        "p90": _percentile(values, 90),
+                        "p99": _percentile(values, 99),
+                    }
+            statuses: dict[str, int] = {}
+            for s in samples:
+                key = str(s["status"]) if s["status"] is not None else s.get("error", "error")
+                statuses[key] = statuses.get(key, 0) + 1
+            entry["status_codes"] = statuses
+            sizes = [s["bytes"] for s in samples if s["bytes"]]
+            entry["avg_bytes"] = int(sum(sizes) / len(sizes)) if sizes else 0
+            out["endpoints"][endpoint] = entry
+        return out
+
+    def reset(self) -> None:
+        self._samples.clear()
+
+
 class EnphaseEVClient:
     def __init__(
         self,
@@ -358,15 +759,25 @@ class EnphaseEVClient:
         eauth: str | None,
         cookie: str | None,
         timeout: int = 15,
+        limiter: RequestRateLimiter | None = None,
     ):
         self._timeout = int(timeout)
         self._s = session
+        # Optional shared request budget; None leaves requests unthrottled
+        self._limiter = limiter
         self._site = site_id
         # Cache working API variant indexes per action to avoid retries once discovered
         self._start_variant_idx: int | None = None
         self._stop_variant_idx: int | None = None
+        # Notified with ("start" | "stop", index or None) when a working variant changes
+        self.on_variant_change: Callable[[str, int | None], None] | None = None
         self._cookie = cookie or ""
         self._eauth = eauth or None
+        # Per-URL validators for conditional GETs, plus hit/miss counters
+        self._responses: dict[str, _CachedResponse] = {}
+        self.cache_stats = {"not_modified": 0, "body_unchanged": 0, "miss": 0}
+        # Body size and decode time per endpoint family
+        self.decode_stats: dict[str, dict[str, Any]] = {}
         self._h = {
             "Accept": "application/json, text/plain, */*",
             "X-Requested-With": "XMLHttpRequest",
@@ -407,6 +818,22 @@ class EnphaseEVClient:
         except Exception:
             self._h.pop("X-CSRF-Token", None)
 
+    def restore_variants(self, *, start: int | None = None, stop: int | None = None) -> None:
+        """Seed the working start/stop variant indexes (e.g. from persisted state)."""
+        self._start_variant_idx = start if isinstance(start, int) else None
+        self._stop_variant_idx = stop if isinstance(stop, int) else None
+
+    def _set_variant(self, action: str, idx: int | None) -> None:
+        attr = f"_{action}_variant_idx"
+        if getattr(self, attr) == idx:
+            return
+        setattr(self, attr, idx)
+        if self.on_variant_change is not None:
+            try:
+                self.on_variant_change(action, idx)
+            except Exception:
+                _LOGGER.debug("Failed to record %s variant change", action, exc_info=True)
+
     def _bearer(self) -> str | None:
         """Extract Authorization bearer token from cookies if present.
 
@@ -428,6 +855,9 @@ class EnphaseEVClient:
         Accepts optional ``headers`` in kwargs which will be merged with the
         default headers for this client, allowing call-sites to add/override
         fields (e.g. Authorization) without causing duplicate parameter errors.
+
+        GET payloads may be the same object returned for an earlier request of
+        the URL; callers build new structures from them and never mutate them.
         """
         # Merge headers: start with client defaults, then apply any overrides
         base_headers = dict(self._h)
@@ -435,12 +865,101 @@ class EnphaseEVClient:
         if isinstance(extra_headers, dict):
             base_headers.update(extra_headers)
 
+        # GETs send the stored validators; unchanged bodies reuse the decoded payload
+        is_get = method.upper() == "GET"
+        cached = self._responses.get(url) if is_get else None
+        if cached is not None:
+            if cached.etag:
+                base_headers.setdefault("If-None-Match", cached.etag)
+            if cached.last_modified:
+                base_headers.setdefault("If-Modified-Since", cached.last_modified)
+
+        limiter = getattr(self, "_limiter", None)
+        if limiter is not None:
+            await _outside_budgets(limiter.acquire(url, priority=not is_get))
+
         async with async_timeout.timeout(self._timeout):
             async with self._s.request(method, url, headers=base_headers, **kwargs) as r:
                 if r.status == 401:
                     raise Unauthorized()
+                if r.status == 304 and cached is not None:
+                    self.cache_stats["not_modified"] += 1
+                    return cached.value
                 r.raise_for_status()
-                return await r.json()
+                body = await self._read_body(r, url)
+                if not is_get:
+                    return await self._decode(body, url, r)
+                digest = hashlib.blake2b(body, digest_size=16).digest()
+                if cached is not None and cached.digest == digest:
+                    self.cache_stats["body_unchanged"] += 1
+                    value = cached.value
+                else:
+                    self.cache_stats["miss"] += 1
+                    value = await self._decode(body, url, r)
+                self._remember_response(
+                    url,
+                    _CachedResponse(
+                        digest=digest,
+                        value=value,
+                        etag=r.headers.get("ETag"),
+                        last_modified=r.headers.get("Last-Modified"),
+                    ),
+                )
+                return value
+
+    async def _read_body(self, r, url: str) -> bytes:
+        """Read the response body, refusing anything over MAX_RESPONSE_BYTES."""
+        declared = r.headers.get("Content-Length") if r.headers else None
+        if declared is not None and str(declared).isdigit() and int(declared) > MAX_RESPONSE_BYTES:
+            raise ResponseTooLarge(f"{_trace_endpoint(url)} response is {declared} bytes")
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in r.content.iter_chunked(READ_CHUNK_BYTES):
+            size += len(chunk)
+            if size > MAX_RESPONSE_BYTES:
+                raise ResponseTooLarge(f"{_trace_endpoint(url)} response exceeds {MAX_RESPONSE_BYTES} bytes")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def _decode(self, body: bytes, url: str, r) -> Any:
+        """Decode JSON, off the event loop for large bodies, and record its cost.
+
+        Bodies that are not JSON raise ``aiohttp.ContentTypeError``, as
+        ``ClientResponse.json()`` does.
+        """
+        offload = len(body) > DECODE_IN_EXECUTOR_BYTES
+        t0 = time.monotonic()
+        try:
+            if offload:
+                value = await asyncio.get_running_loop().run_in_executor(None, _loads, body)
+            else:
+                value = _loads(body)
+        except ValueError as err:  # json and orjson decode errors
+            raise aiohttp.ContentTypeError(
+                r.request_info,
+                r.history,
+                status=r.status,
+                message=f"{_trace_endpoint(url)} response is not JSON: {err}",
+                headers=r.headers,
+            ) from err
+        elapsed_ms = round((time.monotonic() - t0) * 1000, 2)
+        stats = self.decode_stats.setdefault(
+            _trace_endpoint(url),
+            {"count": 0, "bytes_last": 0, "bytes_max": 0, "decode_ms_last": 0.0, "decode_ms_max": 0.0, "offloaded": 0},
+        )
+        stats["count"] += 1
+        stats["bytes_last"] = len(body)
+        stats["bytes_max"] = max(stats["bytes_max"], len(body))
+        stats["decode_ms_last"] = elapsed_ms
+        stats["decode_ms_max"] = max(stats["decode_ms_max"], elapsed_ms)
+        stats["offloaded"] += int(offload)
+        return value
+
+    def _remember_response(self, url: str, entry: _CachedResponse) -> None:
+        self._responses.pop(url, None)
+        self._responses[url] = entry
+        while len(self._responses) > MAX_CACHED_RESPONSES:
+            self._responses.pop(next(iter(self._responses)))
 
     async def status(self) -> dict:
         url = f"{BASE_URL}/service/evse_controller/{self._site}/ev_chargers/status"
@@ -553,18 +1072,20 @@ class EnphaseEVClient:
                 else:
                     result = await self._json(method, url, json=payload)
                 # Cache the working variant index for future calls
-                self._start_variant_idx = idx
+                self._set_variant("start", idx)
                 return result
             except aiohttp.ClientResponseError as e:
                 # 409/422 (and similar) often indicate not plugged in or not ready.
                 # Treat these as benign no-ops instead of surfacing as errors.
                 if e.status in (409, 422):
-                    self._start_variant_idx = idx
+                    self._set_variant("start", idx)
                     return {"status": "not_ready"}
                 # 400/404/405 variations likely indicate method/path mismatch; try next.
                 last_exc = e
                 continue
         if last_exc:
+            # The remembered variant stopped working too; rediscover next time
+            self._set_variant("start", None)
             raise last_exc
         # Should not happen, but keep static analyzer happy
         raise aiohttp.ClientError("start_charging failed with all variants")
@@ -589,17 +1110,18 @@ class EnphaseEVClient:
                     result = await self._json(method, url)
                 else:
                     result = await self._json(method, url, json=payload)
-                self._stop_variant_idx = idx
+                self._set_variant("stop", idx)
                 return result
             except aiohttp.ClientResponseError as e:
                 # If charger is not plugged in or already stopped, some backends
                 # respond with 400/404/409. Treat these as benign no-ops.
                 if e.status in (400, 404, 409, 422):
-                    self._stop_variant_idx = idx  # cache the working path even if no-op
+                    self._set_variant("stop", idx)  # cache the working path even if no-op
                     return {"status": "not_active"}
                 last_exc = e
                 continue
         if last_exc:
+            self._set_variant("stop", None)
             raise last_exc
         raise aiohttp.ClientError("stop_charging failed with all variants")
 
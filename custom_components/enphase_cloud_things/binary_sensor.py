@@ -51,8 +51,8 @@ class _EVBoolSensor(EnphaseBaseEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool:
-        d = (self._coord.data or {}).get(self._sn) or {}
-        v = d.get(self._key)
+        d = self._charger
+        v = getattr(d, self._key)
         return bool(v)
 
     # available and device_info inherited from base
@@ -136,7 +136,7 @@ class VPPEventTodayBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
     def __init__(self, coord: EnphaseCoordinator, entry: ConfigEntry):
         """Initialize the binary sensor."""
-        super().__init__(coord)
+        super().__init__(coord.domain_coordinator("vpp"))
         self._coord = coord
         self._entry = entry
         self._attr_unique_id = f"{DOMAIN}_vpp_{coord.site_id}_{coord.vpp_program_id}_event_today"
@@ -144,7 +144,7 @@ class VPPEventTodayBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._coord.last_update_success
+        return self.coordinator.last_update_success
 
     @property
     def is_on(self) -> bool:
@@ -187,45 +187,10 @@ class VPPEventTodayBinarySensor(CoordinatorEntity, BinarySensorEntity):
         if not self._coord.vpp_events_data:
             return []
 
-        today = dt_util.now().date()
-        today_events = []
-
-        response = self._coord.vpp_events_data
-        if isinstance(response, dict):
-            events = response.get("data", [])
-            for event_data in events:
-                try:
-                    # Parse start and end times
-                    start_str = event_data.get("start_time")
-                    end_str = event_data.get("end_time")
-
-                    if not start_str or not end_str:
-                        continue
-
-                    # Parse ISO format timestamps
-                    from datetime import datetime, timezone
-
-                    start_dt = datetime.fromisoformat(start_str.replace("+00:00", ""))
-                    if start_dt.tzinfo is None:
-                        start_dt = start_dt.replace(tzinfo=timezone.utc)
-
-                    end_dt = datetime.fromisoformat(end_str.replace("+00:00", ""))
-                    if end_dt.tzinfo is None:
-                        end_dt = end_dt.replace(tzinfo=timezone.utc)
-
-                    # Convert to local timezone for date comparison
-                    start_local = dt_util.as_local(start_dt)
-                    end_local = dt_util.as_local(end_dt)
-
-                    # Check if event overlaps with today
-                    if start_local.date() <= today <= end_local.date():
-                        today_events.append(event_data)
-
-                except Exception:
-                    # Skip events that can't be parsed
-                    continue
-
-        return today_events
+        now = dt_util.now()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+        return [event.raw for event in self._coord.vpp_index.overlapping(today_start, today_end)]
 
     @property
     def device_info(self):
@@ -32,10 +32,14 @@ class StartChargeButton(_BaseButton):
     async def async_press(self) -> None:
         # Use last requested amps or default to 32A
         amps = int(self._coord.last_set_amps.get(self._sn) or 32)
-        await self._coord.client.start_charging(self._sn, amps)
+        result = await self._coord.client.start_charging(self._sn, amps)
         self._coord.set_last_set_amps(self._sn, amps)
+        # Reflect the command now; the next status poll confirms or rolls back
+        if not (isinstance(result, dict) and result.get("status") == "not_ready"):
+            self._coord.async_apply_optimistic(self._sn, charging=True)
         # Poll quickly for a short window to reflect new state
         self._coord.kick_fast(90)
+        self._coord.invalidate_summary_cache()
         await self._coord.async_request_refresh()
 
 class StopChargeButton(_BaseButton):
@@ -44,6 +48,8 @@ class StopChargeButton(_BaseButton):
         self._attr_translation_key = "stop_charging"
     async def async_press(self) -> None:
         await self._coord.client.stop_charging(self._sn)
+        self._coord.async_apply_optimistic(self._sn, charging=False)
         # Poll quickly after stop to clear state faster
         self._coord.kick_fast(60)
+        self._coord.invalidate_summary_cache()
         await self._coord.async_request_refresh()
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, OPT_ENABLE_MONETARY_DEVICE, OPT_ENABLE_VPP_DEVICE
 from .coordinator import EnphaseCoordinator
 from .entity import EnphaseBaseEntity
+from .tariff import TariffPeriod
+from .vpp import VPPEvent
 
 
 async def async_setup_entry(
@@ -55,6 +57,8 @@ class EnphaseVPPCalendar(CalendarEntity):
     def __init__(self, coord: EnphaseCoordinator, entry: ConfigEntry):
         """Initialize the calendar."""
         self._coord = coord
+        # Subscribe to the vpp domain coordinator only
+        self._domain_coord = coord.domain_coordinator("vpp")
         self._entry = entry
         self._attr_unique_id = f"{DOMAIN}_vpp_{coord.site_id}_{coord.vpp_program_id}_calendar"
         self._attr_name = "VPP Events Calendar"
@@ -79,30 +83,15 @@ class EnphaseVPPCalendar(CalendarEntity):
         import logging
         _LOGGER = logging.getLogger(__name__)
 
-        now = dt_util.now()
-        upcoming_events = []
-
         if not self._coord.vpp_events_data:
             _LOGGER.debug("VPP Calendar event property: No vpp_events_data available")
             return None
 
-        response = self._coord.vpp_events_data
-        if isinstance(response, dict):
-            events = response.get("data", [])
-            _LOGGER.debug("VPP Calendar event property: Checking %s events for upcoming from %s", len(events), now)
-            for event_data in events:
-                event = self._parse_event(event_data)
-                if event and event.end >= now:
-                    upcoming_events.append(event)
-
-        # Return the next upcoming event
-        if upcoming_events:
-            upcoming_events.sort(key=lambda e: e.start)
-            _LOGGER.debug("VPP Calendar event property: Returning next event: %s", upcoming_events[0].summary)
-            return upcoming_events[0]
-
-        _LOGGER.debug("VPP Calendar event property: No upcoming events found")
-        return None
+        upcoming = self._coord.vpp_index.current_or_next(dt_util.now())
+        if upcoming is None:
+            _LOGGER.debug("VPP Calendar event property: No upcoming events found")
+            return None
+        return self._parse_event(upcoming)
 
     async def async_get_events(
         self,
@@ -114,54 +103,28 @@ class EnphaseVPPCalendar(CalendarEntity):
         import logging
         _LOGGER = logging.getLogger(__name__)
 
-        events = []
-
+        # Ranges outside the polled window are fetched on demand
+        await self._coord.async_ensure_vpp_range(start_date, end_date)
         if not self._coord.vpp_events_data:
             _LOGGER.debug("VPP Calendar: No vpp_events_data available")
-            return events
-
-        response = self._coord.vpp_events_data
-        if isinstance(response, dict):
-            event_list = response.get("data", [])
-            _LOGGER.debug("VPP Calendar: Processing %s events for range %s to %s",
-                         len(event_list), start_date, end_date)
-            for event_data in event_list:
-                event = self._parse_event(event_data)
-                if event:
-                    # Include events that overlap with the requested range
-                    if event.end >= start_date and event.start <= end_date:
-                        events.append(event)
-                        _LOGGER.debug("VPP Calendar: Added event %s (%s to %s)",
-                                     event.summary, event.start, event.end)
-                else:
-                    _LOGGER.debug("VPP Calendar: Failed to parse event: %s", event_data.get("id"))
+            return []
 
-        _LOGGER.debug("VPP Calendar: Returning %s events", len(events))
-        return sorted(events, key=lambda e: e.start)
+        # Include events that overlap with the requested range
+        events = [
+            event
+            for event in (self._parse_event(e) for e in self._coord.vpp_index.overlapping(start_date, end_date))
+            if event is not None
+        ]
+        _LOGGER.debug("VPP Calendar: Returning %s events for range %s to %s", len(events), start_date, end_date)
+        return events
 
-    def _parse_event(self, event_data: dict) -> CalendarEvent | None:
-        """Parse VPP event data into a CalendarEvent."""
+    def _parse_event(self, vpp_event: VPPEvent) -> CalendarEvent | None:
+        """Build a CalendarEvent from an indexed VPP event."""
         import logging
         _LOGGER = logging.getLogger(__name__)
 
+        event_data = vpp_event.raw
         try:
-            # Parse start and end times
-            start_str = event_data.get("start_time")
-            end_str = event_data.get("end_time")
-
-            if not start_str or not end_str:
-                _LOGGER.debug("VPP Calendar: Event %s missing start or end time", event_data.get("id"))
-                return None
-
-            # Parse ISO format timestamps - handle the +00:00 timezone format
-            start_dt = datetime.fromisoformat(start_str.replace("+00:00", "+00:00"))
-            if start_dt.tzinfo is None:
-                start_dt = start_dt.replace(tzinfo=timezone.utc)
-
-            end_dt = datetime.fromisoformat(end_str.replace("+00:00", "+00:00"))
-            if end_dt.tzinfo is None:
-                end_dt = end_dt.replace(tzinfo=timezone.utc)
-
             # Build event summary
             event_type = event_data.get("type", "unknown")
             status = event_data.get("status", "unknown")
@@ -203,8 +166,8 @@ class EnphaseVPPCalendar(CalendarEntity):
             description = "\n".join(description_parts)
 
             return CalendarEvent(
-                start=start_dt,
-                end=end_dt,
+                start=vpp_event.start,
+                end=vpp_event.end,
                 summary=summary,
                 description=description,
                 uid=event_data.get("id", ""),
@@ -218,13 +181,13 @@ class EnphaseVPPCalendar(CalendarEntity):
     async def async_added_to_hass(self):
         """When entity is added to hass."""
         self.async_on_remove(
-            self._coord.async_add_listener(self.async_write_ha_state)
+            self._domain_coord.async_add_listener(self.async_write_ha_state)
         )
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._coord.last_update_success
+        return self._domain_coord.last_update_success
 
 
 class EnphaseImportCostCalendar(CalendarEntity):
@@ -236,6 +199,8 @@ class EnphaseImportCostCalendar(CalendarEntity):
     def __init__(self, coord: EnphaseCoordinator, entry: ConfigEntry):
         """Initialize the calendar."""
         self._coord = coord
+        # Subscribe to the monetary domain coordinator only
+        self._domain_coord = coord.domain_coordinator("monetary")
         self._entry = entry
         self._attr_unique_id = f"{DOMAIN}_monetary_{coord.site_id}_import_cost_calendar"
         self._attr_name = "Import Cost Calendar"
@@ -282,132 +247,48 @@ class EnphaseImportCostCalendar(CalendarEntity):
 
     def _get_events(self, start_date: datetime, end_date: datetime, hass: HomeAssistant = None) -> list[CalendarEvent]:
         """Generate import cost events for the date range."""
-        if not self._coord.import_tariff_data:
+        tariff = self._coord.import_tariff
+        if tariff is None:
             return []
+        return [self._create_period_event(period) for period in tariff.periods(start_date, end_date)]
 
-        events = []
-        tariff_data = self._coord.import_tariff_data
-        purchase = tariff_data.get("purchase", {})
-        seasons = purchase.get("seasons", [])
-
-        # Generate events for each day in the range
-        current_date = start_date.date()
-        end = end_date.date()
-
-        while current_date <= end:
-            # Find the matching season for this date
-            month = current_date.month
-            day_of_week = current_date.weekday() + 1  # Monday=1
-
-            for season in seasons:
-                start_month = int(season.get("startMonth", 0))
-                end_month = int(season.get("endMonth", 0))
-
-                # Check if date is in this season
-                in_season = False
-                if start_month <= end_month:
-                    in_season = start_month <= month <= end_month
-                else:  # Wraps around year end
-                    in_season = month >= start_month or month <= end_month
-
-                if not in_season:
-                    continue
-
-                # Find matching day group
-                for day_group in season.get("days", []):
-                    if day_of_week not in day_group.get("days", []):
-                        continue
-
-                    # Create events for each period
-                    periods = day_group.get("periods", [])
-                    for period in periods:
-                        event = self._create_period_event(current_date, period, season, hass)
-                        if event:
-                            events.append(event)
-
-            current_date = current_date + timedelta(days=1)
-
-        return sorted(events, key=lambda e: e.start)
-
-    def _create_period_event(self, date, period: dict, season: dict, hass: HomeAssistant = None) -> CalendarEvent | None:
+    @staticmethod
+    def _create_period_event(period: TariffPeriod) -> CalendarEvent:
         """Create a calendar event for a tariff period."""
-        try:
-            start_time_str = period.get("startTime", "")
-            end_time_str = period.get("endTime", "")
-            rate = period.get("rate")
-            period_type = period.get("type", "unknown")
-
-            if rate is None:
-                return None
-
-            # Convert minutes from midnight to datetime
-            # Note: The API returns minutes in local time, not UTC
-            if not start_time_str and not end_time_str:
-                # Off-peak all day
-                start_dt = datetime.combine(date, datetime.min.time())
-                end_dt = datetime.combine(date + timedelta(days=1), datetime.min.time())
-            else:
-                start_minutes = int(start_time_str) if start_time_str else 0
-                end_minutes = int(end_time_str) if end_time_str else 1440
-
-                start_dt = datetime.combine(date, datetime.min.time()) + timedelta(minutes=start_minutes)
-
-                # Handle periods that cross midnight
-                if end_minutes >= 1440:
-                    end_dt = datetime.combine(date + timedelta(days=1), datetime.min.time())
-                else:
-                    end_dt = datetime.combine(date, datetime.min.time()) + timedelta(minutes=end_minutes)
-
-            # Make timezone aware - times are already in local timezone from the API
-            # Get the local timezone from Home Assistant
-            if hass:
-                local_tz = dt_util.get_time_zone(hass.config.time_zone)
-                start_dt = start_dt.replace(tzinfo=local_tz)
-                end_dt = end_dt.replace(tzinfo=local_tz)
-            else:
-                # Fallback: use the timezone from dt_util.now()
-                now_with_tz = dt_util.now()
-                start_dt = start_dt.replace(tzinfo=now_with_tz.tzinfo)
-                end_dt = end_dt.replace(tzinfo=now_with_tz.tzinfo)
-
-            # Create summary
-            rate_value = float(rate)
-            summary = f"${rate_value:.5f}/kWh - {period_type.replace('-', ' ').title()}"
-
-            # Create description with rate components
-            description_parts = [f"Rate: ${rate_value:.5f}/kWh"]
-            description_parts.append(f"Season: {season.get('id', 'unknown')}")
-            description_parts.append(f"Type: {period_type}")
-            
-            rate_components = period.get("rateComponents", [])
-            if rate_components:
-                description_parts.append("\nRate Components:")
-                for component in rate_components:
-                    for name, value in component.items():
-                        description_parts.append(f"  {name}: ${value:.5f}")
-
-            description = "\n".join(description_parts)
-
-            return CalendarEvent(
-                start=start_dt,
-                end=end_dt,
-                summary=summary,
-                description=description,
-            )
-
-        except Exception:
-            return None
+        period_type = period.period_type or "unknown"
+        summary = f"${period.rate:.5f}/kWh - {period_type.replace('-', ' ').title()}"
+
+        # Create description with rate components
+        description_parts = [f"Rate: ${period.rate:.5f}/kWh"]
+        description_parts.append(f"Season: {period.season or 'unknown'}")
+        description_parts.append(f"Type: {period_type}")
+
+        if period.rate_components:
+            description_parts.append("\nRate Components:")
+            for component in period.rate_components:
+                for name, value in component.items():
+                    try:
+                        description_parts.append(f"  {name}: ${float(value):.5f}")
+                    except (ValueError, TypeError):
+                        description_parts.append(f"  {name}: {value}")
+
+        return CalendarEvent(
+            start=period.start,
+            end=period.end,
+            summary=summary,
+            description="\n".join(description_parts),
+        )
 
     async def async_added_to_hass(self):
         """When entity is added to hass."""
         self.async_on_remove(
-            self._coord.async_add_listener(self.async_write_ha_state)
+            self._domain_coord.async_add_listener(self.async_write_ha_state)
         )
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._coord.last_update_success
+        return self._domain_coord.last_update_success
 
 
 class EnphaseExportPriceCalendar(CalendarEntity):
@@ -419,9 +300,12 @@ class EnphaseExportPriceCalendar(CalendarEntity):
     def __init__(self, coord: EnphaseCoordinator, entry: ConfigEntry):
         """Initialize the calendar."""
         self._coord = coord
+        # Subscribe to the monetary domain coordinator only
+        self._domain_coord = coord.domain_coordinator("monetary")
         self._entry = entry
         self._attr_unique_id = f"{DOMAIN}_monetary_{coord.site_id}_export_price_calendar"
         self._attr_name = "Export Price Calendar"
+        self._prefetch_task = None
 
     @property
     def device_info(self):
@@ -460,22 +344,12 @@ class EnphaseExportPriceCalendar(CalendarEntity):
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
-        # Fetch export tariff data for each day in the range
+        tariffs = await self._coord.async_get_export_tariffs(start_date.date(), end_date.date())
+        # Someone is browsing the calendar: warm the rest of this week too
+        self._async_prefetch_week()
         events = []
-        current_date = start_date.date()
-        end = end_date.date()
-
-        while current_date <= end:
-            date_str = current_date.strftime("%Y-%m-%d")
-            try:
-                tariff_data = await self._coord.client.export_tariff(date_str)
-                day_events = self._create_events_for_day(current_date, tariff_data, hass)
-                events.extend(day_events)
-            except Exception:
-                pass  # Skip days with errors
-
-            current_date = current_date + timedelta(days=1)
-
+        for day, tariff_data in sorted(tariffs.items()):
+            events.extend(self._create_events_for_day(day, tariff_data, hass))
         return sorted(events, key=lambda e: e.start)
 
     def _get_events_sync(self, start_date: datetime, end_date: datetime) -> list[CalendarEvent]:
@@ -548,10 +422,29 @@ class EnphaseExportPriceCalendar(CalendarEntity):
     async def async_added_to_hass(self):
         """When entity is added to hass."""
         self.async_on_remove(
-            self._coord.async_add_listener(self.async_write_ha_state)
+            self._domain_coord.async_add_listener(self._handle_domain_update)
+        )
+        self._async_prefetch_week()
+
+    @callback
+    def _handle_domain_update(self) -> None:
+        self.async_write_ha_state()
+
+    @callback
+    def _async_prefetch_week(self) -> None:
+        """Warm this week's export tariffs in the background (at most one at a time).
+
+        Runs when the entity is added and on calendar range requests, not on
+        every monetary poll; days still cached are not fetched again.
+        """
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            return
+        self._prefetch_task = self.hass.async_create_background_task(
+            self._coord.async_prefetch_export_week(),
+            f"{DOMAIN}_export_tariff_prefetch_{self._coord.site_id}",
         )
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._coord.last_update_success
+        return self._domain_coord.last_update_success
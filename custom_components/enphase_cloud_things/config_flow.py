@@ -34,7 +34,11 @@ from .const import (
     CONF_SITE_NAME,
     CONF_TOKEN_EXPIRES_AT,
     CONF_VPP_PROGRAM_ID,
+    DEFAULT_RATE_LIMIT_RPM,
+    DEFAULT_RECONCILE_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SUMMARY_CACHE_TTL,
+    DEFAULT_VPP_RATE_LIMIT_RPM,
     DOMAIN,
     OPT_API_TIMEOUT,
     OPT_ENABLE_MONETARY_DEVICE,
@@ -42,7 +46,12 @@ from .const import (
     OPT_FAST_POLL_INTERVAL,
     OPT_FAST_WHILE_STREAMING,
     OPT_NOMINAL_VOLTAGE,
+    OPT_RATE_LIMIT_RPM,
+    OPT_RECONCILE_TIMEOUT,
+    OPT_REQUEST_TRACING,
     OPT_SLOW_POLL_INTERVAL,
+    OPT_SUMMARY_CACHE_TTL,
+    OPT_VPP_RATE_LIMIT_RPM,
 )
 
 
@@ -217,6 +226,7 @@ class EnphaseEVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if self._reconfigure_entry:
             self._abort_if_unique_id_mismatch(reason="wrong_account")
+            self._invalidate_entry_caches(self._reconfigure_entry)
             merged = dict(self._reconfigure_entry.data)
             for key, value in data.items():
                 if value is None:
@@ -276,6 +286,13 @@ class EnphaseEVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return str(self._reconfigure_entry.data.get(CONF_VPP_PROGRAM_ID, ""))
         return ""
 
+    def _invalidate_entry_caches(self, entry: ConfigEntry) -> None:
+        """Drop cached charger metadata so the reloaded entry refetches it."""
+        entry_data = self.hass.data.get(DOMAIN, {}).get(getattr(entry, "entry_id", None))
+        coord = entry_data.get("coordinator") if isinstance(entry_data, dict) else None
+        if coord is not None:
+            coord.invalidate_summary_cache()
+
     def _get_reconfigure_entry(self) -> ConfigEntry | None:
         if hasattr(super(), "_get_reconfigure_entry"):
             try:
@@ -393,6 +410,26 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     OPT_NOMINAL_VOLTAGE,
                     default=self._entry.options.get(OPT_NOMINAL_VOLTAGE, 240),
                 ): int,
+                vol.Optional(
+                    OPT_SUMMARY_CACHE_TTL,
+                    default=self._entry.options.get(OPT_SUMMARY_CACHE_TTL, DEFAULT_SUMMARY_CACHE_TTL),
+                ): int,
+                vol.Optional(
+                    OPT_RECONCILE_TIMEOUT,
+                    default=self._entry.options.get(OPT_RECONCILE_TIMEOUT, DEFAULT_RECONCILE_TIMEOUT),
+                ): int,
+                vol.Optional(
+                    OPT_RATE_LIMIT_RPM,
+                    default=self._entry.options.get(OPT_RATE_LIMIT_RPM, DEFAULT_RATE_LIMIT_RPM),
+                ): int,
+                vol.Optional(
+                    OPT_VPP_RATE_LIMIT_RPM,
+                    default=self._entry.options.get(OPT_VPP_RATE_LIMIT_RPM, DEFAULT_VPP_RATE_LIMIT_RPM),
+                ): int,
+                vol.Optional(
+                    OPT_REQUEST_TRACING,
+                    default=self._entry.options.get(OPT_REQUEST_TRACING, False),
+                ): bool,
                 vol.Optional(
                     OPT_ENABLE_MONETARY_DEVICE,
                     default=self._entry.options.get(OPT_ENABLE_MONETARY_DEVICE, True),
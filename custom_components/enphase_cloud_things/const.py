@@ -23,11 +23,78 @@ OPT_FAST_WHILE_STREAMING = "fast_while_streaming"
 OPT_NOMINAL_VOLTAGE = "nominal_voltage"
 OPT_ENABLE_MONETARY_DEVICE = "enable_monetary_device"
 OPT_ENABLE_VPP_DEVICE = "enable_vpp_device"
+OPT_SUMMARY_CACHE_TTL = "summary_cache_ttl"
+OPT_RATE_LIMIT_RPM = "rate_limit_rpm"
+OPT_VPP_RATE_LIMIT_RPM = "vpp_rate_limit_rpm"
+OPT_REQUEST_TRACING = "request_tracing"
+OPT_RECONCILE_TIMEOUT = "reconcile_timeout"
 
 BASE_URL = "https://enlighten.enphaseenergy.com"
 ENTREZ_URL = "https://entrez.enphaseenergy.com"
 LOGIN_URL = f"{BASE_URL}/login/login.json"
+VPP_HOST = "gs.enphaseenergy.com"
 DEFAULT_AUTH_TIMEOUT = 15
 DEFAULT_API_TIMEOUT = 15
 OPT_API_TIMEOUT = "api_timeout"
 DEFAULT_NOMINAL_VOLTAGE = 240
+# Charger metadata (summary v2) rarely changes; reuse it for this many seconds
+DEFAULT_SUMMARY_CACHE_TTL = 600
+# Upper bound on concurrent optional endpoint requests issued per poll
+MAX_CONCURRENT_FETCHES = 4
+# Wall-clock budget (seconds) per endpoint call at the default API timeout;
+# budgets scale with the configured timeout and overruns are cancelled
+ENDPOINT_BUDGETS = {
+    "status": 5,
+    "summary": 10,
+    "charge_mode": 5,
+    "savings": 20,
+    "import_tariff": 20,
+    "export_tariff": 20,
+    "vpp": 20,
+}
+# Hard deadline for one coordinator poll at the default API timeout,
+# including auth refresh retries; scales like ENDPOINT_BUDGETS
+POLL_DEADLINE = 25
+# Scheduler charge-mode cache lifetime; jitter staggers expiry across chargers
+CHARGE_MODE_CACHE_TTL = 300
+CHARGE_MODE_CACHE_JITTER = 60
+# Refresh requests arriving within this window (seconds) share one poll
+REFRESH_COALESCE_WINDOW = 1.0
+# Storage schema version for persisted start/stop endpoint variants
+VARIANT_STORE_VERSION = 1
+# Renew credentials this many seconds before the access token expires
+TOKEN_REFRESH_LEAD = 300
+# Delay before retrying a failed proactive token refresh
+TOKEN_REFRESH_RETRY = 60
+# Tokens renewed within this many seconds are reused instead of logging in again
+AUTH_REUSE_WINDOW = 30
+# Requests per minute shared by all sites of an account, per API host
+DEFAULT_RATE_LIMIT_RPM = 60
+DEFAULT_VPP_RATE_LIMIT_RPM = 20
+# Circuit breaker per endpoint family: consecutive failures before opening,
+# and the first/maximum wait (seconds) before a half-open probe
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_PROBE_BASE = 30
+BREAKER_PROBE_MAX = 1800
+# Poll backoff per error class: first delay (seconds) and the cap it grows to
+BACKOFF_BASE = {"rate_limit": 5, "server": 10, "http": 10, "network": 5}
+BACKOFF_MAX = 900
+# Dedicated HTTP connection pool for the Enlighten hosts
+HTTP_MAX_CONNECTIONS = 16
+HTTP_MAX_CONNECTIONS_PER_HOST = 4
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 60
+# Seconds an optimistic command result is kept before the polled state wins
+DEFAULT_RECONCILE_TIMEOUT = 45
+# Export tariff day cache behind the export price calendar: days kept,
+# expiry (seconds) for today/future and past dates, and parallel day fetches
+EXPORT_TARIFF_CACHE_SIZE = 62
+EXPORT_TARIFF_TTL = 3600
+EXPORT_TARIFF_PAST_TTL = 7 * 24 * 3600
+EXPORT_TARIFF_FETCH_CONCURRENCY = 4
+# VPP events are polled for this window around today (days); older or later
+# ranges are fetched when the calendar asks for them
+VPP_WINDOW_PAST_DAYS = 7
+VPP_WINDOW_FUTURE_DAYS = 30
+# Events older than the polled window are kept this long for the calendar
+VPP_EVENT_RETENTION_DAYS = 90
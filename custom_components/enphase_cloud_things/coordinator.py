@@ -4,18 +4,30 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 import time
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import weakref
+from dataclasses import dataclass, field, fields, replace
+from datetime import UTC, date, datetime, timedelta
 from datetime import timezone as _tz
+from urllib.parse import urlsplit
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+import async_timeout
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import issue_registry as ir
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.aiohttp_client import (
+    SERVER_SOFTWARE,
+    async_get_clientsession,
+)
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
+from homeassistant.util import ssl as ssl_util
 
 from .api import (
     AuthTokens,
@@ -23,10 +35,24 @@ from .api import (
     EnlightenAuthMFARequired,
     EnlightenAuthUnavailable,
     EnphaseEVClient,
+    RequestRateLimiter,
+    RequestTracer,
     Unauthorized,
+    _decode_jwt_exp,
     async_authenticate,
+    parse_retry_after,
+    request_budget,
 )
 from .const import (
+    AUTH_REUSE_WINDOW,
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    BASE_URL,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_PROBE_BASE,
+    BREAKER_PROBE_MAX,
+    CHARGE_MODE_CACHE_JITTER,
+    CHARGE_MODE_CACHE_TTL,
     CONF_ACCESS_TOKEN,
     CONF_COOKIE,
     CONF_EAUTH,
@@ -41,31 +67,538 @@ from .const import (
     CONF_TOKEN_EXPIRES_AT,
     CONF_VPP_PROGRAM_ID,
     DEFAULT_API_TIMEOUT,
+    DEFAULT_RATE_LIMIT_RPM,
+    DEFAULT_RECONCILE_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SUMMARY_CACHE_TTL,
+    DEFAULT_VPP_RATE_LIMIT_RPM,
     DOMAIN,
+    ENDPOINT_BUDGETS,
+    EXPORT_TARIFF_CACHE_SIZE,
+    EXPORT_TARIFF_FETCH_CONCURRENCY,
+    EXPORT_TARIFF_PAST_TTL,
+    EXPORT_TARIFF_TTL,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    MAX_CONCURRENT_FETCHES,
     OPT_API_TIMEOUT,
+    OPT_ENABLE_MONETARY_DEVICE,
+    OPT_ENABLE_VPP_DEVICE,
     OPT_FAST_POLL_INTERVAL,
     OPT_FAST_WHILE_STREAMING,
     OPT_NOMINAL_VOLTAGE,
+    OPT_RATE_LIMIT_RPM,
+    OPT_RECONCILE_TIMEOUT,
+    OPT_REQUEST_TRACING,
     OPT_SLOW_POLL_INTERVAL,
+    OPT_SUMMARY_CACHE_TTL,
+    OPT_VPP_RATE_LIMIT_RPM,
+    POLL_DEADLINE,
+    REFRESH_COALESCE_WINDOW,
+    TOKEN_REFRESH_LEAD,
+    TOKEN_REFRESH_RETRY,
+    VARIANT_STORE_VERSION,
+    VPP_EVENT_RETENTION_DAYS,
+    VPP_HOST,
+    VPP_WINDOW_FUTURE_DAYS,
+    VPP_WINDOW_PAST_DAYS,
 )
+from .tariff import CompiledTariff, ExportTariffCache
+from .vpp import VPPEventIndex, VPPEventStore
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChargerState:
+    """Immutable per-charger snapshot built once per poll.
+
+    Status fields come from the status endpoint, metadata from summary v2 and
+    session fields are derived by the coordinator. Read-only mapping access
+    (``state["key"]``, ``state.get("key")``, ``"key" in state``) is kept for
+    diagnostics and older callers; a key counts as present when it is set.
+    """
+
     sn: str
-    name: str | None
-    connected: bool
-    plugged: bool
-    charging: bool
-    faulted: bool
-    connector_status: str | None
-    session_kwh: float | None
-    session_start: int | None
-
-class EnphaseCoordinator(DataUpdateCoordinator[dict]):
-    def __init__(self, hass: HomeAssistant, config, config_entry=None):
+    # Status
+    name: str | None = None
+    display_name: str | None = None
+    connected: bool | None = None
+    plugged: bool | None = None
+    charging: bool | None = None
+    faulted: bool | None = None
+    commissioned: bool | None = None
+    connector_status: str | None = None
+    connector_reason: str | None = None
+    last_reported_at: str | None = None
+    schedule_status: str | None = None
+    schedule_type: str | None = None
+    schedule_start: str | None = None
+    schedule_end: str | None = None
+    charge_mode: str | None = None
+    charge_mode_pref: str | None = None
+    charging_level: int | None = None
+    operating_v: int | None = None
+    # Session (derived)
+    session_kwh: float | None = None
+    session_miles: float | None = None
+    session_start: int | None = None
+    session_end: int | None = None
+    session_plug_in_at: int | str | None = None
+    session_plug_out_at: int | str | None = None
+    # Summary v2 metadata
+    max_current: int | None = None
+    min_amp: int | None = None
+    max_amp: int | None = None
+    phase_mode: str | None = None
+    status: str | None = None
+    connection: str | None = None
+    ip_address: str | None = None
+    reporting_interval: int | None = None
+    dlb_enabled: bool | None = None
+    lifetime_kwh: float | None = None
+    sw_version: str | None = None
+    hw_version: str | None = None
+    model_id: str | None = None
+    model_name: str | None = None
+    part_number: str | None = None
+    kernel_version: str | None = None
+    bootloader_version: str | None = None
+
+    @classmethod
+    def from_mapping(cls, sn: str, values) -> ChargerState:
+        """Build a snapshot from a mapping, ignoring unknown keys."""
+        if isinstance(values, cls):
+            return values
+        known = {k: v for k, v in (values or {}).items() if k in CHARGER_FIELDS and k != "sn"}
+        return cls(sn=str(sn), **known)
+
+    def as_dict(self) -> dict:
+        return {key: getattr(self, key) for key in CHARGER_FIELDS_ORDER if getattr(self, key) is not None}
+
+    def get(self, key: str, default=None):
+        if key not in CHARGER_FIELDS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str):
+        if key not in CHARGER_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in CHARGER_FIELDS and getattr(self, key) is not None  # type: ignore[arg-type]
+
+
+CHARGER_FIELDS_ORDER = tuple(f.name for f in fields(ChargerState))
+CHARGER_FIELDS = frozenset(CHARGER_FIELDS_ORDER)
+
+
+@dataclass
+class RefreshSchedule:
+    """Refresh cadence for one optional data domain.
+
+    ``interval`` is the normal refresh period, ``max_stale`` how long the last
+    good payload may be served while refreshes keep failing, and ``jitter`` a
+    random spread added to each due time so domains do not fire together.
+    ``key`` ties a payload to something like the local date; a new key makes
+    the domain due immediately and marks the old payload as stale.
+    """
+
+    interval: float
+    max_stale: float
+    jitter: float = 0.0
+    retry: float = 60.0
+    next_due: float = 0.0
+    last_success: float | None = None
+    key: str | None = None
+    attempt_key: str | None = None
+
+    def is_due(self, now: float, key: str | None = None) -> bool:
+        return key != self.attempt_key or now >= self.next_due
+
+    def is_stale(self, now: float, key: str | None = None) -> bool:
+        if self.last_success is None:
+            return False
+        return key != self.key or now - self.last_success > self.max_stale
+
+    def age(self, now: float) -> float | None:
+        if self.last_success is None:
+            return None
+        return max(0.0, now - self.last_success)
+
+    def mark_success(self, now: float, key: str | None = None) -> None:
+        self.last_success = now
+        self.key = self.attempt_key = key
+        self.next_due = now + self.interval + random.uniform(0, self.jitter)
+
+    def mark_failure(self, now: float, key: str | None = None) -> None:
+        self.attempt_key = key
+        self.next_due = now + min(self.retry, self.interval)
+
+    def invalidate(self) -> None:
+        self.last_success = None
+        self.next_due = 0.0
+
+
+class CircuitOpenError(UpdateFailed):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+
+@dataclass
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one endpoint family.
+
+    After ``threshold`` consecutive failures the breaker opens and calls are
+    skipped until ``next_probe``; then a single half-open probe decides
+    whether to close again or reopen with a doubled probe interval.
+    """
+
+    threshold: int = BREAKER_FAILURE_THRESHOLD
+    probe_base: float = BREAKER_PROBE_BASE
+    probe_max: float = BREAKER_PROBE_MAX
+    state: str = "closed"
+    failures: int = 0
+    probe_interval: float = BREAKER_PROBE_BASE
+    next_probe: float = 0.0
+    opened_count: int = 0
+    last_error: str | None = None
+
+    def allow(self, now: float) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open" and now >= self.next_probe:
+            self.state = "half_open"
+            return True
+        # Open and waiting, or a half-open probe is already in flight
+        return False
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+        self.probe_interval = self.probe_base
+
+    def record_failure(self, now: float, err: Exception | None = None) -> bool:
+        """Count a failure; returns True when this failure opened the breaker."""
+        self.failures += 1
+        self.last_error = repr(err) if err is not None else None
+        if self.state == "half_open":
+            self.probe_interval = min(self.probe_interval * 2, self.probe_max)
+        elif self.state == "closed" and self.failures >= self.threshold:
+            self.probe_interval = self.probe_base
+            self.opened_count += 1
+        else:
+            return False
+        opened = self.state == "closed"
+        self.state = "open"
+        self.next_probe = now + self.probe_interval
+        return opened
+
+    def as_dict(self, now: float) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened_count": self.opened_count,
+            "probe_interval_s": self.probe_interval,
+            "next_probe_in_s": round(max(0.0, self.next_probe - now), 1) if self.state == "open" else None,
+            "last_error": self.last_error,
+        }
+
+
+@dataclass
+class BackoffPolicy:
+    """Decorrelated-jitter backoff tracked per error class.
+
+    Each consecutive failure of a class draws the next delay uniformly from
+    ``[base, previous * 3]``, capped at ``cap``; a Retry-After from the server
+    is a lower bound. Success decays the state (halving the count and the
+    last delay) rather than resetting it, so a flapping endpoint keeps some
+    backoff.
+    """
+
+    bases: dict[str, float] = field(default_factory=lambda: dict(BACKOFF_BASE))
+    cap: float = BACKOFF_MAX
+    failures: dict[str, int] = field(default_factory=dict)
+    last_delay: dict[str, float] = field(default_factory=dict)
+    last_class: str | None = None
+    last_retry_after: float | None = None
+
+    def next_delay(self, error_class: str, retry_after: float | None = None) -> float:
+        base = float(self.bases.get(error_class, 10))
+        previous = self.last_delay.get(error_class, base)
+        delay = min(self.cap, random.uniform(base, max(base, previous * 3)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        self.failures[error_class] = self.failures.get(error_class, 0) + 1
+        self.last_delay[error_class] = delay
+        self.last_class = error_class
+        self.last_retry_after = retry_after
+        return delay
+
+    def record_success(self) -> None:
+        for error_class in list(self.failures):
+            base = float(self.bases.get(error_class, 10))
+            self.failures[error_class] //= 2
+            self.last_delay[error_class] = self.last_delay.get(error_class, base) / 2
+            if not self.failures[error_class] or self.last_delay[error_class] <= base:
+                self.failures.pop(error_class, None)
+                self.last_delay.pop(error_class, None)
+
+    def as_dict(self) -> dict:
+        return {
+            "failures": dict(self.failures),
+            "last_delay_s": {k: round(v, 1) for k, v in self.last_delay.items()},
+            "last_class": self.last_class,
+            "last_retry_after_s": self.last_retry_after,
+        }
+
+
+# Endpoint families guarded by a circuit breaker
+BREAKER_ENDPOINTS = ("status", "summary", "charge_mode", "vpp", "savings", "import_tariff", "export_tariff")
+
+# Default cadences for the optional domains (seconds): interval, staleness budget, jitter.
+# Tariffs change at most daily and VPP schedules roughly hourly, so only
+# client.status() follows the fast/slow poll interval.
+_DOMAIN_SCHEDULES: dict[str, tuple[float, float, float]] = {
+    "savings": (900, 3 * 3600, 60),
+    "import_tariff": (6 * 3600, 48 * 3600, 300),
+    "export_tariff": (3600, 24 * 3600, 120),
+    "vpp": (900, 6 * 3600, 60),
+}
+# Coordinator attribute that holds each domain's last good payload
+_DOMAIN_ATTRS = {
+    "savings": "savings_data",
+    "import_tariff": "import_tariff_data",
+    "export_tariff": "export_tariff_data",
+    "vpp": "vpp_events_data",
+}
+# Summary v2 metadata (max amps, firmware, voltage) stays usable for a day
+SUMMARY_MAX_STALE = 24 * 3600
+def _freeze(value):
+    """Hashable, order-independent form of a snapshot value."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def snapshot_hash(snapshot) -> int:
+    """Structural hash of one charger snapshot, used to skip unchanged updates."""
+    return hash(_freeze(snapshot))
+
+
+# Sub-coordinators and the domains they poll; each ticks every
+# DOMAIN_POLL_INTERVAL and the per-domain schedules decide what is fetched.
+# Summary v2 is not a group: no entity listens to it, and HA only reschedules
+# coordinators with listeners, so the status poll refreshes it when due.
+_DOMAIN_GROUPS: dict[str, tuple[str, ...]] = {
+    "monetary": ("savings", "import_tariff", "export_tariff"),
+    "vpp": ("vpp",),
+}
+DOMAIN_POLL_INTERVAL = 300
+
+
+class EnlightenAccountAuth:
+    """Single-flight Enlighten login shared by every config entry of one account.
+
+    Concurrent refresh requests share one ``async_authenticate`` call and the
+    resulting tokens are pushed to each registered coordinator.
+    """
+
+    def __init__(self, hass: HomeAssistant, email: str) -> None:
+        self.hass = hass
+        self.email = email
+        self.tokens: AuthTokens | None = None
+        self.logins = 0
+        self._refreshed_at: float | None = None
+        self._inflight: asyncio.Future | None = None
+        # Access tokens replaced by the most recent login
+        self._superseded: set[str] = set()
+        self._coordinators: weakref.WeakSet[EnphaseCoordinator] = weakref.WeakSet()
+
+    def register(self, coord: EnphaseCoordinator) -> None:
+        self._coordinators.add(coord)
+
+    async def async_refresh(self, password: str, stale_token: str | None = None) -> AuthTokens | None:
+        """Return fresh tokens, logging in only if nobody else already has."""
+        # A request that failed with a token this manager already replaced, or
+        # one racing a login that just finished, reuses the fresh tokens
+        if self.tokens is not None and (
+            stale_token in self._superseded
+            or (
+                self._refreshed_at is not None
+                and time.monotonic() - self._refreshed_at < AUTH_REUSE_WINDOW
+            )
+        ):
+            return self.tokens
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._async_login(password, stale_token))
+        return await asyncio.shield(self._inflight)
+
+    async def _async_login(self, password: str, stale_token: str | None) -> AuthTokens | None:
+        try:
+            session = async_get_clientsession(self.hass)
+            self.logins += 1
+            try:
+                tokens, _ = await async_authenticate(session, self.email, password)
+            except EnlightenAuthInvalidCredentials:
+                _LOGGER.warning("Stored Enlighten credentials were rejected; reauthenticate via the integration options")
+                return None
+            except EnlightenAuthMFARequired:
+                _LOGGER.warning("Enphase account requires multi-factor authentication; complete MFA in the browser and reauthenticate")
+                return None
+            except EnlightenAuthUnavailable:
+                _LOGGER.debug("Auth service unavailable while refreshing tokens; will retry later")
+                return None
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Unexpected error refreshing Enlighten auth: %s", err)
+                return None
+            previous = self.tokens.access_token if self.tokens else None
+            self._superseded = {t for t in (stale_token, previous) if t and t != tokens.access_token}
+            self.tokens = tokens
+            self._refreshed_at = time.monotonic()
+            for coord in list(self._coordinators):
+                try:
+                    coord._apply_tokens(tokens)
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.debug("Failed to push renewed credentials to site %s: %s", coord.site_id, err)
+            return tokens
+        finally:
+            self._inflight = None
+
+
+@callback
+def async_get_account_auth(hass: HomeAssistant, email: str) -> EnlightenAccountAuth:
+    """Return the auth manager for an Enlighten account, creating it once."""
+    accounts = hass.data.setdefault(DOMAIN, {}).setdefault("_accounts", {})
+    key = email.strip().lower()
+    if key not in accounts:
+        accounts[key] = EnlightenAccountAuth(hass, email)
+    return accounts[key]
+
+
+@callback
+def async_get_enphase_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the integration's own HTTP session for the Enlighten API hosts.
+
+    A keep-alive tuned connector with per-host limits and a DNS cache keeps
+    Enlighten traffic off Home Assistant's shared pool; the shared default
+    SSL context lets TLS sessions be resumed. Cookies are sent explicitly by
+    each client, so the session keeps no cookie jar of its own and sites of
+    different accounts cannot leak cookies into each other. Logins still use
+    the shared Home Assistant session, which they rely on for its cookie jar.
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    session = data.get("_session")
+    if session is not None and not session.closed:
+        return session
+
+    stats = data["_session_stats"] = {
+        "connections_created": 0,
+        "connections_reused": 0,
+        "dns_cache_hits": 0,
+        "dns_cache_misses": 0,
+    }
+
+    def _counter(key):
+        async def _count(_session, _ctx, _params):
+            stats[key] += 1
+
+        return _count
+
+    tracer = async_get_request_tracer(hass)
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_create_end.append(_counter("connections_created"))
+    trace.on_connection_reuseconn.append(_counter("connections_reused"))
+    trace.on_dns_cache_hit.append(_counter("dns_cache_hits"))
+    trace.on_dns_cache_miss.append(_counter("dns_cache_misses"))
+
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_MAX_CONNECTIONS,
+        limit_per_host=HTTP_MAX_CONNECTIONS_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        ssl=ssl_util.get_default_context(),
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        headers={
+            "Accept": "application/json, text/plain, */*",
+            "Referer": f"{BASE_URL}/",
+            "User-Agent": SERVER_SOFTWARE,
+        },
+        trace_configs=[trace, tracer.trace_config()],
+    )
+    data["_session"] = session
+
+    async def _async_close(_event) -> None:
+        await async_close_enphase_session(hass)
+
+    bus = getattr(hass, "bus", None)
+    if bus is not None:
+        bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return session
+
+
+@callback
+def async_get_request_tracer(hass: HomeAssistant) -> RequestTracer:
+    """Return the opt-in request timing tracer attached to the dedicated session."""
+    data = hass.data.setdefault(DOMAIN, {})
+    tracer = data.get("_tracer")
+    if tracer is None:
+        tracer = data["_tracer"] = RequestTracer()
+    return tracer
+
+
+@callback
+def async_update_request_tracing(hass: HomeAssistant) -> None:
+    """Enable the shared request tracer only while a loaded entry opts in."""
+    async_get_request_tracer(hass).enabled = any(
+        bool(getattr(v["coordinator"].config_entry, "options", {}).get(OPT_REQUEST_TRACING, False))
+        for v in hass.data.get(DOMAIN, {}).values()
+        if isinstance(v, dict) and "coordinator" in v
+    )
+
+
+async def async_close_enphase_session(hass: HomeAssistant) -> None:
+    """Close the integration's HTTP session (last entry unloaded or shutdown)."""
+    session = hass.data.get(DOMAIN, {}).pop("_session", None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def enphase_session_stats(hass: HomeAssistant) -> dict:
+    """Connection reuse counters of the integration's HTTP session."""
+    data = hass.data.get(DOMAIN, {})
+    stats = dict(data.get("_session_stats") or {})
+    if not stats:
+        return {"dedicated_session": False}
+    opened = stats["connections_created"] + stats["connections_reused"]
+    stats["reuse_ratio"] = round(stats["connections_reused"] / opened, 3) if opened else None
+    stats["dedicated_session"] = data.get("_session") is not None
+    return stats
+
+
+@callback
+def async_get_rate_limiter(hass: HomeAssistant, account: str) -> RequestRateLimiter:
+    """Return the request limiter shared by every site of an account."""
+    limiters = hass.data.setdefault(DOMAIN, {}).setdefault("_rate_limiters", {})
+    key = account.strip().lower()
+    if key not in limiters:
+        limiters[key] = RequestRateLimiter(default_rpm=DEFAULT_RATE_LIMIT_RPM)
+    return limiters[key]
+
+
+class EnphaseCoordinator(DataUpdateCoordinator[dict[str, ChargerState]]):
+    def __init__(self, hass: HomeAssistant, config, config_entry=None, session: aiohttp.ClientSession | None = None):
         self.hass = hass
         self.config_entry = config_entry
         self.site_id = str(config[CONF_SITE_ID])
@@ -93,14 +626,24 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
             if config_entry
             else DEFAULT_API_TIMEOUT
         )
+        # Endpoint budgets and the poll deadline scale with this option
+        self._api_timeout = timeout
+        # Request budget per host, shared with other sites of the same account;
+        # this site's rate limit options are applied by apply_options()
+        self.rate_limiter = async_get_rate_limiter(hass, self._email or f"site:{self.site_id}")
+        # Deepest limiter queue seen during the last poll interval
+        self.rate_limiter.take_peak_queue_depth(self.site_id)
+        self.rate_limit_queue_peak = 0
         self.client = EnphaseEVClient(
-            async_get_clientsession(hass),
+            session or async_get_clientsession(hass),
             self.site_id,
             self._tokens.access_token,
             self._tokens.cookie,
             timeout=timeout,
+            limiter=self.rate_limiter,
         )
-        self._refresh_lock = asyncio.Lock()
+        # Bound how many optional endpoint requests run at once per poll
+        self._fetch_sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
         # Nominal voltage for estimated power when API omits power; user-configurable
         self._nominal_v = 240
         if config_entry is not None:
@@ -121,32 +664,77 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         self.last_set_amps: dict[str, int] = {}
         self.last_success_utc = None
         self.latency_ms: int | None = None
+        # Last observed duration and budget overrun count per endpoint
+        self.endpoint_ms: dict[str, int] = {}
+        self.endpoint_timeouts: dict[str, int] = {}
+        self.last_timeout_endpoint: str | None = None
+        self._breakers: dict[str, CircuitBreaker] = {name: CircuitBreaker() for name in BREAKER_ENDPOINTS}
         self._unauth_errors = 0
         self._rate_limit_hits = 0
         self._backoff_until: float | None = None
+        self.backoff = BackoffPolicy()
         self._last_error: str | None = None
         self._streaming: bool = False
         # Per-serial operating voltage learned from summary v2; used for power estimation
         self._operating_v: dict[str, int] = {}
         # Temporary fast polling window after user actions (start/stop/etc.)
         self._fast_until: float | None = None
+        # Summary v2 cache shared by the voltage preload and enrichment steps
+        self._summary_cache: list[dict] | None = None
+        self._summary_lock = asyncio.Lock()
+        # Set from the options by apply_options()
+        self._summary_ttl = DEFAULT_SUMMARY_CACHE_TTL
+        # Optimistic command results awaiting confirmation: sn -> field -> (value, deadline)
+        self._optimistic: dict[str, dict[str, tuple[object, float]]] = {}
+        self._reconcile_timeout = DEFAULT_RECONCILE_TIMEOUT
+        # Independent refresh cadence per optional data domain
+        self._schedules: dict[str, RefreshSchedule] = {
+            name: RefreshSchedule(interval=interval, max_stale=max_stale, jitter=jitter)
+            for name, (interval, max_stale, jitter) in _DOMAIN_SCHEDULES.items()
+        }
+        self._schedules["summary"] = RefreshSchedule(
+            interval=self._summary_ttl, max_stale=max(self._summary_ttl, SUMMARY_MAX_STALE), jitter=30
+        )
         # Cache charge mode results to avoid extra API calls every poll
+        # (mode, monotonic expiry); lookups in flight are shared per serial
         self._charge_mode_cache: dict[str, tuple[str, float]] = {}
+        self._charge_mode_inflight: dict[str, asyncio.Future] = {}
+        # Persisted start/stop endpoint variants for this site (see async_restore_variants)
+        self._variant_store: Store | None = None
+        self._variant_data: dict[str, dict[str, int]] = {}
+        # Background credential renewal ahead of token expiry
+        self._token_refresh_unsub = None
+        self.token_refresh_at: datetime | None = None
+        if self._can_auto_refresh():
+            async_get_account_auth(hass, self._email).register(self)
         # Track charging transitions and a fixed session end timestamp so
         # session duration does not grow after charging stops
         self._last_charging: dict[str, bool] = {}
         self._session_end_fix: dict[str, int] = {}
-        # Store VPP events data
+        # Store VPP events data and its time index
         self.vpp_events_data: dict | None = None
+        self._vpp_index: VPPEventIndex | None = None
+        self._vpp_store = VPPEventStore()
         # Store savings data (imported/exported USD)
         self.savings_data: dict | None = None
-        # Store import tariff data
+        # Store import tariff data and its compiled lookup
         self.import_tariff_data: dict | None = None
-        # Store export tariff data
+        self._import_tariff: CompiledTariff | None = None
+        # Store export tariff data; other days are cached for the calendar
         self.export_tariff_data: dict | None = None
+        self.export_tariff_cache = ExportTariffCache(
+            EXPORT_TARIFF_CACHE_SIZE, EXPORT_TARIFF_TTL, EXPORT_TARIFF_PAST_TTL
+        )
+        self._export_tariff_inflight: dict[date, asyncio.Future] = {}
+        self._export_tariff_sem = asyncio.Semaphore(EXPORT_TARIFF_FETCH_CONCURRENCY)
         super_kwargs = {
             "name": DOMAIN,
             "update_interval": timedelta(seconds=interval),
+            # Refresh requests within the window (e.g. several chargers stopped
+            # together) share one poll run at the end of it
+            "request_refresh_debouncer": Debouncer(
+                hass, _LOGGER, cooldown=REFRESH_COALESCE_WINDOW, immediate=False
+            ),
         }
         if config_entry is not None:
             super_kwargs["config_entry"] = config_entry
@@ -168,35 +756,191 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         # Ensure config_entry is stored after super().__init__ in case older
         # cores overwrite the attribute with None.
         self.config_entry = config_entry
+        self.apply_options()
+        # Optional domains poll on their own coordinators so slow tariff/VPP
+        # calls never delay charger status
+        self.domain_coordinators: dict[str, EnphaseDomainCoordinator] = {}
+        options = config_entry.options if config_entry is not None else {}
+        for group, domains in _DOMAIN_GROUPS.items():
+            if group == "vpp" and not (self.vpp_program_id and options.get(OPT_ENABLE_VPP_DEVICE, True)):
+                continue
+            if group == "monetary" and not options.get(OPT_ENABLE_MONETARY_DEVICE, True):
+                continue
+            self.domain_coordinators[group] = EnphaseDomainCoordinator(self, group, domains, DOMAIN_POLL_INTERVAL)
 
-    async def _async_update_data(self) -> dict:
-        t0 = time.monotonic()
-        # Preload operating voltage and metadata from summary v2.
-        # This is relatively heavy; refresh at startup and then at most every 10 minutes.
-        pre_summary = None
-        now_mono = time.monotonic()
-        if not hasattr(self, "_last_summary_at") or not getattr(self, "_last_summary_at"):
-            do_summary = True
-        else:
-            do_summary = (now_mono - getattr(self, "_last_summary_at")) > 600
-        if do_summary:
+    def apply_options(self) -> None:
+        """Apply the options that take effect without reloading the entry.
+
+        Called at construction and again whenever the entry's options change.
+        """
+        options = self.config_entry.options if self.config_entry is not None else {}
+        limits = (
+            (urlsplit(BASE_URL).hostname, OPT_RATE_LIMIT_RPM, DEFAULT_RATE_LIMIT_RPM),
+            (VPP_HOST, OPT_VPP_RATE_LIMIT_RPM, DEFAULT_VPP_RATE_LIMIT_RPM),
+        )
+        for host, option, default in limits:
             try:
-                pre_summary = await self.client.summary_v2()
-            except Exception:
-                pre_summary = None
-            else:
-                self._last_summary_at = now_mono
-        if pre_summary:
-            for item in pre_summary:
-                try:
-                    sn_pre = str(item.get("serialNumber") or "")
-                    if not sn_pre:
-                        continue
-                    ov = item.get("operatingVoltage")
-                    if ov is not None:
-                        self._operating_v[sn_pre] = int(str(ov))
-                except Exception:
-                    continue
+                rpm = int(options.get(option, default))
+            except (TypeError, ValueError):
+                _LOGGER.debug("Invalid %s option; keeping default", option)
+                rpm = default
+            # Sites of one account share a budget; the strictest setting wins
+            requested = self.rate_limiter.request_rate(self.site_id, host, rpm)
+            if len(set(requested.values())) > 1:
+                _LOGGER.warning(
+                    "Sites of the same Enphase account set different %s values (%s); "
+                    "the shared limit for %s is %s requests per minute",
+                    option,
+                    ", ".join(f"site {site}: {value:g}" for site, value in sorted(requested.items())),
+                    host,
+                    f"{min(requested.values()):g}",
+                )
+        try:
+            self._summary_ttl = int(options.get(OPT_SUMMARY_CACHE_TTL, DEFAULT_SUMMARY_CACHE_TTL))
+        except (TypeError, ValueError):
+            self._summary_ttl = DEFAULT_SUMMARY_CACHE_TTL
+        summary = self._schedules["summary"]
+        summary.interval = self._summary_ttl
+        summary.max_stale = max(self._summary_ttl, SUMMARY_MAX_STALE)
+        if summary.last_success is not None:
+            # A shorter TTL takes effect from the last fetch, not the next one
+            summary.next_due = min(summary.next_due, summary.last_success + summary.interval)
+        # Applies to commands issued from now on; pending values keep their deadline
+        try:
+            self._reconcile_timeout = int(options.get(OPT_RECONCILE_TIMEOUT, DEFAULT_RECONCILE_TIMEOUT))
+        except (TypeError, ValueError):
+            self._reconcile_timeout = DEFAULT_RECONCILE_TIMEOUT
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only listeners whose charger snapshot changed.
+
+        Per-charger entities register with ``context=serial``; they are skipped
+        when that serial's structural hash and set of pending optimistic
+        fields match the last notification, so a poll that confirms or rolls
+        back a pending value still rewrites the entity. Site-level listeners (no context) and charging chargers, whose derived
+        values move with time, are always notified. Everything is notified when
+        availability flips or the local date changes, so date-derived values
+        such as Energy Today reset at midnight even for an idle charger.
+        """
+        data = self.data if isinstance(self.data, dict) else {}
+        optimistic = getattr(self, "_optimistic", None) or {}
+        hashes = {
+            sn: (snapshot_hash(snap), frozenset(optimistic.get(sn, ())))
+            for sn, snap in data.items()
+        }
+        previous = getattr(self, "_notified_hashes", None)
+        availability_changed = self.last_update_success != getattr(self, "_notified_success", None)
+        today = dt_util.now().date()
+        day_changed = today != getattr(self, "_notified_day", None)
+        self._notified_hashes = hashes
+        self._notified_success = self.last_update_success
+        self._notified_day = today
+        if previous is None or availability_changed or day_changed:
+            super().async_update_listeners()
+            return
+        changed = {sn for sn in hashes.keys() | previous.keys() if hashes.get(sn) != previous.get(sn)}
+        changed.update(sn for sn, snap in data.items() if ChargerState.from_mapping(sn, snap).charging)
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    @callback
+    def async_apply_optimistic(self, sn: str, **changes) -> None:
+        """Show the expected result of a command before the cloud reports it.
+
+        The changed fields are written into the charger snapshot and marked
+        pending; status polls confirm them, or roll them back once the
+        reconciliation timeout passes without the cloud agreeing.
+        """
+        sn = str(sn)
+        data = self.data if isinstance(self.data, dict) else None
+        if not data or sn not in data:
+            return
+        deadline = time.monotonic() + getattr(self, "_reconcile_timeout", DEFAULT_RECONCILE_TIMEOUT)
+        pending = self._optimistic.setdefault(sn, {})
+        for key, value in changes.items():
+            pending[key] = (value, deadline)
+        updated = dict(data)
+        updated[sn] = self._overlay(sn, data[sn], changes)
+        self.data = updated
+        self.async_update_listeners()
+
+    def is_pending(self, sn: str, key: str | None = None) -> bool:
+        """Whether an optimistic value for this charger (field) awaits confirmation."""
+        pending = (getattr(self, "_optimistic", None) or {}).get(str(sn)) or {}
+        return bool(pending) if key is None else key in pending
+
+    @staticmethod
+    def _overlay(sn: str, snap, changes: dict):
+        if isinstance(snap, ChargerState):
+            return replace(snap, **changes)
+        merged = dict(snap or {})
+        merged.update(changes)
+        return ChargerState.from_mapping(sn, merged)
+
+    def _reconcile_optimistic(self, data: dict[str, ChargerState]) -> dict[str, ChargerState]:
+        """Confirm, keep or roll back pending optimistic values against a poll."""
+        optimistic = getattr(self, "_optimistic", None)
+        if not optimistic:
+            return data
+        now = time.monotonic()
+        for sn in list(optimistic):
+            pending = optimistic[sn]
+            snap = data.get(sn)
+            if snap is None:
+                optimistic.pop(sn)
+                continue
+            keep = {}
+            for key, (value, deadline) in list(pending.items()):
+                if getattr(snap, key, None) == value:
+                    pending.pop(key)
+                elif now < deadline:
+                    keep[key] = value
+                else:
+                    _LOGGER.debug("Rolling back optimistic %s=%s for %s; cloud still reports %s",
+                                  key, value, sn, getattr(snap, key, None))
+                    pending.pop(key)
+            if keep:
+                data[sn] = self._overlay(sn, snap, keep)
+            if not pending:
+                optimistic.pop(sn)
+        return data
+
+    @property
+    def _timeout_scale(self) -> float:
+        return max(1, getattr(self, "_api_timeout", DEFAULT_API_TIMEOUT)) / DEFAULT_API_TIMEOUT
+
+    def endpoint_budget(self, endpoint: str) -> float:
+        """Wall-clock budget (seconds) for one call to ``endpoint``.
+
+        ENDPOINT_BUDGETS are tuned for the default API timeout and scale with
+        the configured one. Each call gets its own budget, so a status call
+        retried after a token refresh may use two; the poll deadline bounds
+        the total.
+        """
+        return ENDPOINT_BUDGETS.get(endpoint, DEFAULT_API_TIMEOUT) * self._timeout_scale
+
+    @property
+    def poll_deadline(self) -> float:
+        """Deadline (seconds) for one poll, scaled like the endpoint budgets."""
+        return POLL_DEADLINE * self._timeout_scale
+
+    async def _async_update_data(self) -> dict[str, ChargerState]:
+        deadline = self.poll_deadline
+        try:
+            async with async_timeout.timeout(deadline):
+                return self._reconcile_optimistic(await self._async_poll_status())
+        except TimeoutError as err:
+            self._last_error = f"Poll deadline of {deadline:g}s exceeded"
+            raise UpdateFailed(
+                f"Poll exceeded its {deadline:g}s deadline (slowest endpoint: {self.slowest_endpoint})"
+            ) from err
+        finally:
+            self.rate_limit_queue_peak = self.rate_limiter.take_peak_queue_depth(self.site_id)
+
+    async def _async_poll_status(self) -> dict[str, ChargerState]:
+        t0 = time.monotonic()
         # Helper to normalize epoch-like inputs to seconds
         def _sec(v):
             try:
@@ -211,8 +955,21 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         if self._backoff_until and time.monotonic() < self._backoff_until:
             raise UpdateFailed("In backoff due to rate limiting or server errors")
 
+        # Savings, tariffs and VPP events are polled by the domain coordinators.
+        # Summary v2 is refetched here, concurrently with status, whenever its
+        # TTL has run out or a control action invalidated it.
+        optional_fetches = {}
+        if self._summary_cache is None or self._schedules["summary"].is_due(time.monotonic()):
+            optional_fetches["summary"] = lambda: self._async_get_summary()
+        optional = asyncio.gather(
+            *(self._async_bounded_fetch(fetch) for fetch in optional_fetches.values()),
+            return_exceptions=True,
+        )
+
+        status_ok = False
         try:
-            data = await self.client.status()
+            data = await self._async_call("status", lambda: self.client.status())
+            status_ok = True
             self._unauth_errors = 0
             ir.async_delete_issue(self.hass, DOMAIN, "reauth_required")
         except Unauthorized as err:
@@ -221,7 +978,8 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
                 self._unauth_errors = 0
                 ir.async_delete_issue(self.hass, DOMAIN, "reauth_required")
                 try:
-                    data = await self.client.status()
+                    data = await self._async_call("status", lambda: self.client.status())
+                    status_ok = True
                 except Unauthorized as err_refresh:
                     raise ConfigEntryAuthFailed from err_refresh
             else:
@@ -239,18 +997,14 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         except aiohttp.ClientResponseError as err:
             # Respect Retry-After and create a warning issue on repeated 429
             self._last_error = f"HTTP {err.status}"
-            retry_after = err.headers.get("Retry-After") if err.headers else None
-            delay = 0
-            if retry_after:
-                try:
-                    delay = int(retry_after)
-                except Exception:
-                    delay = 0
-            # Exponential backoff base
-            base = 5 if err.status == 429 else 10
-            jitter = 1 + (time.monotonic() % 3)
-            backoff = max(delay, base * jitter)
-            self._backoff_until = time.monotonic() + backoff
+            retry_after = parse_retry_after(err.headers.get("Retry-After") if err.headers else None)
+            if err.status == 429:
+                error_class = "rate_limit"
+            elif err.status >= 500:
+                error_class = "server"
+            else:
+                error_class = "http"
+            self._park(error_class, retry_after)
             if err.status == 429:
                 self._rate_limit_hits += 1
                 if self._rate_limit_hits >= 2:
@@ -264,12 +1018,35 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
                         translation_placeholders={"site_id": str(self.site_id)},
                     )
             raise UpdateFailed(f"Cloud error: {err.status}")
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+        except (aiohttp.ClientError, TimeoutError) as err:
             self._last_error = str(err)
+            self._park("network")
             raise UpdateFailed(f"Error communicating with API: {err}")
         finally:
+            if not status_ok:
+                # Status failed: the poll fails, so drop the in-flight optional fetches
+                optional.cancel()
             self.latency_ms = int((time.monotonic() - t0) * 1000)
 
+        results = dict(zip(optional_fetches, await optional, strict=True))
+
+        # Preload operating voltage from summary v2 before mapping status so
+        # entities see the learned voltage on the same poll.
+        summary = results.get("summary", self._summary_cache)
+        if isinstance(summary, Exception):
+            summary = self._summary_cache
+        if summary:
+            for item in summary:
+                try:
+                    sn_pre = str(item.get("serialNumber") or "")
+                    if not sn_pre:
+                        continue
+                    ov = item.get("operatingVoltage")
+                    if ov is not None:
+                        self._operating_v[sn_pre] = int(str(ov))
+                except Exception:
+                    continue
+
         # Success path: reset counters, record last success
         if self._unauth_errors:
             # Clear any outstanding reauth issues on success
@@ -277,6 +1054,7 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         self._unauth_errors = 0
         self._rate_limit_hits = 0
         self._backoff_until = None
+        self.backoff.record_success()
         self._last_error = None
         self.last_success_utc = dt_util.utcnow()
 
@@ -292,6 +1070,12 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
                 return v.strip().lower() in ("true", "1", "yes", "y")
             return False
 
+        # Resolve scheduler charge modes for every charger concurrently up front
+        wanted = [str(obj.get("sn") or "") for obj in arr]
+        wanted = [sn for sn in dict.fromkeys(wanted) if sn and (not self.serials or sn in self.serials)]
+        modes = await asyncio.gather(*(self._get_charge_mode(sn) for sn in wanted))
+        charge_modes = dict(zip(wanted, modes, strict=True))
+
         for obj in arr:
             sn = str(obj.get("sn") or "")
             if sn and (not self.serials or sn in self.serials):
@@ -337,7 +1121,7 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
                     commissioned_val = obj.get("isCommissioned") or conn0.get("commissioned")
 
                 # Charge mode: fetch from scheduler API (cached); fall back to derived
-                charge_mode_pref = await self._get_charge_mode(sn)
+                charge_mode_pref = charge_modes.get(sn)
                 charge_mode = charge_mode_pref
                 if not charge_mode:
                     charge_mode = (
@@ -425,10 +1209,6 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
                 }
 
         # Enrich with summary v2 data
-        try:
-            summary = await self.client.summary_v2()
-        except Exception:
-            summary = None
         if summary:
             for item in summary:
                 sn = str(item.get("serialNumber") or "")
@@ -557,49 +1337,6 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
                 if item.get("displayName"):
                     cur["display_name"] = str(item.get("displayName"))
 
-        # Fetch VPP events data if program_id is configured
-        if self.vpp_program_id:
-            try:
-                _LOGGER.debug("Fetching VPP events for program_id: %s", self.vpp_program_id)
-                # Fetch events with default parameters (empty strings work fine)
-                vpp_data = await self.client.vpp_events(self.vpp_program_id)
-                self.vpp_events_data = vpp_data
-                _LOGGER.debug("VPP events data stored. Event count: %s",
-                             len(vpp_data.get("data", [])) if isinstance(vpp_data, dict) else "unknown")
-            except Exception as err:
-                _LOGGER.error("Failed to fetch VPP events: %s", err, exc_info=True)
-                # Don't fail the entire update if VPP fetch fails
-                pass
-
-        # Fetch today's savings data (imported/exported USD)
-        try:
-            today = dt_util.now().strftime("%Y-%m-%d")
-            savings_data = await self.client.savings_today(today)
-            self.savings_data = savings_data
-        except Exception as err:
-            _LOGGER.debug("Failed to fetch savings data: %s", err)
-            # Don't fail the entire update if savings fetch fails
-            pass
-
-        # Fetch import tariff data
-        try:
-            import_tariff_data = await self.client.import_tariff()
-            self.import_tariff_data = import_tariff_data
-        except Exception as err:
-            _LOGGER.debug("Failed to fetch import tariff data: %s", err)
-            # Don't fail the entire update if tariff fetch fails
-            pass
-
-        # Fetch export tariff data for today
-        try:
-            today = dt_util.now().strftime("%Y-%m-%d")
-            export_tariff_data = await self.client.export_tariff(today)
-            self.export_tariff_data = export_tariff_data
-        except Exception as err:
-            _LOGGER.debug("Failed to fetch export tariff data: %s", err)
-            # Don't fail the entire update if tariff fetch fails
-            pass
-
         # Dynamic poll rate: fast while any charging, within a fast window, or streaming
         if self.config_entry is not None:
             want_fast = any(v.get("charging") for v in out.values()) if out else False
@@ -630,34 +1367,453 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
                     except Exception:
                         pass
 
+        # Freeze the per-charger working dicts into typed snapshots
+        return {sn: ChargerState.from_mapping(sn, values) for sn, values in out.items()}
+
+    async def _async_refresh_domains(self, domains: tuple[str, ...]) -> dict:
+        """Fetch the due optional domains concurrently and store their payloads.
+
+        A failed fetch keeps the previous payload until it is past the domain's
+        staleness budget. Raises UpdateFailed only when every attempted fetch
+        failed, so one slow or broken endpoint does not mark the others down.
+        """
+        today = dt_util.now().strftime("%Y-%m-%d")
+        domain_keys = {"savings": today, "export_tariff": today}
+        domain_fetches = {
+            "savings": lambda: self._async_call("savings", lambda: self.client.savings_today(today)),
+            "import_tariff": lambda: self._async_call("import_tariff", lambda: self.client.import_tariff()),
+            "export_tariff": lambda: self._async_call("export_tariff", lambda: self.client.export_tariff(today)),
+            "vpp": lambda: self._async_call("vpp", self._async_fetch_vpp_window),
+        }
+        now_mono = time.monotonic()
+        fetches = {
+            name: domain_fetches[name]
+            for name in domains
+            if self._schedules[name].is_due(now_mono, domain_keys.get(name))
+        }
+        values = await asyncio.gather(
+            *(self._async_bounded_fetch(fetch) for fetch in fetches.values()),
+            return_exceptions=True,
+        )
+        results = dict(zip(fetches, values, strict=True))
+
+        now_mono = time.monotonic()
+        errors: list[Exception] = []
+        for name in domains:
+            attr = _DOMAIN_ATTRS[name]
+            schedule = self._schedules[name]
+            key = domain_keys.get(name)
+            if name in results:
+                value = results[name]
+                if isinstance(value, CircuitOpenError):
+                    # Breaker open: keep serving the last good payload
+                    pass
+                elif isinstance(value, Exception):
+                    errors.append(value)
+                    schedule.mark_failure(now_mono, key)
+                    _LOGGER.debug("Failed to fetch %s data: %s", name.replace("_", " "), value)
+                else:
+                    schedule.mark_success(now_mono, key)
+                    setattr(self, attr, value)
+                    if name == "import_tariff":
+                        # Compile once per fetch rather than on first lookup
+                        self.import_tariff  # noqa: B018
+                    elif name == "export_tariff" and value:
+                        self._export_cache().put(dt_util.now().date(), value, now_mono, dt_util.now().date())
+                    elif name == "vpp":
+                        _LOGGER.debug("VPP events data stored. Event count: %s", len(self.vpp_index))
+            if schedule.is_stale(now_mono, key):
+                _LOGGER.debug("Dropping stale %s data", name.replace("_", " "))
+                setattr(self, attr, None)
+                schedule.invalidate()
+
+        if errors and len(errors) == len(results):
+            raise UpdateFailed(f"Error fetching {', '.join(results)}: {errors[0]}")
+        return {name: getattr(self, attr) for name, attr in _DOMAIN_ATTRS.items() if name in domains}
+
+    def domain_coordinator(self, group: str) -> DataUpdateCoordinator:
+        """Coordinator that entities rendering ``group`` should listen to.
+
+        Falls back to this coordinator when the group is not polled separately.
+        """
+        return (getattr(self, "domain_coordinators", None) or {}).get(group) or self
+
+    async def async_refresh_domains(self) -> None:
+        """Run the first refresh of every domain coordinator concurrently."""
+        coords = list((getattr(self, "domain_coordinators", None) or {}).values())
+        if coords:
+            await asyncio.gather(*(c.async_refresh() for c in coords))
+
+    async def _async_get_summary(self) -> list[dict] | None:
+        """Return summary v2 data, fetching only when the cache has expired.
+
+        A failed refresh falls back to the last cached payload so metadata
+        does not disappear during transient cloud errors.
+        """
+        schedule = self._schedules["summary"]
+        async with self._summary_lock:
+            now = time.monotonic()
+            if self._summary_cache is not None and not schedule.is_due(now):
+                return self._summary_cache
+            try:
+                summary = await self._async_call("summary", lambda: self.client.summary_v2())
+            except Exception as err:
+                schedule.mark_failure(now)
+                if self._summary_cache is None or schedule.is_stale(now):
+                    raise
+                _LOGGER.debug("Using cached summary v2 after refresh failed: %s", err)
+                return self._summary_cache
+            self._summary_cache = summary
+            schedule.mark_success(time.monotonic())
+            return summary
+
+    @property
+    def summary_cache_age(self) -> float | None:
+        """Seconds since summary v2 was last fetched, or None if never/invalidated."""
+        schedule = (getattr(self, "_schedules", None) or {}).get("summary")
+        if schedule is None:
+            return None
+        return schedule.age(time.monotonic())
+
+    @property
+    def import_tariff(self) -> CompiledTariff | None:
+        """Compiled import tariff, rebuilt only when a new payload is stored."""
+        data = getattr(self, "import_tariff_data", None)
+        if not data:
+            return None
+        compiled = getattr(self, "_import_tariff", None)
+        if compiled is None or compiled.source is not data:
+            try:
+                compiled = CompiledTariff(data)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Could not compile import tariff: %s", err)
+                return None
+            self._import_tariff = compiled
+        return compiled
+
+    @property
+    def vpp_index(self) -> VPPEventIndex:
+        """Parsed, start-sorted VPP events, rebuilt only when a new payload is stored."""
+        data = getattr(self, "vpp_events_data", None)
+        index = getattr(self, "_vpp_index", None)
+        if index is None or index.source is not data:
+            index = self._vpp_index = VPPEventIndex(data)
+        return index
+
+    def _vpp_events_store(self) -> VPPEventStore:
+        store = getattr(self, "_vpp_store", None)
+        if store is None:
+            store = self._vpp_store = VPPEventStore()
+        return store
+
+    async def _async_fetch_vpp_events(self, start: date, end: date) -> dict:
+        payload = await self.client.vpp_events(
+            self.vpp_program_id,
+            start_date=start.strftime("%Y-%m-%d"),
+            end_date=end.strftime("%Y-%m-%d"),
+        )
+        return self._vpp_events_store().merge(payload, start, end)
+
+    async def _async_fetch_vpp_window(self) -> dict:
+        """Fetch the rolling VPP window and merge it into the event store."""
+        today = dt_util.now().date()
+        self._vpp_events_store().prune(
+            today - timedelta(days=VPP_WINDOW_PAST_DAYS + VPP_EVENT_RETENTION_DAYS)
+        )
+        return await self._async_fetch_vpp_events(
+            today - timedelta(days=VPP_WINDOW_PAST_DAYS),
+            today + timedelta(days=VPP_WINDOW_FUTURE_DAYS),
+        )
+
+    async def async_ensure_vpp_range(self, start: datetime, end: datetime) -> None:
+        """Backfill VPP events for a range outside what has been fetched so far."""
+        if not getattr(self, "vpp_program_id", None):
+            return
+        first, last = start.date(), end.date()
+        if self._vpp_events_store().covers(first, last):
+            return
+        try:
+            self.vpp_events_data = await self._async_call(
+                "vpp", lambda: self._async_fetch_vpp_events(first, last)
+            )
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("VPP events backfill for %s to %s failed: %s", first, last, err)
+
+    def _export_cache(self) -> ExportTariffCache:
+        cache = getattr(self, "export_tariff_cache", None)
+        if cache is None:
+            cache = self.export_tariff_cache = ExportTariffCache(
+                EXPORT_TARIFF_CACHE_SIZE, EXPORT_TARIFF_TTL, EXPORT_TARIFF_PAST_TTL
+            )
+        return cache
+
+    async def async_get_export_tariffs(self, start: date, end: date) -> dict[date, dict]:
+        """Export tariff payloads for each day in ``[start, end]``.
+
+        Cached days are returned directly; missing days are fetched
+        concurrently (bounded) and days that fail are left out.
+        """
+        cache = self._export_cache()
+        now = time.monotonic()
+        out: dict[date, dict] = {}
+        missing: list[date] = []
+        day = start
+        while day <= end:
+            payload = cache.get(day, now)
+            if payload is not None:
+                out[day] = payload
+            else:
+                missing.append(day)
+            day += timedelta(days=1)
+        if missing:
+            results = await asyncio.gather(
+                *(self._async_fetch_export_tariff(day) for day in missing),
+                return_exceptions=True,
+            )
+            for day, result in zip(missing, results, strict=True):
+                if isinstance(result, BaseException):
+                    _LOGGER.debug("Export tariff for %s unavailable: %s", day, result)
+                elif result:
+                    out[day] = result
         return out
 
+    async def _async_fetch_export_tariff(self, day: date) -> dict:
+        """Fetch one day's export tariff, sharing requests already in flight."""
+        inflight = getattr(self, "_export_tariff_inflight", None)
+        if inflight is None:
+            inflight = self._export_tariff_inflight = {}
+        task = inflight.get(day)
+        if task is None:
+            sem = getattr(self, "_export_tariff_sem", None)
+            if sem is None:
+                sem = self._export_tariff_sem = asyncio.Semaphore(EXPORT_TARIFF_FETCH_CONCURRENCY)
+
+            async def _fetch() -> dict:
+                async with sem:
+                    # Same budget, breaker and latency accounting as the poll
+                    payload = await self._async_call(
+                        "export_tariff", lambda: self.client.export_tariff(day.strftime("%Y-%m-%d"))
+                    )
+                if payload:
+                    self._export_cache().put(day, payload, time.monotonic(), dt_util.now().date())
+                return payload
+
+            task = inflight[day] = asyncio.ensure_future(_fetch())
+            task.add_done_callback(lambda _t: inflight.pop(day, None))
+        return await asyncio.shield(task)
+
+    async def async_prefetch_export_week(self) -> None:
+        """Warm the export tariff cache for the current Monday-Sunday week."""
+        today = dt_util.now().date()
+        monday = today - timedelta(days=today.weekday())
+        await self.async_get_export_tariffs(monday, monday + timedelta(days=6))
+
+    def invalidate_summary_cache(self) -> None:
+        """Force the next poll to refetch summary v2 (after control actions/reconfigure)."""
+        schedule = (getattr(self, "_schedules", None) or {}).get("summary")
+        if schedule is not None:
+            schedule.invalidate()
+
+    def refresh_schedule_state(self) -> dict[str, dict]:
+        """Per-domain refresh cadence and freshness, for diagnostics."""
+        now = time.monotonic()
+        state: dict[str, dict] = {}
+        for name, schedule in (getattr(self, "_schedules", None) or {}).items():
+            age = schedule.age(now)
+            state[name] = {
+                "interval_seconds": schedule.interval,
+                "max_stale_seconds": schedule.max_stale,
+                "age_seconds": round(age, 1) if age is not None else None,
+                "next_due_in_seconds": round(max(0.0, schedule.next_due - now), 1),
+            }
+        return state
+
+    async def _async_call(self, endpoint: str, fetch):
+        """Run one endpoint call within its timeout budget and record its duration.
+
+        The budget excludes time spent waiting on the rate limiter; the poll
+        deadline still bounds it.
+
+        Calls to an endpoint whose circuit breaker is open raise
+        CircuitOpenError without touching the network.
+        """
+        budget = self.endpoint_budget(endpoint)
+        breaker = (getattr(self, "_breakers", None) or {}).get(endpoint)
+        t0 = time.monotonic()
+        if breaker is not None and not breaker.allow(t0):
+            raise CircuitOpenError(f"{endpoint} circuit open")
+        try:
+            # Time spent queued on the shared rate limiter does not count
+            async with request_budget(budget):
+                result = await fetch()
+        except Unauthorized:
+            # Credential problems are handled by reauth, not the breaker
+            if breaker is not None and breaker.state == "half_open":
+                breaker.state = "open"
+            raise
+        except Exception as err:
+            if isinstance(err, TimeoutError):
+                self.endpoint_timeouts[endpoint] = self.endpoint_timeouts.get(endpoint, 0) + 1
+                self.last_timeout_endpoint = endpoint
+                _LOGGER.debug("%s request exceeded its %ss budget", endpoint, budget)
+            if breaker is not None and breaker.record_failure(time.monotonic(), err):
+                _LOGGER.warning(
+                    "%s endpoint failed %s times in a row; pausing requests for %ss: %s",
+                    endpoint,
+                    breaker.failures,
+                    int(breaker.probe_interval),
+                    err,
+                )
+            raise
+        finally:
+            self.endpoint_ms[endpoint] = int((time.monotonic() - t0) * 1000)
+        if breaker is not None:
+            if breaker.state != "closed":
+                _LOGGER.info("%s endpoint recovered; resuming requests", endpoint)
+            breaker.record_success()
+        return result
+
+    def _park(self, error_class: str, retry_after: float | None = None) -> None:
+        """Skip polls for the next backoff delay of ``error_class``.
+
+        Once the status breaker is open it owns the cooldown: polls resume at
+        its next probe, which a Retry-After can only push later, instead of
+        also waiting out a backoff delay.
+        """
+        breaker = (getattr(self, "_breakers", None) or {}).get("status")
+        if breaker is not None and breaker.state == "open":
+            if retry_after:
+                breaker.next_probe = max(breaker.next_probe, time.monotonic() + retry_after)
+            self._backoff_until = None
+            return
+        delay = self.backoff.next_delay(error_class, retry_after)
+        self._backoff_until = time.monotonic() + delay
+        _LOGGER.debug(
+            "Backing off %.0fs after %s failure #%s",
+            delay,
+            error_class,
+            self.backoff.failures.get(error_class),
+        )
+
+    @property
+    def backoff_remaining(self) -> float:
+        """Seconds left before polling resumes (0 when not backing off)."""
+        until = getattr(self, "_backoff_until", None)
+        if not until:
+            return 0.0
+        return max(0.0, until - time.monotonic())
+
+    @property
+    def backoff_ends_utc(self) -> datetime | None:
+        remaining = self.backoff_remaining
+        if not remaining:
+            return None
+        return dt_util.utcnow() + timedelta(seconds=remaining)
+
+    def breaker_state(self) -> dict[str, dict]:
+        """Circuit breaker state per endpoint family for diagnostics."""
+        now = time.monotonic()
+        return {name: b.as_dict(now) for name, b in (getattr(self, "_breakers", None) or {}).items()}
+
+    @property
+    def slowest_endpoint(self) -> str | None:
+        """Endpoint with the longest most recent call duration."""
+        timings = getattr(self, "endpoint_ms", None) or {}
+        if not timings:
+            return None
+        return max(timings, key=timings.get)
+
+    async def _async_bounded_fetch(self, fetch):
+        """Run one optional endpoint fetch within the concurrent fan-out limit."""
+        async with self._fetch_sem:
+            return await fetch()
+
     async def _attempt_auto_refresh(self) -> bool:
-        """Attempt to refresh authentication using stored credentials."""
-        if not self._email or not self._remember_password or not self._stored_password:
+        """Attempt to refresh authentication using stored credentials.
+
+        The login itself is owned by the account-wide auth manager, so sites
+        sharing an Enlighten account renew their tokens with a single login.
+        """
+        if not self._can_auto_refresh():
+            return False
+        auth = async_get_account_auth(self.hass, self._email)
+        auth.register(self)
+        tokens = await auth.async_refresh(self._stored_password, self._tokens.access_token)
+        if tokens is None:
             return False
+        # Normally already pushed by the manager; covers late registrations
+        self._apply_tokens(tokens)
+        return True
 
-        async with self._refresh_lock:
-            session = async_get_clientsession(self.hass)
-            try:
-                tokens, _ = await async_authenticate(session, self._email, self._stored_password)
-            except EnlightenAuthInvalidCredentials:
-                _LOGGER.warning("Stored Enlighten credentials were rejected; reauthenticate via the integration options")
-                return False
-            except EnlightenAuthMFARequired:
-                _LOGGER.warning("Enphase account requires multi-factor authentication; complete MFA in the browser and reauthenticate")
-                return False
-            except EnlightenAuthUnavailable:
-                _LOGGER.debug("Auth service unavailable while refreshing tokens; will retry later")
-                return False
-            except Exception as err:  # noqa: BLE001
-                _LOGGER.debug("Unexpected error refreshing Enlighten auth: %s", err)
-                return False
+    @callback
+    def _apply_tokens(self, tokens: AuthTokens) -> None:
+        """Adopt renewed credentials for this entry's client and config entry."""
+        if self._tokens.access_token == tokens.access_token and self._tokens.cookie == tokens.cookie:
+            return
+        self._tokens = tokens
+        self.client.update_credentials(eauth=tokens.access_token, cookie=tokens.cookie)
+        self._persist_tokens(tokens)
+        self.async_schedule_token_refresh()
 
-            self._tokens = tokens
-            self.client.update_credentials(eauth=tokens.access_token, cookie=tokens.cookie)
-            self._persist_tokens(tokens)
-            return True
+    def _can_auto_refresh(self) -> bool:
+        return bool(self._email and self._remember_password and self._stored_password)
+
+    def _token_expiry(self) -> datetime | None:
+        """UTC expiry of the current access token, if known."""
+        exp = self._tokens.token_expires_at
+        if not isinstance(exp, (int, float)) and self._tokens.access_token:
+            exp = _decode_jwt_exp(self._tokens.access_token)
+        if not isinstance(exp, (int, float)):
+            return None
+        return datetime.fromtimestamp(exp, tz=UTC)
+
+    @callback
+    def async_schedule_token_refresh(self, delay: float | None = None) -> None:
+        """Schedule credential renewal shortly before the access token expires.
+
+        Runs off the poll path so the first poll after expiry does not pay for
+        a rejected request, a full login and a retry. Without stored
+        credentials or a known expiry the reactive refresh remains the only path.
+        """
+        self.async_cancel_token_refresh()
+        if not self._can_auto_refresh():
+            return
+        now = dt_util.utcnow()
+        if delay is not None:
+            when = now + timedelta(seconds=delay)
+        else:
+            expiry = self._token_expiry()
+            if expiry is None:
+                return
+            when = max(expiry - timedelta(seconds=TOKEN_REFRESH_LEAD), now)
+        self.token_refresh_at = when
+        self._token_refresh_unsub = async_track_point_in_utc_time(
+            self.hass, self._handle_token_refresh, when
+        )
+
+    @callback
+    def async_cancel_token_refresh(self) -> None:
+        """Cancel a pending proactive credential renewal."""
+        unsub = getattr(self, "_token_refresh_unsub", None)
+        if unsub is not None:
+            unsub()
+        self._token_refresh_unsub = None
+        self.token_refresh_at = None
+
+    @callback
+    def _handle_token_refresh(self, _now: datetime) -> None:
+        self._token_refresh_unsub = None
+        self.hass.async_create_task(self._async_proactive_token_refresh())
+
+    async def _async_proactive_token_refresh(self) -> None:
+        if await self._attempt_auto_refresh():
+            _LOGGER.debug("Renewed Enlighten credentials ahead of expiry")
+            return
+        # Keep retrying until the token actually expires; after that the
+        # reactive refresh on the next poll takes over
+        expiry = self._token_expiry()
+        if expiry is not None and expiry > dt_util.utcnow():
+            self.async_schedule_token_refresh(delay=TOKEN_REFRESH_RETRY)
 
     def _persist_tokens(self, tokens: AuthTokens) -> None:
         if not self.config_entry:
@@ -677,6 +1833,54 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
                 merged[key] = value
         self.hass.config_entries.async_update_entry(self.config_entry, data=merged)
 
+    async def async_restore_variants(self) -> None:
+        """Load the start/stop variants discovered for this site and firmware.
+
+        Call after the first refresh so charger firmware versions are known;
+        later discoveries and invalidations are saved back automatically.
+        Nothing is restored or saved while the firmware is unknown, since the
+        variants could not be tied to the firmware that accepted them.
+        """
+        self._variant_store = Store(self.hass, VARIANT_STORE_VERSION, f"{DOMAIN}.variants_{self.site_id}")
+        self.client.on_variant_change = self._on_variant_change
+        key = self._firmware_key()
+        if key is None:
+            _LOGGER.debug("Charger firmware unknown; not restoring control variants")
+            return
+        try:
+            stored = await self._variant_store.async_load()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Could not load stored control variants: %s", err)
+            stored = None
+        saved = stored.get(key) if isinstance(stored, dict) else None
+        # Only the current firmware's variants are kept; an upgrade starts fresh
+        current = dict(saved) if isinstance(saved, dict) else {}
+        self._variant_data = {key: current}
+        self.client.restore_variants(start=current.get("start"), stop=current.get("stop"))
+
+    def _firmware_key(self) -> str | None:
+        versions = set()
+        for sn, snap in (self.data or {}).items():
+            sw = ChargerState.from_mapping(sn, snap).sw_version
+            if sw:
+                versions.add(str(sw))
+        return "|".join(sorted(versions)) or None
+
+    @callback
+    def _on_variant_change(self, action: str, idx: int | None) -> None:
+        if self._variant_store is None:
+            return
+        key = self._firmware_key()
+        if key is None:
+            return
+        current = dict(self._variant_data.get(key) or {})
+        if idx is None:
+            current.pop(action, None)
+        else:
+            current[action] = idx
+        self._variant_data = {key: current}
+        self._variant_store.async_delay_save(lambda: self._variant_data, 5)
+
     def kick_fast(self, seconds: int = 60) -> None:
         """Force fast polling for a short window after user actions."""
         try:
@@ -689,19 +1893,86 @@ class EnphaseCoordinator(DataUpdateCoordinator[dict]):
         self.last_set_amps[str(sn)] = int(amps)
 
     async def _get_charge_mode(self, sn: str) -> str | None:
-        """Return charge mode using a 300s cache to reduce API calls."""
-        now = time.monotonic()
+        """Return charge mode from cache, sharing one in-flight lookup per serial."""
         cached = self._charge_mode_cache.get(sn)
-        if cached and (now - cached[1] < 300):
+        if cached and time.monotonic() < cached[1]:
             return cached[0]
+        inflight = self._charge_mode_inflight.get(sn)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._async_fetch_charge_mode(sn))
+            self._charge_mode_inflight[sn] = inflight
+
+            def _done(fut, sn=sn):
+                if self._charge_mode_inflight.get(sn) is fut:
+                    self._charge_mode_inflight.pop(sn, None)
+
+            inflight.add_done_callback(_done)
+        # Shield so a cancelled poll does not cancel a lookup others are awaiting
+        return await asyncio.shield(inflight)
+
+    async def _async_fetch_charge_mode(self, sn: str) -> str | None:
         try:
-            mode = await self.client.charge_mode(sn)
+            mode = await self._async_call("charge_mode", lambda: self.client.charge_mode(sn))
+        except CircuitOpenError:
+            # Keep reporting the last known mode while the scheduler is down
+            cached = self._charge_mode_cache.get(sn)
+            return cached[0] if cached else None
         except Exception:
             mode = None
         if mode:
-            self._charge_mode_cache[sn] = (mode, now)
+            self.set_charge_mode_cache(sn, mode)
         return mode
 
     def set_charge_mode_cache(self, sn: str, mode: str) -> None:
-        """Update cache when user changes mode via select."""
-        self._charge_mode_cache[str(sn)] = (str(mode), time.monotonic())
+        """Cache the charge mode reported by the scheduler."""
+        # Jittered lifetime so chargers do not all expire on the same poll
+        ttl = CHARGE_MODE_CACHE_TTL + random.uniform(0, CHARGE_MODE_CACHE_JITTER)
+        self._charge_mode_cache[str(sn)] = (str(mode), time.monotonic() + ttl)
+
+    def invalidate_charge_mode_cache(self, sn: str) -> None:
+        """Force the next poll to ask the scheduler for this charger's mode."""
+        self._charge_mode_cache.pop(str(sn), None)
+        self._charge_mode_inflight.pop(str(sn), None)
+
+
+class EnphaseDomainCoordinator(DataUpdateCoordinator[dict]):
+    """Polls a group of optional domains independently of charger status.
+
+    Payloads are stored on the parent coordinator (``vpp_events_data``,
+    ``savings_data``...) so entities keep reading them there; only listeners
+    and availability come from this coordinator.
+    """
+
+    def __init__(
+        self,
+        parent: EnphaseCoordinator,
+        group: str,
+        domains: tuple[str, ...],
+        interval: float,
+    ) -> None:
+        self.parent = parent
+        self.group = group
+        self.domains = domains
+        super_kwargs = {
+            "name": f"{DOMAIN}_{group}",
+            "update_interval": timedelta(seconds=interval),
+        }
+        if parent.config_entry is not None:
+            super_kwargs["config_entry"] = parent.config_entry
+        try:
+            super().__init__(parent.hass, _LOGGER, **super_kwargs)
+        except TypeError:
+            # Older HA cores do not accept the config_entry kwarg yet
+            super_kwargs.pop("config_entry", None)
+            super().__init__(parent.hass, _LOGGER, **super_kwargs)
+        # Older cores set the attribute to None; keep the parent's entry
+        self.config_entry = parent.config_entry
+
+    async def _async_update_data(self) -> dict:
+        deadline = self.parent.poll_deadline
+        try:
+            async with async_timeout.timeout(deadline):
+                return await self.parent._async_refresh_domains(self.domains)  # noqa: SLF001
+        except TimeoutError as err:
+            # Nothing was stored, so the last good payloads stay in place
+            raise UpdateFailed(f"{self.group} refresh exceeded its {deadline:g}s deadline") from err
@@ -59,11 +59,13 @@ async def async_call_action_from_config(hass: HomeAssistant, config: ConfigType,
         connector_id = int(config.get("connector_id", 1))
         await coord.client.start_charging(sn, level, connector_id)
         coord.set_last_set_amps(sn, level)
+        coord.invalidate_summary_cache()
         await coord.async_request_refresh()
         return
 
     if typ == ACTION_STOP:
         await coord.client.stop_charging(sn)
+        coord.invalidate_summary_cache()
         await coord.async_request_refresh()
         return
 
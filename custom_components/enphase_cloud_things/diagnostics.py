@@ -5,7 +5,9 @@ from typing import Any
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.helpers import device_registry as dr
 
+from .api import JSON_BACKEND
 from .const import DOMAIN
+from .coordinator import async_get_request_tracer, enphase_session_stats
 
 TO_REDACT = [
     "e_auth_token",
@@ -56,11 +58,65 @@ async def async_get_config_entry_diagnostics(hass, entry):
             base_header_names = []
             has_scheduler_bearer = False
 
+        # Summary v2 cache age/TTL so stale charger metadata is easy to spot
+        try:
+            age = coord.summary_cache_age
+            summary_cache = {
+                "age_seconds": round(age, 1) if age is not None else None,
+                "ttl_seconds": coord._summary_ttl,  # noqa: SLF001
+                "cached": coord._summary_cache is not None,  # noqa: SLF001
+            }
+        except Exception:
+            summary_cache = {}
+        try:
+            refresh_schedules = coord.refresh_schedule_state()
+        except Exception:
+            refresh_schedules = {}
+        domain_coordinators = {}
+        for group, sub in (getattr(coord, "domain_coordinators", None) or {}).items():
+            try:
+                domain_coordinators[group] = {
+                    "last_update_success": sub.last_update_success,
+                    "update_interval_seconds": int(sub.update_interval.total_seconds())
+                    if sub.update_interval
+                    else None,
+                    "last_exception": repr(sub.last_exception) if sub.last_exception else None,
+                }
+            except Exception:
+                domain_coordinators[group] = {}
+
         diag["coordinator"] = {
             "site_id": coord.site_id,
             "serials_count": len(getattr(coord, "serials", []) or []),
             "update_interval_seconds": upd,
             "last_scheduler_modes": last_modes,
+            "summary_cache": summary_cache,
+            "refresh_schedules": refresh_schedules,
+            "domain_coordinators": domain_coordinators,
+            "endpoint_ms": dict(getattr(coord, "endpoint_ms", None) or {}),
+            "endpoint_timeouts": dict(getattr(coord, "endpoint_timeouts", None) or {}),
+            "response_cache": dict(getattr(getattr(coord, "client", None), "cache_stats", None) or {}),
+            "response_decode": {
+                "backend": JSON_BACKEND,
+                "endpoints": dict(getattr(getattr(coord, "client", None), "decode_stats", None) or {}),
+            },
+            "backoff": dict(
+                coord.backoff.as_dict(), remaining_s=round(coord.backoff_remaining, 1)
+            )
+            if hasattr(coord, "backoff")
+            else {},
+            "http_session": enphase_session_stats(hass),
+            "request_timings": async_get_request_tracer(hass).stats(),
+            "circuit_breakers": coord.breaker_state() if hasattr(coord, "breaker_state") else {},
+            "rate_limiter": getattr(coord, "rate_limiter", None).stats()
+            if getattr(coord, "rate_limiter", None) is not None
+            else {},
+            "export_tariff_cache": getattr(coord, "export_tariff_cache", None).stats()
+            if getattr(coord, "export_tariff_cache", None) is not None
+            else {},
+            "token_refresh_at": getattr(coord, "token_refresh_at", None).isoformat()
+            if getattr(coord, "token_refresh_at", None)
+            else None,
             "headers_info": {
                 "base_header_names": base_header_names,
                 "has_scheduler_bearer": has_scheduler_bearer,
@@ -89,4 +145,6 @@ async def async_get_device_diagnostics(hass, entry, device):
     except Exception:
         pass
     snapshot = (coord.data or {}).get(sn) if coord else None
+    if hasattr(snapshot, "as_dict"):
+        snapshot = snapshot.as_dict()
     return {"serial": sn, "snapshot": snapshot or {}}
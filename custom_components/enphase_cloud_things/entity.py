@@ -4,7 +4,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import EnphaseCoordinator
+from .coordinator import ChargerState, EnphaseCoordinator
 
 
 class EnphaseBaseEntity(CoordinatorEntity[EnphaseCoordinator]):
@@ -15,16 +15,25 @@ class EnphaseBaseEntity(CoordinatorEntity[EnphaseCoordinator]):
         self._coord = coordinator
         self._sn = serial
 
+    @property
+    def _charger(self) -> ChargerState:
+        """Typed snapshot for this charger (empty when not reported)."""
+        snap = (self._coord.data or {}).get(self._sn)
+        if isinstance(snap, ChargerState):
+            return snap
+        # Plain mappings are accepted for callers that build data by hand
+        return ChargerState.from_mapping(self._sn, snap)
+
     @property
     def available(self) -> bool:  # type: ignore[override]
         return super().available and self._sn in (self._coord.data or {})
 
     @property
     def device_info(self) -> DeviceInfo:
-        d = (self._coord.data or {}).get(self._sn) or {}
-        display_name_raw = d.get("display_name") or d.get("name")
+        d = self._charger
+        display_name_raw = d.display_name or d.name
         display_name = str(display_name_raw) if display_name_raw else None
-        model_name_raw = d.get("model_name")
+        model_name_raw = d.model_name
         model_name = str(model_name_raw) if model_name_raw else None
 
         if display_name:
@@ -52,8 +61,8 @@ class EnphaseBaseEntity(CoordinatorEntity[EnphaseCoordinator]):
         # Optional enrichment when available
         if model_display:
             info_kwargs["model"] = model_display
-        if d.get("hw_version"):
-            info_kwargs["hw_version"] = str(d.get("hw_version"))
-        if d.get("sw_version"):
-            info_kwargs["sw_version"] = str(d.get("sw_version"))
+        if d.hw_version:
+            info_kwargs["hw_version"] = str(d.hw_version)
+        if d.sw_version:
+            info_kwargs["sw_version"] = str(d.sw_version)
         return DeviceInfo(**info_kwargs)
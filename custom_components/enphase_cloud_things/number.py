@@ -30,8 +30,8 @@ class ChargingAmpsNumber(EnphaseBaseEntity, NumberEntity):
 
     @property
     def native_value(self) -> float | None:
-        d = (self._coord.data or {}).get(self._sn) or {}
-        lvl = d.get("charging_level")
+        d = self._charger
+        lvl = d.charging_level
         if lvl is None:
             # If unknown from API and no prior setpoint, prefer 32A default
             return float(int(self._coord.last_set_amps.get(self._sn) or 32))
@@ -42,8 +42,8 @@ class ChargingAmpsNumber(EnphaseBaseEntity, NumberEntity):
 
     @property
     def native_min_value(self) -> float:
-        d = (self._coord.data or {}).get(self._sn) or {}
-        v = d.get("min_amp")
+        d = self._charger
+        v = d.min_amp
         try:
             return float(int(v)) if v is not None else 6.0
         except Exception:
@@ -51,8 +51,8 @@ class ChargingAmpsNumber(EnphaseBaseEntity, NumberEntity):
 
     @property
     def native_max_value(self) -> float:
-        d = (self._coord.data or {}).get(self._sn) or {}
-        v = d.get("max_amp")
+        d = self._charger
+        v = d.max_amp
         try:
             return float(int(v)) if v is not None else 40.0
         except Exception:
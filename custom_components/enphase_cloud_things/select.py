@@ -42,9 +42,9 @@ class ChargeModeSelect(EnphaseBaseEntity, SelectEntity):
 
     @property
     def current_option(self) -> str | None:
-        d = (self._coord.data or {}).get(self._sn) or {}
+        d = self._charger
         # Prefer scheduler-reported charge mode when available
-        val = d.get("charge_mode_pref") or d.get("charge_mode")
+        val = d.charge_mode_pref or d.charge_mode
         if not val:
             return None
         return LABELS.get(str(val), str(val).title())
@@ -52,6 +52,9 @@ class ChargeModeSelect(EnphaseBaseEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         mode = REV_LABELS.get(option, option.upper())
         await self._coord.client.set_charge_mode(self._sn, mode)
-        # Update cache immediately to reflect in UI, then refresh
-        self._coord.set_charge_mode_cache(self._sn, mode)
+        # Show the new mode until the scheduler confirms it or it rolls back;
+        # the cached mode is dropped so the next poll asks the scheduler
+        self._coord.invalidate_charge_mode_cache(self._sn)
+        self._coord.async_apply_optimistic(self._sn, charge_mode_pref=mode)
+        self._coord.invalidate_summary_cache()
         await self._coord.async_request_refresh()
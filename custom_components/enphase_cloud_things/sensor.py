@@ -1,14 +1,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from homeassistant.components.sensor import RestoreSensor, SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfPower, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
@@ -25,6 +26,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     # Site-level diagnostic sensors
     entities.append(EnphaseSiteLastUpdateSensor(coord))
     entities.append(EnphaseCloudLatencySensor(coord))
+    entities.append(EnphaseRateLimitQueueSensor(coord))
+    entities.append(EnphaseRateLimitWaitSensor(coord))
+    entities.append(EnphaseBackoffUntilSensor(coord))
     # VPP sensors if program_id is configured - now in VPP device
     enable_vpp = entry.options.get(OPT_ENABLE_VPP_DEVICE, True)
     if coord.vpp_program_id and enable_vpp:
@@ -73,8 +77,8 @@ class _BaseEVSensor(EnphaseBaseEntity, SensorEntity):
 
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        return d.get(self._key)
+        d = self._charger
+        return getattr(d, self._key)
 
 class EnphaseEnergyTodaySensor(EnphaseBaseEntity, SensorEntity, RestoreEntity):
     _attr_has_entity_name = True
@@ -125,8 +129,8 @@ class EnphaseEnergyTodaySensor(EnphaseBaseEntity, SensorEntity, RestoreEntity):
 
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        total = d.get("lifetime_kwh")
+        d = self._charger
+        total = d.lifetime_kwh
         if total is None:
             return None
         try:
@@ -157,8 +161,8 @@ class EnphaseConnectorStatusSensor(_BaseEVSensor):
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
     @property
     def icon(self) -> str | None:
-        d = (self._coord.data or {}).get(self._sn) or {}
-        v = str(d.get("connector_status") or "").upper()
+        d = self._charger
+        v = str(d.connector_status or "").upper()
         # Map common connector status values to clearer icons
         mapping = {
             "AVAILABLE": "mdi:ev-station",
@@ -363,9 +367,9 @@ class EnphasePowerSensor(EnphaseBaseEntity, SensorEntity, RestoreEntity):
 
     @property
     def native_value(self):
-        data = (self._coord.data or {}).get(self._sn) or {}
-        lifetime = self._as_float(data.get("lifetime_kwh"))
-        sample_ts = self._parse_timestamp(data.get("last_reported_at"))
+        data = self._charger
+        lifetime = self._as_float(data.lifetime_kwh)
+        sample_ts = self._parse_timestamp(data.last_reported_at)
         if sample_ts is None:
             now_dt = dt_util.now()
             if now_dt.tzinfo is None:
@@ -374,7 +378,7 @@ class EnphasePowerSensor(EnphaseBaseEntity, SensorEntity, RestoreEntity):
         self._last_sample_ts = sample_ts
 
         if lifetime is None:
-            if not bool(data.get("charging")):
+            if not bool(data.charging):
                 self._last_power_w = 0
                 self._last_method = "idle"
             return self._last_power_w
@@ -389,7 +393,7 @@ class EnphasePowerSensor(EnphaseBaseEntity, SensorEntity, RestoreEntity):
 
         delta_kwh = lifetime - self._last_lifetime_kwh
         if delta_kwh <= self._MIN_DELTA_KWH:
-            if not bool(data.get("charging")):
+            if not bool(data.charging):
                 self._last_power_w = 0
                 self._last_method = "idle"
             return self._last_power_w
@@ -414,7 +418,7 @@ class EnphasePowerSensor(EnphaseBaseEntity, SensorEntity, RestoreEntity):
 
     @property
     def extra_state_attributes(self):
-        data = (self._coord.data or {}).get(self._sn) or {}
+        data = self._charger
         return {
             "last_lifetime_kwh": self._last_lifetime_kwh,
             "last_energy_ts": self._last_energy_ts,
@@ -422,8 +426,8 @@ class EnphasePowerSensor(EnphaseBaseEntity, SensorEntity, RestoreEntity):
             "last_power_w": self._last_power_w,
             "last_window_seconds": self._last_window_s,
             "method": self._last_method,
-            "charging": bool(data.get("charging")),
-            "operating_v": data.get("operating_v") or 230,
+            "charging": bool(data.charging),
+            "operating_v": data.operating_v or 230,
             "max_throughput_w": self._MAX_WATTS,
         }
 
@@ -441,8 +445,8 @@ class EnphaseChargingLevelSensor(EnphaseBaseEntity, SensorEntity):
 
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        lvl = d.get("charging_level")
+        d = self._charger
+        lvl = d.charging_level
         if lvl is None:
             # Fall back to last set amps; if unknown, prefer 32A default
             return int(self._coord.last_set_amps.get(self._sn) or 32)
@@ -463,8 +467,8 @@ class EnphaseSessionDurationSensor(EnphaseBaseEntity, SensorEntity):
 
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        start = d.get("session_start")
+        d = self._charger
+        start = d.session_start
         if not start:
             return 0
         try:
@@ -473,8 +477,8 @@ class EnphaseSessionDurationSensor(EnphaseBaseEntity, SensorEntity):
             return 0
         # Prefer a fixed end recorded by coordinator after stop; else if charging,
         # compute duration to now; otherwise return 0
-        end = d.get("session_end")
-        charging = bool(d.get("charging"))
+        end = d.session_end
+        charging = bool(d.charging)
         if isinstance(end, (int, float)):
             end_i = int(end)
         elif charging:
@@ -499,8 +503,8 @@ class EnphaseLastReportedSensor(EnphaseBaseEntity, SensorEntity):
     @property
     def native_value(self):
         from datetime import datetime, timezone
-        d = (self._coord.data or {}).get(self._sn) or {}
-        s = d.get("last_reported_at")
+        d = self._charger
+        s = d.last_reported_at
         if not s:
             return None
         # Example: 2025-09-07T11:38:31Z[UTC]
@@ -522,9 +526,9 @@ class EnphaseChargeModeSensor(EnphaseBaseEntity, SensorEntity):
 
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
+        d = self._charger
         # Prefer scheduler preference when available for consistency with selector
-        return d.get("charge_mode_pref") or d.get("charge_mode")
+        return d.charge_mode_pref or d.charge_mode
     @property
     def icon(self) -> str | None:
         # Map charge modes to friendly icons
@@ -571,8 +575,8 @@ class EnphaseLifetimeEnergySensor(EnphaseBaseEntity, RestoreSensor):
 
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        raw = d.get("lifetime_kwh")
+        d = self._charger
+        raw = d.lifetime_kwh
         # Parse and validate
         val: float | None
         try:
@@ -615,8 +619,8 @@ class EnphaseMaxCurrentSensor(EnphaseBaseEntity, SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{sn}_max_current"
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        return d.get("max_current")
+        d = self._charger
+        return d.max_current
 
 class EnphaseMinAmpSensor(EnphaseBaseEntity, SensorEntity):
     _attr_has_entity_name = True
@@ -630,8 +634,8 @@ class EnphaseMinAmpSensor(EnphaseBaseEntity, SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{sn}_min_amp"
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        return d.get("min_amp")
+        d = self._charger
+        return d.min_amp
 
 class EnphaseMaxAmpSensor(EnphaseBaseEntity, SensorEntity):
     _attr_has_entity_name = True
@@ -645,8 +649,8 @@ class EnphaseMaxAmpSensor(EnphaseBaseEntity, SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{sn}_max_amp"
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        return d.get("max_amp")
+        d = self._charger
+        return d.max_amp
 
 class EnphasePhaseModeSensor(EnphaseBaseEntity, SensorEntity):
     _attr_has_entity_name = True
@@ -657,8 +661,8 @@ class EnphasePhaseModeSensor(EnphaseBaseEntity, SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{sn}_phase_mode"
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        v = d.get("phase_mode")
+        d = self._charger
+        v = d.phase_mode
         if v is None:
             return None
         # Map numeric phase indicators to friendly text
@@ -682,8 +686,8 @@ class EnphaseStatusSensor(EnphaseBaseEntity, SensorEntity):
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
     @property
     def native_value(self):
-        d = (self._coord.data or {}).get(self._sn) or {}
-        return d.get("status")
+        d = self._charger
+        return d.status
 
 
 ## Removed duplicate Current Amps sensor to avoid confusion with Set Amps
@@ -705,8 +709,8 @@ class _TimestampFromIsoSensor(EnphaseBaseEntity, SensorEntity):
     @property
     def native_value(self):
         from datetime import datetime, timezone
-        d = (self._coord.data or {}).get(self._sn) or {}
-        s = d.get(self._key)
+        d = self._charger
+        s = getattr(d, self._key)
         if not s:
             return None
         s = str(s).replace("[UTC]", "").replace("Z", "")
@@ -736,8 +740,8 @@ class _TimestampFromEpochSensor(EnphaseBaseEntity, SensorEntity):
     @property
     def native_value(self):
         from datetime import datetime, timezone
-        d = (self._coord.data or {}).get(self._sn) or {}
-        ts = d.get(self._key)
+        d = self._charger
+        ts = getattr(d, self._key)
         if ts is None:
             return None
         try:
@@ -782,7 +786,8 @@ class _MonetaryBaseEntity(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
 
     def __init__(self, coord: EnphaseCoordinator, entry: ConfigEntry, key: str, name: str):
-        super().__init__(coord)
+        # Listen to the monetary domain coordinator; payloads still live on coord
+        super().__init__(coord.domain_coordinator("monetary"))
         self._coord = coord
         self._entry = entry
         self._key = key
@@ -802,11 +807,70 @@ class _MonetaryBaseEntity(CoordinatorEntity, SensorEntity):
         )
 
 
+class _TariffRateEntity(_MonetaryBaseEntity):
+    """Rate sensor that updates at tariff boundaries rather than on every poll."""
+
+    def __init__(self, coord: EnphaseCoordinator, entry: ConfigEntry, key: str, name: str):
+        super().__init__(coord, entry, key, name)
+        self._boundary_unsub = None
+        self._written: tuple | None = None
+
+    def _next_boundary(self, now: datetime) -> datetime | None:
+        """Return when the current rate may next change; None updates on polls only."""
+        return None
+
+    def _fingerprint(self) -> tuple:
+        return (self.available, self.native_value, repr(self.extra_state_attributes))
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._cancel_boundary)
+        self._written = self._fingerprint()
+        self._schedule_boundary()
+
+    @callback
+    def _cancel_boundary(self) -> None:
+        if self._boundary_unsub is not None:
+            self._boundary_unsub()
+            self._boundary_unsub = None
+
+    @callback
+    def _schedule_boundary(self) -> None:
+        self._cancel_boundary()
+        try:
+            boundary = self._next_boundary(dt_util.now())
+        except Exception:  # noqa: BLE001
+            boundary = None
+        if boundary is not None:
+            self._boundary_unsub = async_track_point_in_time(self.hass, self._handle_boundary, boundary)
+
+    @callback
+    def _handle_boundary(self, _now: datetime) -> None:
+        self._boundary_unsub = None
+        self._async_write_if_changed()
+        self._schedule_boundary()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Polls only matter when they change the rate, attributes or availability
+        self._async_write_if_changed()
+        self._schedule_boundary()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        fingerprint = self._fingerprint()
+        if fingerprint == self._written:
+            return
+        self._written = fingerprint
+        self.async_write_ha_state()
+
+
 class _VPPBaseEntity(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
 
     def __init__(self, coord: EnphaseCoordinator, entry: ConfigEntry, key: str, name: str):
-        super().__init__(coord)
+        # Listen to the vpp domain coordinator; payloads still live on coord
+        super().__init__(coord.domain_coordinator("vpp"))
         self._coord = coord
         self._entry = entry
         self._key = key
@@ -852,6 +916,77 @@ class EnphaseCloudLatencySensor(_SiteBaseEntity):
     def native_value(self):
         return self._coord.latency_ms
 
+    @property
+    def extra_state_attributes(self):
+        # Which endpoint consumed the poll budget, and which ones overran theirs
+        return {
+            "slowest_endpoint": self._coord.slowest_endpoint,
+            "endpoint_ms": dict(getattr(self._coord, "endpoint_ms", None) or {}),
+            "endpoint_timeouts": dict(getattr(self._coord, "endpoint_timeouts", None) or {}),
+            "last_timeout_endpoint": getattr(self._coord, "last_timeout_endpoint", None),
+        }
+
+
+class EnphaseRateLimitQueueSensor(_SiteBaseEntity):
+    _attr_translation_key = "rate_limit_queue"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coord: EnphaseCoordinator):
+        super().__init__(coord, "rate_limit_queue", "Rate Limit Queue Peak")
+
+    @property
+    def native_value(self):
+        # Peak since the previous poll; the live queue is almost always empty
+        return getattr(self._coord, "rate_limit_queue_peak", None)
+
+    @property
+    def extra_state_attributes(self):
+        # Per-host budget, queued requests and wait times (shared by the account)
+        limiter = getattr(self._coord, "rate_limiter", None)
+        return {"hosts": limiter.stats()} if limiter is not None else {}
+
+
+class EnphaseRateLimitWaitSensor(_SiteBaseEntity):
+    _attr_translation_key = "rate_limit_wait"
+    _attr_native_unit_of_measurement = "ms"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coord: EnphaseCoordinator):
+        super().__init__(coord, "rate_limit_wait_ms", "Rate Limit Wait")
+
+    @property
+    def native_value(self):
+        limiter = getattr(self._coord, "rate_limiter", None)
+        return limiter.last_wait_ms if limiter is not None else None
+
+
+class EnphaseBackoffUntilSensor(_SiteBaseEntity):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_translation_key = "backoff_until"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coord: EnphaseCoordinator):
+        super().__init__(coord, "backoff_until", "Backoff Until")
+
+    @property
+    def available(self) -> bool:
+        # Most useful exactly while polls are failing
+        return True
+
+    @property
+    def native_value(self):
+        return self._coord.backoff_ends_utc
+
+    @property
+    def extra_state_attributes(self):
+        policy = getattr(self._coord, "backoff", None)
+        attrs = {"remaining_s": round(self._coord.backoff_remaining, 1)}
+        if policy is not None:
+            attrs.update(policy.as_dict())
+        return attrs
+
 
 class EnphaseVPPEventsSensor(_VPPBaseEntity):
     _attr_translation_key = "vpp_events"
@@ -865,13 +1000,7 @@ class EnphaseVPPEventsSensor(_VPPBaseEntity):
         """Return the count of VPP events."""
         if not self._coord.vpp_events_data:
             return 0
-
-        response = self._coord.vpp_events_data
-        if isinstance(response, dict):
-            events = response.get("data", [])
-            if isinstance(events, list):
-                return len(events)
-        return 0
+        return len(self._coord.vpp_index)
 
     @property
     def extra_state_attributes(self):
@@ -879,48 +1008,33 @@ class EnphaseVPPEventsSensor(_VPPBaseEntity):
         if not self._coord.vpp_events_data:
             return {}
 
+        index = self._coord.vpp_index
         attrs = {}
-        response = self._coord.vpp_events_data
-        if isinstance(response, dict):
-            # Add metadata from response
-            meta = response.get("meta", {})
-            if meta.get("serverTimeStamp"):
-                attrs["timestamp"] = meta["serverTimeStamp"]
-            if meta.get("rowCount") is not None:
-                attrs["row_count"] = meta["rowCount"]
-
-            # Get events array
-            events = response.get("data", [])
-            if isinstance(events, list):
-                attrs["total_events"] = len(events)
-                attrs["program_id"] = self._coord.vpp_program_id
-
-                # Add summary of event statuses
-                statuses = {}
-                types = {}
-                for event in events:
-                    status = event.get("status", "unknown")
-                    event_type = event.get("type", "unknown")
-                    statuses[status] = statuses.get(status, 0) + 1
-                    types[event_type] = types.get(event_type, 0) + 1
-
-                attrs["status_summary"] = statuses
-                attrs["type_summary"] = types
-
-                # Include the most recent events (up to 5) with key details
-                recent_events = []
-                for event in events[:5]:
-                    recent_events.append({
-                        "id": event.get("id"),
-                        "name": event.get("name"),
-                        "type": event.get("type"),
-                        "status": event.get("status"),
-                        "start_time": event.get("start_time"),
-                        "end_time": event.get("end_time"),
-                        "avg_kw_discharged": event.get("avg_kw_discharged"),
-                        "avg_kw_charged": event.get("avg_kw_charged"),
-                    })
-                attrs["recent_events"] = recent_events
+        # Add metadata from response
+        if index.meta.get("serverTimeStamp"):
+            attrs["timestamp"] = index.meta["serverTimeStamp"]
+        if index.meta.get("rowCount") is not None:
+            attrs["row_count"] = index.meta["rowCount"]
+
+        attrs["total_events"] = len(index)
+        attrs["program_id"] = self._coord.vpp_program_id
+        attrs["status_summary"] = dict(index.status_counts)
+        attrs["type_summary"] = dict(index.type_counts)
+
+        # Include the most recent events (up to 5) with key details
+        recent_events = []
+        for event in index.raw[:5]:
+            recent_events.append({
+                "id": event.get("id"),
+                "name": event.get("name"),
+                "type": event.get("type"),
+                "status": event.get("status"),
+                "start_time": event.get("start_time"),
+                "end_time": event.get("end_time"),
+                "avg_kw_discharged": event.get("avg_kw_discharged"),
+                "avg_kw_charged": event.get("avg_kw_charged"),
+            })
+        attrs["recent_events"] = recent_events
 
         return attrs
 
@@ -935,7 +1049,7 @@ class EnphaseVPPEventsTodayCountSensor(_VPPBaseEntity):
 
     @property
     def native_value(self):
-        """Return the count of VPP events today."""
+        """Return the count of VPP events starting or ending today."""
         if not self._coord.vpp_events_data:
             return 0
 
@@ -943,33 +1057,11 @@ class EnphaseVPPEventsTodayCountSensor(_VPPBaseEntity):
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-        events = self._coord.vpp_events_data.get("data", [])
-        count = 0
-
-        for event in events:
-            start_time_str = event.get("start_time")
-            end_time_str = event.get("end_time")
-
-            if start_time_str or end_time_str:
-                try:
-                    # Parse timestamps
-                    from datetime import datetime
-                    if start_time_str:
-                        start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                        # Event starts today
-                        if today_start <= start_dt <= today_end:
-                            count += 1
-                            continue
-
-                    if end_time_str:
-                        end_dt = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-                        # Event ends today (and we didn't already count it)
-                        if today_start <= end_dt <= today_end:
-                            count += 1
-                except Exception:
-                    continue
-
-        return count
+        return sum(
+            1
+            for event in self._coord.vpp_index.overlapping(today_start, today_end)
+            if today_start <= event.start <= today_end or today_start <= event.end <= today_end
+        )
 
 
 class EnphaseVPPNextEventStartSensor(_VPPBaseEntity):
@@ -984,30 +1076,8 @@ class EnphaseVPPNextEventStartSensor(_VPPBaseEntity):
         """Return the start timestamp of the next VPP event."""
         if not self._coord.vpp_events_data:
             return None
-
-        now = dt_util.now()
-        events = self._coord.vpp_events_data.get("data", [])
-        next_event = None
-        next_start = None
-
-        for event in events:
-            start_time_str = event.get("start_time")
-            if not start_time_str:
-                continue
-
-            try:
-                from datetime import datetime
-                start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-
-                # Only consider future events
-                if start_dt > now:
-                    if next_start is None or start_dt < next_start:
-                        next_start = start_dt
-                        next_event = event
-            except Exception:
-                continue
-
-        return next_start
+        event = self._coord.vpp_index.next_event(dt_util.now())
+        return event.start if event is not None else None
 
 
 class EnphaseVPPNextEventTypeSensor(_VPPBaseEntity):
@@ -1021,31 +1091,9 @@ class EnphaseVPPNextEventTypeSensor(_VPPBaseEntity):
         """Return the event type of the next VPP event."""
         if not self._coord.vpp_events_data:
             return "None"
-
-        now = dt_util.now()
-        events = self._coord.vpp_events_data.get("data", [])
-        next_event = None
-        next_start = None
-
-        for event in events:
-            start_time_str = event.get("start_time")
-            if not start_time_str:
-                continue
-
-            try:
-                from datetime import datetime
-                start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-
-                # Only consider future events
-                if start_dt > now:
-                    if next_start is None or start_dt < next_start:
-                        next_start = start_dt
-                        next_event = event
-            except Exception:
-                continue
-
-        if next_event:
-            return next_event.get("type", "None")
+        event = self._coord.vpp_index.next_event(dt_util.now())
+        if event is not None:
+            return event.raw.get("type", "None")
         return "None"
 
 
@@ -1062,27 +1110,7 @@ class EnphaseVPPFutureEventsCountSensor(_VPPBaseEntity):
         """Return the count of all future VPP events."""
         if not self._coord.vpp_events_data:
             return 0
-
-        now = dt_util.now()
-        events = self._coord.vpp_events_data.get("data", [])
-        count = 0
-
-        for event in events:
-            start_time_str = event.get("start_time")
-            if not start_time_str:
-                continue
-
-            try:
-                from datetime import datetime
-                start_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-
-                # Count future events
-                if start_dt > now:
-                    count += 1
-            except Exception:
-                continue
-
-        return count
+        return self._coord.vpp_index.future_count(dt_util.now())
 
 
 class EnphaseSavingsImportedTodaySensor(_MonetaryBaseEntity):
@@ -1195,7 +1223,7 @@ class EnphaseSavingsExportedTodaySensor(_MonetaryBaseEntity):
         return attrs
 
 
-class EnphaseImportCostNowSensor(_MonetaryBaseEntity):
+class EnphaseImportCostNowSensor(_TariffRateEntity):
     _attr_translation_key = "import_cost_now"
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_native_unit_of_measurement = "USD/kWh"
@@ -1207,133 +1235,26 @@ class EnphaseImportCostNowSensor(_MonetaryBaseEntity):
     @property
     def native_value(self):
         """Return current import cost rate."""
-        if not self._coord.import_tariff_data:
+        tariff = self._coord.import_tariff
+        if tariff is None:
             return None
-
-        # Get current time and date info
-        now = dt_util.now()
-        current_month = now.month
-        current_day_of_week = now.weekday() + 1  # Monday=1, Sunday=7
-        minutes_from_midnight = now.hour * 60 + now.minute
-
-        tariff_data = self._coord.import_tariff_data
-        purchase = tariff_data.get("purchase", {})
-        seasons = purchase.get("seasons", [])
-
-        # Find the matching season
-        for season in seasons:
-            start_month = int(season.get("startMonth", 0))
-            end_month = int(season.get("endMonth", 0))
-
-            # Handle season wrap-around (e.g., Oct-May means 10-12 and 1-5)
-            in_season = False
-            if start_month <= end_month:
-                in_season = start_month <= current_month <= end_month
-            else:  # Wraps around year end
-                in_season = current_month >= start_month or current_month <= end_month
-
-            if not in_season:
-                continue
-
-            # Find the matching day
-            for day_group in season.get("days", []):
-                if current_day_of_week in day_group.get("days", []):
-                    # Find the matching period
-                    periods = day_group.get("periods", [])
-                    for period in periods:
-                        start_time_str = period.get("startTime", "")
-                        end_time_str = period.get("endTime", "")
-
-                        # Empty start/end means off-peak (all day)
-                        if not start_time_str and not end_time_str:
-                            rate = period.get("rate")
-                            if rate is not None:
-                                try:
-                                    return round(float(rate), 5)
-                                except (ValueError, TypeError):
-                                    pass
-                            continue
-
-                        # Parse time ranges
-                        try:
-                            start_time = int(start_time_str) if start_time_str else 0
-                            end_time = int(end_time_str) if end_time_str else 1440
-
-                            if start_time <= minutes_from_midnight < end_time:
-                                rate = period.get("rate")
-                                if rate is not None:
-                                    try:
-                                        return round(float(rate), 5)
-                                    except (ValueError, TypeError):
-                                        pass
-                        except (ValueError, TypeError):
-                            continue
-
-        return None
+        return tariff.rate_at(dt_util.now())
 
     @property
     def extra_state_attributes(self):
         """Return rate components as attributes."""
-        if not self._coord.import_tariff_data:
+        tariff = self._coord.import_tariff
+        if tariff is None:
             return {}
+        period = tariff.period_at(dt_util.now())
+        return period.attributes() if period is not None else {}
 
-        # Get current time and find matching period
-        now = dt_util.now()
-        current_month = now.month
-        current_day_of_week = now.weekday() + 1
-        minutes_from_midnight = now.hour * 60 + now.minute
-
-        tariff_data = self._coord.import_tariff_data
-        purchase = tariff_data.get("purchase", {})
-        seasons = purchase.get("seasons", [])
+    def _next_boundary(self, now: datetime) -> datetime | None:
+        tariff = self._coord.import_tariff
+        return tariff.next_boundary(now) if tariff is not None else None
 
-        for season in seasons:
-            start_month = int(season.get("startMonth", 0))
-            end_month = int(season.get("endMonth", 0))
-
-            in_season = False
-            if start_month <= end_month:
-                in_season = start_month <= current_month <= end_month
-            else:
-                in_season = current_month >= start_month or current_month <= end_month
-
-            if not in_season:
-                continue
 
-            for day_group in season.get("days", []):
-                if current_day_of_week in day_group.get("days", []):
-                    periods = day_group.get("periods", [])
-                    for period in periods:
-                        start_time_str = period.get("startTime", "")
-                        end_time_str = period.get("endTime", "")
-
-                        # Check if this is the matching period
-                        is_match = False
-                        if not start_time_str and not end_time_str:
-                            is_match = True
-                        else:
-                            try:
-                                start_time = int(start_time_str) if start_time_str else 0
-                                end_time = int(end_time_str) if end_time_str else 1440
-                                if start_time <= minutes_from_midnight < end_time:
-                                    is_match = True
-                            except (ValueError, TypeError):
-                                pass
-
-                        if is_match:
-                            attrs = {
-                                "period_type": period.get("type"),
-                                "season": season.get("id"),
-                            }
-                            rate_components = period.get("rateComponents", [])
-                            if rate_components:
-                                attrs["rate_components"] = rate_components
-                            return attrs
-
-        return {}
-
-
-class EnphaseExportPriceNowSensor(_MonetaryBaseEntity):
+class EnphaseExportPriceNowSensor(_TariffRateEntity):
     _attr_translation_key = "export_price_now"
     _attr_device_class = SensorDeviceClass.MONETARY
     _attr_native_unit_of_measurement = "USD/kWh"
@@ -1388,3 +1309,22 @@ class EnphaseExportPriceNowSensor(_MonetaryBaseEntity):
             attrs["timezone"] = site_details.get("timezone")
 
         return attrs
+
+    def _next_boundary(self, now: datetime) -> datetime | None:
+        if not self._coord.export_tariff_data:
+            return None
+        buyback = (self._coord.export_tariff_data.get("data") or {}).get("buyback") or []
+        current = now.hour * 60 + now.minute
+        # Buyback windows are inclusive of their end minute
+        edges = []
+        for period in buyback:
+            try:
+                edges.append(int(period.get("start", 0)))
+                edges.append(int(period.get("end", 0)) + 1)
+            except (ValueError, TypeError):
+                continue
+        upcoming = [edge for edge in edges if current < edge < 1440]
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if upcoming:
+            return midnight + timedelta(minutes=min(upcoming))
+        return midnight + timedelta(days=1)
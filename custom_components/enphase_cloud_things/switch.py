@@ -31,18 +31,28 @@ class ChargingSwitch(EnphaseBaseEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool:
-        d = (self._coord.data or {}).get(self._sn) or {}
-        return bool(d.get("charging"))
+        d = self._charger
+        return bool(d.charging)
+
+    @property
+    def extra_state_attributes(self):
+        return {"pending": self._coord.is_pending(self._sn, "charging")}
 
     async def async_turn_on(self, **kwargs) -> None:
         # Use last requested amps or a sensible default
         amps = int(self._coord.last_set_amps.get(self._sn) or 32)
-        await self._coord.client.start_charging(self._sn, amps)
+        result = await self._coord.client.start_charging(self._sn, amps)
         self._coord.set_last_set_amps(self._sn, amps)
+        # Reflect the command now; the next status poll confirms or rolls back
+        if not (isinstance(result, dict) and result.get("status") == "not_ready"):
+            self._coord.async_apply_optimistic(self._sn, charging=True)
         self._coord.kick_fast(90)
+        self._coord.invalidate_summary_cache()
         await self._coord.async_request_refresh()
 
     async def async_turn_off(self, **kwargs) -> None:
         await self._coord.client.stop_charging(self._sn)
+        self._coord.async_apply_optimistic(self._sn, charging=False)
         self._coord.kick_fast(60)
+        self._coord.invalidate_summary_cache()
         await self._coord.async_request_refresh()
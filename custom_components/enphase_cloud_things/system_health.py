@@ -21,6 +21,12 @@ async def system_health_info(hass: HomeAssistant):
     if entries:
         entry_data = hass.data.get(DOMAIN, {}).get(entries[0].entry_id, {})
         coord = entry_data.get("coordinator")
+    # Endpoint families currently skipped by their circuit breaker
+    open_circuits = None
+    if coord is not None and hasattr(coord, "breaker_state"):
+        open_circuits = ", ".join(
+            name for name, state in coord.breaker_state().items() if state["state"] != "closed"
+        ) or "none"
 
     return {
         "site_id": site_id,
@@ -29,4 +35,5 @@ async def system_health_info(hass: HomeAssistant):
         "latency_ms": coord.latency_ms if coord else None,
         "last_error": getattr(coord, "_last_error", None) if coord else None,
         "backoff_active": bool(getattr(coord, "_backoff_until", None) and coord._backoff_until > 0),
+        "open_circuits": open_circuits,
     }
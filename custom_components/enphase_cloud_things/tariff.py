@@ -0,0 +1,302 @@
+"""Compiled import tariff lookups and the export tariff day cache.
+
+The Enlighten import tariff is a nested ``purchase.seasons -> days -> periods``
+document with month and minute values encoded as strings. ``CompiledTariff``
+parses it once into per-(month, weekday) day schedules so entities can look up
+the active rate, the next rate boundary and the periods within a window
+without re-walking the document on every state write.
+
+Export (buyback) tariffs are fetched per date; ``ExportTariffCache`` keeps
+recent days so calendar navigation does not refetch them.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from itertools import pairwise
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+MINUTES_PER_DAY = 1440
+
+
+@dataclass(frozen=True, slots=True)
+class TariffPeriod:
+    """A tariff period resolved to concrete local datetimes."""
+
+    start: datetime
+    end: datetime
+    rate: float | None
+    period_type: str | None = None
+    season: str | None = None
+    rate_components: list = field(default_factory=list)
+
+    def attributes(self) -> dict[str, Any]:
+        """Return the sensor attributes for this period."""
+        attrs: dict[str, Any] = {"period_type": self.period_type, "season": self.season}
+        if self.rate_components:
+            attrs["rate_components"] = self.rate_components
+        return attrs
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    """A parsed period within a day, in minutes from local midnight."""
+
+    start: int
+    end: int
+    rate: float | None
+    period_type: str | None
+    season: str | None
+    rate_components: list
+
+
+class _DaySchedule:
+    """Sorted, non-overlapping rate segments and the raw periods for one day."""
+
+    __slots__ = ("ends", "entries", "segment_starts", "segments")
+
+    def __init__(self, entries: tuple[_Entry, ...]) -> None:
+        self.entries = tuple(sorted(entries, key=lambda e: (e.start, e.end)))
+        ends = [e.end for e in self.entries]
+        # Only usable for bisecting when no period is nested inside another
+        self.ends = ends if ends == sorted(ends) else None
+        # Split the day at every period edge; each elementary slice takes the
+        # first listed period covering it, preferring one with a usable rate,
+        # which mirrors the order-sensitive scan the tariff was read with.
+        edges = sorted({0, MINUTES_PER_DAY, *(e.start for e in entries), *(e.end for e in entries)})
+        starts: list[int] = []
+        segments: list[_Entry | None] = []
+        for lo, hi in pairwise(edges):
+            covering = [e for e in entries if e.start <= lo and hi <= e.end]
+            chosen = next((e for e in covering if e.rate is not None), covering[0] if covering else None)
+            if segments and segments[-1] is chosen:
+                continue
+            starts.append(lo)
+            segments.append(chosen)
+        self.segment_starts = starts
+        self.segments = segments
+
+    def segment_at(self, minute: int) -> tuple[int, int, _Entry | None]:
+        """Return (start, end, entry) of the segment covering ``minute``."""
+        idx = bisect_right(self.segment_starts, minute) - 1
+        end = self.segment_starts[idx + 1] if idx + 1 < len(self.segment_starts) else MINUTES_PER_DAY
+        return self.segment_starts[idx], end, self.segments[idx]
+
+
+def _parse_rate(value: Any) -> float | None:
+    if value is None:
+        return None
+    try:
+        return round(float(value), 5)
+    except (ValueError, TypeError):
+        return None
+
+
+def _in_season(month: int, start_month: int, end_month: int) -> bool:
+    if start_month <= end_month:
+        return start_month <= month <= end_month
+    # Wraps around year end (e.g. Oct-May)
+    return month >= start_month or month <= end_month
+
+
+def _parse_period(period: dict, season_id: str | None) -> _Entry | None:
+    start_str = period.get("startTime", "")
+    end_str = period.get("endTime", "")
+    try:
+        start = int(start_str) if start_str else 0
+        end = int(end_str) if end_str else MINUTES_PER_DAY
+    except (ValueError, TypeError):
+        return None
+    start = max(0, start)
+    end = min(MINUTES_PER_DAY, end)
+    if start >= end:
+        return None
+    return _Entry(
+        start=start,
+        end=end,
+        rate=_parse_rate(period.get("rate")),
+        period_type=period.get("type"),
+        season=season_id,
+        rate_components=list(period.get("rateComponents") or []),
+    )
+
+
+class CompiledTariff:
+    """Import tariff compiled into month/weekday indexed day schedules."""
+
+    def __init__(self, source: dict) -> None:
+        self.source = source
+        purchase = (source or {}).get("purchase") or {}
+        parsed: list[tuple[int, int, list[tuple[set, tuple[_Entry, ...]]]]] = []
+        for season in purchase.get("seasons") or []:
+            try:
+                start_month = int(season.get("startMonth", 0))
+                end_month = int(season.get("endMonth", 0))
+            except (ValueError, TypeError):
+                continue
+            season_id = season.get("id")
+            groups = []
+            for day_group in season.get("days") or []:
+                entries = tuple(
+                    e
+                    for e in (_parse_period(p, season_id) for p in day_group.get("periods") or [])
+                    if e is not None
+                )
+                groups.append((set(day_group.get("days") or []), entries))
+            parsed.append((start_month, end_month, groups))
+
+        # Every season and day group that matches a (month, weekday) contributes
+        # its periods in document order; identical combinations share a schedule.
+        shared: dict[tuple, _DaySchedule] = {}
+        self._schedules: dict[tuple[int, int], _DaySchedule] = {}
+        for month in range(1, 13):
+            for weekday in range(1, 8):
+                key: list[tuple[int, int]] = []
+                entries: list[_Entry] = []
+                for s_idx, (start_month, end_month, groups) in enumerate(parsed):
+                    if not _in_season(month, start_month, end_month):
+                        continue
+                    for g_idx, (days, group_entries) in enumerate(groups):
+                        if weekday in days:
+                            key.append((s_idx, g_idx))
+                            entries.extend(group_entries)
+                if not entries:
+                    continue
+                sched = shared.get(tuple(key))
+                if sched is None:
+                    sched = shared[tuple(key)] = _DaySchedule(tuple(entries))
+                self._schedules[(month, weekday)] = sched
+
+    def _schedule(self, day: date) -> _DaySchedule | None:
+        return self._schedules.get((day.month, day.isoweekday()))
+
+    @staticmethod
+    def _at(day: date, minute: int, tzinfo) -> datetime:
+        return datetime.combine(day, time(), tzinfo=tzinfo) + timedelta(minutes=minute)
+
+    def period_at(self, when: datetime) -> TariffPeriod | None:
+        """Return the rate segment active at ``when``."""
+        local = dt_util.as_local(when)
+        sched = self._schedule(local.date())
+        if sched is None:
+            return None
+        start, end, entry = sched.segment_at(local.hour * 60 + local.minute)
+        if entry is None:
+            return None
+        day = local.date()
+        return TariffPeriod(
+            start=self._at(day, start, local.tzinfo),
+            end=self._at(day, end, local.tzinfo),
+            rate=entry.rate,
+            period_type=entry.period_type,
+            season=entry.season,
+            rate_components=entry.rate_components,
+        )
+
+    def rate_at(self, when: datetime) -> float | None:
+        """Return the import rate at ``when``."""
+        period = self.period_at(when)
+        return period.rate if period is not None else None
+
+    def next_boundary(self, when: datetime) -> datetime | None:
+        """Return the next time after ``when`` at which the active rate may change.
+
+        Local midnight is always treated as a boundary since the season or day
+        group can change with the date.
+        """
+        if not self._schedules:
+            return None
+        local = dt_util.as_local(when)
+        day = local.date()
+        sched = self._schedule(day)
+        if sched is not None:
+            idx = bisect_right(sched.segment_starts, local.hour * 60 + local.minute)
+            if idx < len(sched.segment_starts):
+                return self._at(day, sched.segment_starts[idx], local.tzinfo)
+        return self._at(day + timedelta(days=1), 0, local.tzinfo)
+
+    def periods(self, start: datetime, end: datetime) -> list[TariffPeriod]:
+        """Return every priced tariff period overlapping ``[start, end)``."""
+        start_local = dt_util.as_local(start)
+        end_local = dt_util.as_local(end)
+        tzinfo = start_local.tzinfo
+        out: list[TariffPeriod] = []
+        day = start_local.date()
+        last = end_local.date()
+        while day <= last:
+            sched = self._schedule(day)
+            if sched is not None:
+                # Entries are sorted by start; skip those ending before the window
+                lo = 0
+                if day == start_local.date() and sched.ends is not None:
+                    lo = bisect_left(sched.ends, start_local.hour * 60 + start_local.minute + 1)
+                for entry in sched.entries[lo:]:
+                    if entry.rate is None:
+                        continue
+                    p_start = self._at(day, entry.start, tzinfo)
+                    if p_start >= end:
+                        break
+                    p_end = self._at(day, entry.end, tzinfo)
+                    if p_end <= start:
+                        continue
+                    out.append(
+                        TariffPeriod(
+                            start=p_start,
+                            end=p_end,
+                            rate=entry.rate,
+                            period_type=entry.period_type,
+                            season=entry.season,
+                            rate_components=entry.rate_components,
+                        )
+                    )
+            day += timedelta(days=1)
+        return out
+
+
+class ExportTariffCache:
+    """Date-keyed LRU of export tariff payloads with per-entry expiry.
+
+    Past dates no longer change, so they are kept for ``past_ttl``; today and
+    future dates expire after ``ttl``.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, past_ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.past_ttl = past_ttl
+        self._entries: OrderedDict[date, tuple[float, dict]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, day: date) -> bool:
+        return day in self._entries
+
+    def get(self, day: date, now: float) -> dict | None:
+        """Return the cached payload for ``day`` unless missing or expired."""
+        item = self._entries.get(day)
+        if item is None or item[0] <= now:
+            if item is not None:
+                del self._entries[day]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(day)
+        self.hits += 1
+        return item[1]
+
+    def put(self, day: date, payload: dict, now: float, today: date) -> None:
+        """Store ``payload`` for ``day``, evicting the least recently used days."""
+        ttl = self.past_ttl if day < today else self.ttl
+        self._entries[day] = (now + ttl, payload)
+        self._entries.move_to_end(day)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,189 @@
+"""VPP program event storage and time index.
+
+The VPP events endpoint returns a list of events with ISO timestamps as
+strings. ``VPPEventStore`` merges windowed fetches by event id so each poll
+only downloads a bounded date range, and ``VPPEventIndex`` parses the merged
+list once per fetch into events sorted by start with a running maximum of end
+times, so "next event", "events today" and calendar range queries are
+answered by bisection instead of re-parsing every event on each state write.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+
+def parse_event_time(value: Any) -> datetime | None:
+    """Parse an event timestamp, treating naive values as UTC."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+@dataclass(frozen=True, slots=True)
+class VPPEvent:
+    """A VPP event with parsed, timezone-aware start and end."""
+
+    id: str | None
+    start: datetime
+    end: datetime
+    type: str | None
+    status: str | None
+    raw: dict
+
+
+class VPPEventIndex:
+    """VPP events sorted by start, with overlap and next-event lookups."""
+
+    def __init__(self, payload: dict | None) -> None:
+        self.source = payload
+        data = payload.get("data") if isinstance(payload, dict) else None
+        self.raw: list[dict] = data if isinstance(data, list) else []
+        self.meta: dict = (payload.get("meta") or {}) if isinstance(payload, dict) else {}
+
+        events: list[VPPEvent] = []
+        for item in self.raw:
+            if not isinstance(item, dict):
+                continue
+            start = parse_event_time(item.get("start_time"))
+            end = parse_event_time(item.get("end_time"))
+            if start is None or end is None:
+                continue
+            events.append(
+                VPPEvent(
+                    id=item.get("id"),
+                    start=start,
+                    end=end,
+                    type=item.get("type"),
+                    status=item.get("status"),
+                    raw=item,
+                )
+            )
+        events.sort(key=lambda e: e.start)
+        self.events: tuple[VPPEvent, ...] = tuple(events)
+        self._starts = [e.start for e in events]
+        # Running maximum of end times; non-decreasing, so the first event that
+        # can still be running at a given time is found by bisection
+        self._max_ends: list[datetime] = []
+        for event in events:
+            latest = self._max_ends[-1] if self._max_ends else event.end
+            self._max_ends.append(max(latest, event.end))
+
+        self.status_counts = dict(Counter(e.get("status", "unknown") for e in self.raw if isinstance(e, dict)))
+        self.type_counts = dict(Counter(e.get("type", "unknown") for e in self.raw if isinstance(e, dict)))
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def overlapping(self, start: datetime, end: datetime) -> list[VPPEvent]:
+        """Events with ``event.start <= end`` and ``event.end >= start``, by start."""
+        lo = bisect_left(self._max_ends, start)
+        hi = bisect_right(self._starts, end)
+        return [e for e in self.events[lo:hi] if e.end >= start]
+
+    def next_event(self, now: datetime) -> VPPEvent | None:
+        """First event starting after ``now``."""
+        idx = bisect_right(self._starts, now)
+        return self.events[idx] if idx < len(self.events) else None
+
+    def future_count(self, now: datetime) -> int:
+        """Number of events starting after ``now``."""
+        return len(self.events) - bisect_right(self._starts, now)
+
+    def current_or_next(self, now: datetime) -> VPPEvent | None:
+        """Earliest-starting event that has not ended by ``now``."""
+        for event in self.events[bisect_left(self._max_ends, now):]:
+            if event.end >= now:
+                return event
+        return None
+
+
+def _event_key(event: dict) -> str:
+    if event.get("id"):
+        return str(event["id"])
+    return f"{event.get('start_time')}|{event.get('type')}"
+
+
+class VPPEventStore:
+    """VPP events merged by id across fetches of bounded date ranges."""
+
+    def __init__(self) -> None:
+        self._events: dict[str, dict] = {}
+        # Merged, sorted date ranges that have been fetched at least once
+        self._covered: list[tuple[date, date]] = []
+        self.meta: dict | None = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def merge(self, payload: Any, start: date, end: date) -> dict:
+        """Merge a fetch of ``[start, end]`` and return the combined payload.
+
+        The fetch is authoritative for its range: stored events starting
+        inside it that the response no longer lists are dropped.
+        """
+        data = payload.get("data") if isinstance(payload, dict) else None
+        if not isinstance(data, list):
+            return self.payload()
+        returned: set[str] = set()
+        for event in data:
+            if isinstance(event, dict):
+                key = _event_key(event)
+                self._events[key] = event
+                returned.add(key)
+        for key, event in list(self._events.items()):
+            if key in returned:
+                continue
+            started = parse_event_time(event.get("start_time"))
+            # Ranges are local calendar dates
+            if started is not None and start <= dt_util.as_local(started).date() <= end:
+                del self._events[key]
+        if payload.get("meta") is not None:
+            self.meta = dict(payload["meta"])
+        self._add_covered(start, end)
+        return self.payload()
+
+    def prune(self, before: date) -> None:
+        """Forget events that ended, and fetched ranges that lie, before ``before``."""
+        for key, event in list(self._events.items()):
+            ended = parse_event_time(event.get("end_time")) or parse_event_time(event.get("start_time"))
+            if ended is not None and dt_util.as_local(ended).date() < before:
+                del self._events[key]
+        self._covered = [(max(lo, before), hi) for lo, hi in self._covered if hi >= before]
+
+    def covers(self, start: date, end: date) -> bool:
+        """Whether ``[start, end]`` lies within one fetched range."""
+        return any(lo <= start and end <= hi for lo, hi in self._covered)
+
+    def _add_covered(self, start: date, end: date) -> None:
+        ranges = sorted([*self._covered, (start, end)])
+        merged: list[tuple[date, date]] = []
+        for lo, hi in ranges:
+            if merged and lo <= merged[-1][1] + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+            else:
+                merged.append((lo, hi))
+        self._covered = merged
+
+    def payload(self) -> dict:
+        """Events in the endpoint's response shape, latest start first."""
+        events = sorted(
+            self._events.values(),
+            key=lambda e: parse_event_time(e.get("start_time")) or datetime.min.replace(tzinfo=UTC),
+            reverse=True,
+        )
+        out: dict[str, Any] = {"data": events}
+        if self.meta is not None:
+            out["meta"] = dict(self.meta, rowCount=len(events))
+        return out
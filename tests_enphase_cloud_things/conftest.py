@@ -86,6 +86,48 @@ def hass():
 
     return DummyHass()
 
+@pytest.fixture
+def coord_factory(hass, monkeypatch):
+    """Build EnphaseCoordinator instances without touching the network.
+
+    ``config`` entries override the single-site defaults; ``client`` replaces
+    the API client and ``clock`` (a one-item list of seconds) drives the
+    coordinator's monotonic clock.
+    """
+    from types import SimpleNamespace
+
+    from custom_components.enphase_cloud_things import coordinator as coord_mod
+    from custom_components.enphase_cloud_things.const import (
+        CONF_COOKIE,
+        CONF_EAUTH,
+        CONF_SCAN_INTERVAL,
+        CONF_SERIALS,
+        CONF_SITE_ID,
+    )
+
+    monkeypatch.setattr(coord_mod, "async_get_clientsession", lambda *args, **kwargs: object())
+
+    def _make(*, config=None, client=None, clock=None, config_entry=None):
+        if clock is not None:
+            monkeypatch.setattr(
+                coord_mod, "time", SimpleNamespace(monotonic=lambda: clock[0], time=coord_mod.time.time)
+            )
+        cfg = {
+            CONF_SITE_ID: "3381244",
+            CONF_SERIALS: ["482522020944"],
+            CONF_EAUTH: "EAUTH",
+            CONF_COOKIE: "COOKIE",
+            CONF_SCAN_INTERVAL: 15,
+        }
+        cfg.update(config or {})
+        coord = coord_mod.EnphaseCoordinator(hass, cfg, config_entry=config_entry)
+        if client is not None:
+            coord.client = client
+        return coord
+
+    return _make
+
+
 # Ensure repository root is on sys.path for imports like 'custom_components.enphase_cloud_things.*'
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -208,3 +250,54 @@ if not PYTEST_ASYNCIO_AVAILABLE or os.environ.get("PYTEST_DISABLE_PLUGIN_AUTOLOA
         for item in items:
             if item.get_closest_marker("asyncio") and asyncio.iscoroutinefunction(item.obj):
                 item.obj = _wrap_async(item.obj)
+
+
+class FakeResponse:
+    """aiohttp response stand-in that streams its body in fixed-size chunks."""
+
+    request_info = None
+    history = ()
+
+    def __init__(self, status=200, body=b"", headers=None, chunk_size=1024):
+        self.status = status
+        self._body = body
+        self.headers = headers or {}
+        self.chunks_read = 0
+        self.content = self
+        self._chunk_size = chunk_size
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def iter_chunked(self, n):
+        size = min(n, self._chunk_size)
+        for i in range(0, len(self._body), size):
+            self.chunks_read += 1
+            yield self._body[i : i + size]
+
+    def raise_for_status(self):
+        return None
+
+
+class FakeSession:
+    """Hands out queued FakeResponses and records the headers sent."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.sent_headers.append(dict(headers or {}))
+        response = self.responses.pop(0)
+        return response() if callable(response) else response
+
+
+@pytest.fixture
+def fake_http():
+    """Response and session stand-ins for exercising EnphaseEVClient._json."""
+    from types import SimpleNamespace
+
+    return SimpleNamespace(Response=FakeResponse, Session=FakeSession)
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from custom_components.enphase_cloud_things.api import EnphaseEVClient
+
+
+@pytest.mark.asyncio
+async def test_json_conditional_get_and_body_hash_reuse(fake_http, monkeypatch):
+    from custom_components.enphase_cloud_things import api as api_mod
+
+    decoded = []
+    monkeypatch.setattr(api_mod, "_loads", lambda body: decoded.append(body) or json.loads(body))
+    body = json.dumps({"data": {"buyback": [{"rate": 0.05}]}}).encode()
+    session = fake_http.Session(
+        [
+            fake_http.Response(200, body, {"ETag": '"v1"'}),
+            fake_http.Response(304),
+            fake_http.Response(200, body),
+        ]
+    )
+    client = EnphaseEVClient(session, "3381244", "EAUTH", "COOKIE")
+    url = "https://example.invalid/tariffs"
+
+    first = await client._json("GET", url)
+    assert "If-None-Match" not in session.sent_headers[0]
+
+    # Server honours the validator: 304 returns the stored payload
+    second = await client._json("GET", url)
+    assert session.sent_headers[1]["If-None-Match"] == '"v1"'
+    assert second is first
+
+    # Server ignores validators: identical body is not decoded again
+    third = await client._json("GET", url)
+    assert third is first
+    assert len(decoded) == 1
+    assert client.cache_stats == {"not_modified": 1, "body_unchanged": 1, "miss": 1}
+
+
+@pytest.mark.asyncio
+async def test_json_size_guard_and_decode_stats(fake_http, monkeypatch):
+    from custom_components.enphase_cloud_things import api as api_mod
+    from custom_components.enphase_cloud_things.api import ResponseTooLarge
+
+    monkeypatch.setattr(api_mod, "MAX_RESPONSE_BYTES", 1024)
+    monkeypatch.setattr(api_mod, "DECODE_IN_EXECUTOR_BYTES", 64)
+    events = json.dumps({"data": [{"id": i} for i in range(8)]}).encode()
+    chunked = fake_http.Response(200, b"x" * 8192, chunk_size=256)
+    session = fake_http.Session(
+        [
+            fake_http.Response(200, events),
+            chunked,
+            fake_http.Response(200, b"{}", {"Content-Length": "4096"}),
+            fake_http.Response(200, b""),
+        ]
+    )
+    client = EnphaseEVClient(session, "3381244", "EAUTH", "COOKIE")
+    vpp_url = "https://gs.enphaseenergy.com/vpp-mgr/api/v1/events/get"
+
+    # Large enough to be decoded off the event loop
+    assert await client._json("GET", vpp_url) == {"data": [{"id": i} for i in range(8)]}
+    stats = client.decode_stats["vpp_events"]
+    assert stats["count"] == 1
+    assert stats["bytes_max"] == len(events)
+    assert stats["offloaded"] == 1
+
+    # Oversized bodies are rejected whether or not Content-Length announces
+    # them; a chunked body is abandoned once it passes the limit
+    with pytest.raises(ResponseTooLarge):
+        await client._json("GET", vpp_url + "?page=2")
+    assert chunked.chunks_read == 5
+    with pytest.raises(ResponseTooLarge):
+        await client._json("GET", vpp_url + "?page=3")
+    assert client.decode_stats["vpp_events"]["count"] == 1
+
+    # Empty bodies (e.g. some control endpoints) decode to None
+    assert await client._json("POST", "https://example.invalid/start_charging") is None
+
+
+@pytest.mark.asyncio
+async def test_json_non_json_body_raises_content_type_error(fake_http):
+    import aiohttp
+
+    session = fake_http.Session([fake_http.Response(200, b"<html>maintenance</html>")])
+    client = EnphaseEVClient(session, "3381244", "EAUTH", "COOKIE")
+
+    with pytest.raises(aiohttp.ContentTypeError) as err:
+        await client._json("GET", "https://example.invalid/ev_chargers/status")
+    assert err.value.status == 200
+    assert "not JSON" in err.value.message
+    # Nothing is cached for a body that failed to decode
+    assert client._responses == {}
@@ -44,3 +44,48 @@ async def test_stop_charging_noop_when_inactive():
     out = await c.stop_charging("482522020944")
     assert isinstance(out, dict)
     assert out.get("status") == "not_active"
+
+
+class VariantStubClient(EnphaseEVClient):
+    def __init__(self, failing=()):
+        self.calls = []
+        self.failing = set(failing)
+        super().__init__(MagicMock(), "3381244", "EAUTH", "COOKIE")
+
+    async def _json(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs.get("json")))
+        if (method, url.rsplit("/", 3)[-3], kwargs.get("json") is not None) in self.failing:
+            raise _cre(405, url)
+        return {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_restored_start_variant_is_tried_first_and_reported():
+    c = VariantStubClient()
+    changes = []
+    c.on_variant_change = lambda action, idx: changes.append((action, idx))
+    c.restore_variants(start=2)
+    await c.start_charging("482522020944", 32)
+    # One request using the remembered variant; nothing changed so no callback
+    assert c.calls == [
+        (
+            "POST",
+            "https://enlighten.enphaseenergy.com/service/evse_controller/3381244/ev_charger/482522020944/start_charging",
+            {"chargingLevel": 32, "connectorId": 1},
+        )
+    ]
+    assert changes == []
+
+
+@pytest.mark.asyncio
+async def test_failed_variants_invalidate_persisted_choice():
+    c = VariantStubClient(
+        failing={("PUT", "ev_chargers", False), ("POST", "ev_chargers", False), ("POST", "ev_charger", False)}
+    )
+    changes = []
+    c.on_variant_change = lambda action, idx: changes.append((action, idx))
+    c.restore_variants(stop=1)
+    with pytest.raises(ClientResponseError):
+        await c.stop_charging("482522020944")
+    assert changes == [("stop", None)]
+    assert c._stop_variant_idx is None
@@ -166,3 +166,843 @@ async def test_streaming_prefers_fast(hass, monkeypatch):
     coord._streaming = True
     await coord._async_update_data()
     assert int(coord.update_interval.total_seconds()) == 6
+
+
+@pytest.mark.asyncio
+async def test_optional_fetches_run_concurrently_and_isolated(coord_factory):
+    import asyncio
+
+    coord = coord_factory()
+
+    summary_started = asyncio.Event()
+
+    class StubClient:
+        async def status(self):
+            # Only completes if summary_v2 was issued concurrently
+            await asyncio.wait_for(summary_started.wait(), timeout=1)
+            return {"evChargerData": [{"sn": "482522020944", "charging": False}]}
+
+        async def summary_v2(self):
+            summary_started.set()
+            return [{"serialNumber": "482522020944", "maxCurrent": 48}]
+
+        async def import_tariff(self):
+            raise aiohttp.ClientError("tariff down")
+
+        async def export_tariff(self, date):
+            return {"data": {"buyback": []}}
+
+    coord.client = StubClient()
+    coord.import_tariff_data = {"purchase": {"seasons": []}}
+
+    data = await coord._async_update_data()
+
+    assert data["482522020944"]["max_current"] == 48
+    # Tariffs are polled by the monetary domain coordinator, not the status poll
+    assert coord.export_tariff_data is None
+
+    await coord.domain_coordinators["monetary"]._async_update_data()
+    # Failed optional fetch keeps the last good payload
+    assert coord.import_tariff_data == {"purchase": {"seasons": []}}
+    assert coord.export_tariff_data == {"data": {"buyback": []}}
+
+
+@pytest.mark.asyncio
+async def test_optional_domains_follow_their_own_schedule(coord_factory):
+    from homeassistant.helpers.update_coordinator import UpdateFailed
+
+    coord = coord_factory()
+
+    calls = {"status": 0, "import_tariff": 0, "export_tariff": 0}
+
+    class StubClient:
+        async def status(self):
+            calls["status"] += 1
+            return {"evChargerData": [{"sn": "482522020944", "charging": True}]}
+
+        async def import_tariff(self):
+            calls["import_tariff"] += 1
+            return {"purchase": {"seasons": []}}
+
+        async def export_tariff(self, date):
+            calls["export_tariff"] += 1
+            return {"data": {"buyback": []}}
+
+    coord.client = StubClient()
+    monetary = coord.domain_coordinators["monetary"]
+
+    for _ in range(3):
+        await coord._async_update_data()
+        await monetary._async_update_data()
+    assert calls == {"status": 3, "import_tariff": 1, "export_tariff": 1}
+
+    # Once a domain is past its staleness budget without a good refresh, drop it
+    schedule = coord._schedules["import_tariff"]
+    schedule.next_due = 0.0
+    schedule.last_success -= schedule.max_stale + 1
+
+    async def _down():
+        raise aiohttp.ClientError("tariff down")
+
+    coord.client.import_tariff = _down
+    with pytest.raises(UpdateFailed):
+        await monetary._async_update_data()
+    assert coord.import_tariff_data is None
+    assert coord.export_tariff_data == {"data": {"buyback": []}}
+    assert calls["export_tariff"] == 1
+
+
+@pytest.mark.asyncio
+async def test_domain_coordinator_failure_is_isolated(coord_factory):
+    from homeassistant.helpers.update_coordinator import UpdateFailed
+
+    from custom_components.enphase_cloud_things.const import CONF_VPP_PROGRAM_ID
+
+    coord = coord_factory(config={CONF_VPP_PROGRAM_ID: "PROGRAM"})
+    assert set(coord.domain_coordinators) == {"monetary", "vpp"}
+
+    class StubClient:
+        async def status(self):
+            return {"evChargerData": [{"sn": "482522020944", "plugged": True}]}
+
+        async def vpp_events(self, program_id, **_kwargs):
+            raise aiohttp.ClientError("vpp down")
+
+    coord.client = StubClient()
+
+    # VPP failures fail only the VPP coordinator; charger status is unaffected
+    data = await coord._async_update_data()
+    assert "482522020944" in data
+    with pytest.raises(UpdateFailed):
+        await coord.domain_coordinators["vpp"]._async_update_data()
+    assert coord.domain_coordinator("vpp") is coord.domain_coordinators["vpp"]
+    assert coord.domain_coordinator("unknown") is coord
+
+
+@pytest.mark.asyncio
+async def test_endpoint_budgets_cancel_overruns(coord_factory, monkeypatch):
+    import asyncio
+
+    from homeassistant.helpers.update_coordinator import UpdateFailed
+
+    from custom_components.enphase_cloud_things import coordinator as coord_mod
+    from custom_components.enphase_cloud_things.const import CONF_VPP_PROGRAM_ID
+    from custom_components.enphase_cloud_things.sensor import EnphaseCloudLatencySensor
+
+    monkeypatch.setattr(coord_mod, "ENDPOINT_BUDGETS", {"status": 0.05, "vpp": 0.05})
+    coord = coord_factory(config={CONF_VPP_PROGRAM_ID: "PROGRAM"})
+
+    class StubClient:
+        slow_status = False
+
+        async def status(self):
+            if self.slow_status:
+                await asyncio.sleep(1)
+            return {"evChargerData": [{"sn": "482522020944", "plugged": True}]}
+
+        async def vpp_events(self, program_id, **_kwargs):
+            await asyncio.sleep(1)
+            return {"data": []}
+
+    coord.client = StubClient()
+    coord.vpp_events_data = {"data": [{"id": "kept"}]}
+
+    # A VPP overrun is cancelled and the last good payload is kept
+    with pytest.raises(UpdateFailed):
+        await coord.domain_coordinators["vpp"]._async_update_data()
+    assert coord.vpp_events_data == {"data": [{"id": "kept"}]}
+
+    await coord._async_update_data()
+    attrs = EnphaseCloudLatencySensor(coord).extra_state_attributes
+    assert attrs["last_timeout_endpoint"] == "vpp"
+    assert attrs["endpoint_timeouts"] == {"vpp": 1}
+    assert attrs["slowest_endpoint"] == "vpp"
+
+    # A status overrun fails the poll instead of blocking it
+    coord.client.slow_status = True
+    with pytest.raises(UpdateFailed):
+        await coord._async_update_data()
+    assert coord.endpoint_timeouts["status"] == 1
+
+
+def test_endpoint_budgets_scale_with_api_timeout(coord_factory):
+    from types import SimpleNamespace
+
+    from custom_components.enphase_cloud_things.const import (
+        ENDPOINT_BUDGETS,
+        OPT_API_TIMEOUT,
+        POLL_DEADLINE,
+    )
+
+    default = coord_factory()
+    assert default.endpoint_budget("status") == ENDPOINT_BUDGETS["status"]
+    assert default.poll_deadline == POLL_DEADLINE
+
+    entry = SimpleNamespace(options={OPT_API_TIMEOUT: 30}, async_on_unload=lambda cb: None)
+    slow = coord_factory(config_entry=entry)
+    assert slow.client._timeout == 30
+    assert slow.endpoint_budget("status") == ENDPOINT_BUDGETS["status"] * 2
+    assert slow.endpoint_budget("vpp") == ENDPOINT_BUDGETS["vpp"] * 2
+    assert slow.poll_deadline == POLL_DEADLINE * 2
+
+
+@pytest.mark.asyncio
+async def test_charge_mode_lookups_concurrent_and_single_flight(coord_factory):
+    import asyncio
+
+    from custom_components.enphase_cloud_things.const import CONF_SERIALS
+
+    clock = [1000.0]
+    coord = coord_factory(config={CONF_SERIALS: ["111111111111", "222222222222"]}, clock=clock)
+
+    class StubClient:
+        def __init__(self):
+            self.calls: list[str] = []
+            self.in_flight = 0
+            self.both_started = asyncio.Event()
+
+        async def status(self):
+            return {
+                "evChargerData": [
+                    {"sn": "111111111111", "charging": False},
+                    {"sn": "222222222222", "charging": False},
+                ]
+            }
+
+        async def charge_mode(self, sn):
+            self.calls.append(sn)
+            self.in_flight += 1
+            if self.in_flight == 2:
+                self.both_started.set()
+            # Only completes if both serials are looked up concurrently
+            await asyncio.wait_for(self.both_started.wait(), timeout=1)
+            return "SCHEDULED_CHARGING"
+
+    coord.client = StubClient()
+    data = await coord._async_update_data()
+    assert sorted(coord.client.calls) == ["111111111111", "222222222222"]
+    assert data["111111111111"]["charge_mode"] == "SCHEDULED_CHARGING"
+
+    # Overlapping lookups for an expired serial share one request
+    coord._charge_mode_cache.clear()
+    coord.client.calls.clear()
+    coord.client.in_flight = 1
+    coord.client.both_started = asyncio.Event()
+    first, second = await asyncio.gather(
+        coord._get_charge_mode("111111111111"), coord._get_charge_mode("111111111111")
+    )
+    assert first == second == "SCHEDULED_CHARGING"
+    assert coord.client.calls == ["111111111111"]
+    # Cache lifetimes are staggered past the base TTL
+    assert coord._charge_mode_cache["111111111111"][1] > clock[0] + 290
+
+
+def test_listeners_notified_only_for_changed_serials(coord_factory, monkeypatch):
+    from custom_components.enphase_cloud_things.const import CONF_SERIALS
+
+    coord = coord_factory(config={CONF_SERIALS: ["111111111111", "222222222222"]})
+    monkeypatch.setattr(coord, "_schedule_refresh", lambda: None)
+
+    calls = {"a": 0, "b": 0, "site": 0}
+    coord.async_add_listener(lambda: calls.__setitem__("a", calls["a"] + 1), "111111111111")
+    coord.async_add_listener(lambda: calls.__setitem__("b", calls["b"] + 1), "222222222222")
+    coord.async_add_listener(lambda: calls.__setitem__("site", calls["site"] + 1))
+
+    def _snap(plugged_a, plugged_b):
+        return {
+            "111111111111": {"sn": "111111111111", "plugged": plugged_a, "charging": False},
+            "222222222222": {"sn": "222222222222", "plugged": plugged_b, "charging": False},
+        }
+
+    coord.data = _snap(False, False)
+    coord.async_update_listeners()
+    assert calls == {"a": 1, "b": 1, "site": 1}
+
+    # Only the charger whose snapshot changed is notified
+    coord.data = _snap(True, False)
+    coord.async_update_listeners()
+    assert calls == {"a": 2, "b": 1, "site": 2}
+
+    # Availability changes notify everyone
+    coord.last_update_success = False
+    coord.async_update_listeners()
+    assert calls == {"a": 3, "b": 2, "site": 3}
+
+
+def test_idle_charger_notified_when_date_changes(coord_factory, monkeypatch):
+    from datetime import UTC, datetime, timedelta
+
+    from homeassistant.util import dt as dt_util
+
+    from custom_components.enphase_cloud_things.sensor import EnphaseEnergyTodaySensor
+
+    now = [datetime(2025, 9, 7, 23, 58, tzinfo=UTC)]
+    monkeypatch.setattr(dt_util, "now", lambda *args: now[0])
+    monkeypatch.setattr(dt_util, "DEFAULT_TIME_ZONE", UTC)
+    coord = coord_factory()
+    monkeypatch.setattr(coord, "_schedule_refresh", lambda: None)
+
+    sensor = EnphaseEnergyTodaySensor(coord, "482522020944")
+    values = []
+    coord.async_add_listener(lambda: values.append(sensor.native_value), "482522020944")
+
+    # Idle charger: the lifetime total stays put
+    coord.data = {"482522020944": {"sn": "482522020944", "charging": False, "lifetime_kwh": 10.0}}
+    coord.async_update_listeners()
+    # 2.5 kWh charged earlier today; the same snapshot on the same day is skipped
+    sensor._baseline_kwh = 7.5
+    coord.async_update_listeners()
+    assert values == [0.0]
+
+    # Unchanged snapshot after midnight still reaches the entity, which resets
+    now[0] += timedelta(minutes=5)
+    coord.async_update_listeners()
+    assert values == [0.0, 0.0]
+    assert sensor.extra_state_attributes["baseline_day"] == "2025-09-08"
+    assert sensor.extra_state_attributes["baseline_kwh"] == 10.0
+
+
+@pytest.mark.asyncio
+async def test_refresh_requests_coalesce_into_one_poll(coord_factory, monkeypatch):
+    import asyncio
+    from types import SimpleNamespace
+
+    from custom_components.enphase_cloud_things import coordinator as coord_mod
+
+    monkeypatch.setattr(coord_mod, "REFRESH_COALESCE_WINDOW", 0.01)
+    coord = coord_factory()
+    debouncer = coord._debounced_refresh
+    assert (debouncer.cooldown, debouncer.immediate) == (0.01, False)
+
+    # The test hass has no event loop helpers; give the debouncer the real loop
+    loop = asyncio.get_running_loop()
+    debouncer.hass = SimpleNamespace(
+        loop=loop,
+        async_run_hass_job=lambda job: job.target(),
+        async_create_task=lambda coro, *args, **kwargs: loop.create_task(coro),
+    )
+    polls = []
+
+    async def _refresh():
+        polls.append(True)
+
+    debouncer.function = _refresh
+
+    # A burst of requests (e.g. four chargers stopped together) shares one poll
+    await asyncio.gather(*(coord.async_request_refresh() for _ in range(4)))
+    assert polls == []
+    await asyncio.sleep(0.05)
+    assert len(polls) == 1
+
+    # A later request gets its own poll
+    await coord.async_request_refresh()
+    await asyncio.sleep(0.05)
+    assert len(polls) == 2
+
+    # Unloading cancels a poll that is still waiting for its window
+    await coord.async_request_refresh()
+    await coord.async_shutdown()
+    await asyncio.sleep(0.05)
+    assert len(polls) == 2
+
+
+@pytest.mark.asyncio
+async def test_control_variants_persist_per_firmware(coord_factory, monkeypatch):
+    from custom_components.enphase_cloud_things import coordinator as coord_mod
+    from custom_components.enphase_cloud_things.coordinator import ChargerState
+
+    saved = {}
+
+    class FakeStore:
+        def __init__(self, hass, version, key):
+            self.key = key
+
+        async def async_load(self):
+            return saved.get(self.key)
+
+        def async_delay_save(self, data_func, delay):
+            saved[self.key] = data_func()
+
+    monkeypatch.setattr(coord_mod, "Store", FakeStore)
+    sn = "482522020944"
+
+    async def _started(firmware):
+        coord = coord_factory()
+        coord.data = {sn: ChargerState.from_mapping(sn, {"sw_version": firmware})}
+        await coord.async_restore_variants()
+        return coord
+
+    # A discovery is saved under the running firmware
+    coord = await _started("25.37.1.13")
+    coord.client.on_variant_change("start", 2)
+    assert saved == {"enphase_cloud_things.variants_3381244": {"25.37.1.13": {"start": 2}}}
+
+    # After a restart on the same firmware it is tried first again
+    coord = await _started("25.37.1.13")
+    assert coord.client._start_variant_idx == 2
+
+    # A firmware upgrade starts fresh
+    coord = await _started("25.41.0.2")
+    assert coord.client._start_variant_idx is None
+
+    # Unknown firmware neither restores nor saves
+    saved.clear()
+    saved["enphase_cloud_things.variants_3381244"] = {"25.37.1.13": {"start": 2}}
+    coord = await _started(None)
+    assert coord.client._start_variant_idx is None
+    coord.client.on_variant_change("stop", 1)
+    assert saved == {"enphase_cloud_things.variants_3381244": {"25.37.1.13": {"start": 2}}}
+
+
+@pytest.mark.asyncio
+async def test_token_refresh_scheduled_ahead_of_expiry(coord_factory, monkeypatch):
+    import asyncio
+    from datetime import UTC, datetime, timedelta
+
+    from custom_components.enphase_cloud_things import coordinator as coord_mod
+    from custom_components.enphase_cloud_things.api import AuthTokens
+    from custom_components.enphase_cloud_things.const import (
+        CONF_EMAIL,
+        CONF_PASSWORD,
+        CONF_REMEMBER_PASSWORD,
+        CONF_TOKEN_EXPIRES_AT,
+        TOKEN_REFRESH_LEAD,
+    )
+
+    expires = int(datetime(2030, 1, 1, tzinfo=UTC).timestamp())
+
+    scheduled = []
+    cancelled = []
+
+    def _track(hass_, action, when):
+        scheduled.append(when)
+        return lambda: cancelled.append(when)
+
+    monkeypatch.setattr(coord_mod, "async_track_point_in_utc_time", _track)
+
+    logins = []
+
+    async def _auth(session, email, password):
+        logins.append(email)
+        await asyncio.sleep(0)
+        return AuthTokens(cookie="NEW", access_token="NEW", token_expires_at=expires + 3600), None
+
+    monkeypatch.setattr(coord_mod, "async_authenticate", _auth)
+    coord = coord_factory(
+        config={
+            CONF_EMAIL: "user@example.com",
+            CONF_PASSWORD: "secret",
+            CONF_REMEMBER_PASSWORD: True,
+            CONF_TOKEN_EXPIRES_AT: expires,
+        }
+    )
+
+    coord.async_schedule_token_refresh()
+    assert scheduled == [
+        datetime.fromtimestamp(expires, tz=UTC) - timedelta(seconds=TOKEN_REFRESH_LEAD)
+    ]
+    assert coord.token_refresh_at == scheduled[0]
+
+    # Proactive and reactive refreshes racing each other log in only once
+    results = await asyncio.gather(
+        coord._async_proactive_token_refresh(), coord._attempt_auto_refresh()
+    )
+    assert logins == ["user@example.com"]
+    assert results[1] is True
+    assert coord.client._eauth == "NEW"
+    # The renewed token's expiry replaces the old timer
+    assert cancelled == [scheduled[0]]
+    assert scheduled[-1] == datetime.fromtimestamp(expires + 3600, tz=UTC) - timedelta(
+        seconds=TOKEN_REFRESH_LEAD
+    )
+
+    coord.async_cancel_token_refresh()
+    assert coord.token_refresh_at is None
+
+
+@pytest.mark.asyncio
+async def test_account_auth_single_login_for_all_sites(hass, coord_factory, monkeypatch):
+    import asyncio
+
+    from custom_components.enphase_cloud_things import coordinator as coord_mod
+    from custom_components.enphase_cloud_things.api import AuthTokens
+    from custom_components.enphase_cloud_things.const import (
+        CONF_EAUTH,
+        CONF_EMAIL,
+        CONF_PASSWORD,
+        CONF_REMEMBER_PASSWORD,
+        CONF_SITE_ID,
+    )
+
+    logins = []
+
+    async def _auth(session, email, password):
+        logins.append(email)
+        await asyncio.sleep(0.01)
+        return AuthTokens(cookie="NEWCOOKIE", access_token="NEW"), None
+
+    monkeypatch.setattr(coord_mod, "async_authenticate", _auth)
+
+    class DummyEntry:
+        def __init__(self, site):
+            self.options = {}
+            self.data = {CONF_SITE_ID: site}
+
+    coords = [
+        coord_factory(
+            config={
+                CONF_SITE_ID: site,
+                CONF_EAUTH: "OLD",
+                CONF_EMAIL: "User@Example.com" if site == "1001" else "user@example.com",
+                CONF_PASSWORD: "secret",
+                CONF_REMEMBER_PASSWORD: True,
+            },
+            config_entry=DummyEntry(site),
+        )
+        for site in ("1001", "1002", "1003")
+    ]
+
+    # All three sites hit 401 together; only one login reaches Enlighten
+    results = await asyncio.gather(*(c._attempt_auto_refresh() for c in coords[:2]))
+    assert results == [True, True]
+    assert logins == ["User@Example.com"]
+    # Sites that did not ask are updated too, and a late stale caller reuses the result
+    assert all(c.client._eauth == "NEW" for c in coords)
+    assert await coords[2]._attempt_auto_refresh() is True
+    assert len(logins) == 1
+    # One config entry write per site
+    updated_sites = [args[0].data[CONF_SITE_ID] for args, _ in hass.config_entries.updated_entries]
+    assert sorted(updated_sites) == ["1001", "1002", "1003"]
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_skips_failing_vpp_and_probes(coord_factory):
+    from homeassistant.helpers.update_coordinator import UpdateFailed
+
+    from custom_components.enphase_cloud_things.const import (
+        BREAKER_FAILURE_THRESHOLD,
+        BREAKER_PROBE_BASE,
+        CONF_VPP_PROGRAM_ID,
+    )
+
+    clock = [1000.0]
+    coord = coord_factory(config={CONF_VPP_PROGRAM_ID: "PROGRAM"}, clock=clock)
+
+    class StubClient:
+        def __init__(self):
+            self.calls = 0
+            self.fail = True
+
+        async def vpp_events(self, program_id, **_kwargs):
+            self.calls += 1
+            if self.fail:
+                raise aiohttp.ClientError("vpp down")
+            return {"data": [{"id": "new"}]}
+
+    coord.client = StubClient()
+    coord.vpp_events_data = {"data": [{"id": "old"}]}
+    coord._schedules["vpp"].mark_success(clock[0])
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        coord._schedules["vpp"].next_due = 0
+        with pytest.raises(UpdateFailed):
+            await coord._async_refresh_domains(("vpp",))
+    assert coord.breaker_state()["vpp"]["state"] == "open"
+
+    # Open: no request is made and the last good payload keeps serving
+    coord._schedules["vpp"].next_due = 0
+    await coord._async_refresh_domains(("vpp",))
+    assert coord.client.calls == BREAKER_FAILURE_THRESHOLD
+    assert coord.vpp_events_data == {"data": [{"id": "old"}]}
+
+    # Failed half-open probe reopens with a longer interval
+    clock[0] += BREAKER_PROBE_BASE
+    with pytest.raises(UpdateFailed):
+        await coord._async_refresh_domains(("vpp",))
+    state = coord.breaker_state()["vpp"]
+    assert state["state"] == "open"
+    assert state["probe_interval_s"] == BREAKER_PROBE_BASE * 2
+
+    # Successful probe closes the breaker
+    clock[0] += BREAKER_PROBE_BASE * 2
+    coord.client.fail = False
+    await coord._async_refresh_domains(("vpp",))
+    assert coord.breaker_state()["vpp"]["state"] == "closed"
+    assert coord.vpp_events_data == {"data": [{"id": "new"}]}
+
+
+@pytest.mark.asyncio
+async def test_open_status_breaker_fails_poll_without_request(coord_factory):
+    from homeassistant.helpers.update_coordinator import UpdateFailed
+
+    from custom_components.enphase_cloud_things.const import (
+        BREAKER_FAILURE_THRESHOLD,
+        BREAKER_PROBE_BASE,
+    )
+    from custom_components.enphase_cloud_things.coordinator import CircuitOpenError
+
+    clock = [1000.0]
+    coord = coord_factory(clock=clock)
+
+    class StubClient:
+        def __init__(self):
+            self.calls = 0
+            self.fail = True
+
+        async def status(self):
+            self.calls += 1
+            if self.fail:
+                raise aiohttp.ClientError("status down")
+            return {"evChargerData": [{"sn": "482522020944", "charging": False}]}
+
+        async def summary_v2(self):
+            return []
+
+    coord.client = StubClient()
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        coord._backoff_until = None
+        with pytest.raises(UpdateFailed):
+            await coord._async_update_data()
+    assert coord.breaker_state()["status"]["state"] == "open"
+    # The breaker owns the cooldown from here; no backoff is stacked on top
+    assert coord.backoff_remaining == 0
+
+    # Open: the poll fails fast without calling the endpoint
+    with pytest.raises(CircuitOpenError):
+        await coord._async_update_data()
+    assert coord.client.calls == BREAKER_FAILURE_THRESHOLD
+
+    # A failed half-open probe reopens with a doubled interval, still without backoff
+    clock[0] += BREAKER_PROBE_BASE
+    with pytest.raises(UpdateFailed):
+        await coord._async_update_data()
+    assert coord.client.calls == BREAKER_FAILURE_THRESHOLD + 1
+    assert coord.backoff_remaining == 0
+    clock[0] += BREAKER_PROBE_BASE
+    with pytest.raises(CircuitOpenError):
+        await coord._async_update_data()
+
+    # The next probe, due exactly at its interval, succeeds and the poll recovers
+    clock[0] += BREAKER_PROBE_BASE
+    coord.client.fail = False
+    data = await coord._async_update_data()
+    assert "482522020944" in data
+    assert coord.breaker_state()["status"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_optimistic_state_confirmed_or_rolled_back(coord_factory):
+    from custom_components.enphase_cloud_things.const import CONF_SERIALS
+    from custom_components.enphase_cloud_things.coordinator import ChargerState
+
+    coord = coord_factory(config={CONF_SERIALS: ["482522020944", "482522020945"]})
+    a, b = "482522020944", "482522020945"
+    coord.data = {
+        a: ChargerState.from_mapping(a, {"charging": False}),
+        b: ChargerState.from_mapping(b, {"charging": False}),
+    }
+
+    polled = {"charging": False}
+
+    async def _poll():
+        return {
+            a: ChargerState.from_mapping(a, dict(polled)),
+            b: ChargerState.from_mapping(b, {"charging": False}),
+        }
+
+    coord._async_poll_status = _poll
+
+    coord.async_apply_optimistic(a, charging=True)
+    assert coord.data[a].charging is True
+    assert coord.is_pending(a, "charging")
+    assert not coord.is_pending(b)
+
+    # Cloud has not caught up yet: the optimistic value is kept
+    data = await coord._async_update_data()
+    assert data[a].charging is True
+    assert coord.is_pending(a)
+
+    # Cloud agrees: confirmed and no longer pending
+    polled["charging"] = True
+    data = await coord._async_update_data()
+    assert data[a].charging is True
+    assert not coord.is_pending(a)
+
+    # Cloud never agrees: rolled back once the reconciliation timeout passes
+    coord._reconcile_timeout = 0
+    coord.async_apply_optimistic(a, charging=False)
+    assert coord.data[a].charging is False
+    data = await coord._async_update_data()
+    assert data[a].charging is True
+    assert not coord.is_pending(a)
+
+
+@pytest.mark.asyncio
+async def test_switch_pending_cleared_when_poll_confirms(coord_factory, monkeypatch):
+    from custom_components.enphase_cloud_things.coordinator import ChargerState
+    from custom_components.enphase_cloud_things.switch import ChargingSwitch
+
+    sn = "482522020944"
+    coord = coord_factory()
+    monkeypatch.setattr(coord, "_schedule_refresh", lambda: None)
+    coord.data = {sn: ChargerState.from_mapping(sn, {"charging": True})}
+
+    async def _poll():
+        return {sn: ChargerState.from_mapping(sn, {"charging": False})}
+
+    coord._async_poll_status = _poll
+    switch = ChargingSwitch(coord, sn)
+    written = []
+    switch.async_write_ha_state = lambda: written.append(
+        (switch.is_on, switch.extra_state_attributes["pending"])
+    )
+    coord.async_add_listener(switch._handle_coordinator_update, sn)
+    coord.async_update_listeners()
+    written.clear()
+
+    coord.async_apply_optimistic(sn, charging=False)
+    assert written == [(False, True)]
+
+    # The poll matches the optimistic snapshot; only the pending flag moves
+    coord.data = await coord._async_update_data()
+    coord.async_update_listeners()
+    assert written == [(False, True), (False, False)]
+
+
+def test_reconcile_timeout_option_applies_without_reload(coord_factory):
+    from types import SimpleNamespace
+
+    from custom_components.enphase_cloud_things.const import OPT_RECONCILE_TIMEOUT
+    from custom_components.enphase_cloud_things.coordinator import ChargerState
+
+    sn = "482522020944"
+    clock = [1000.0]
+    entry = SimpleNamespace(options={OPT_RECONCILE_TIMEOUT: 90}, async_on_unload=lambda cb: None)
+    coord = coord_factory(clock=clock, config_entry=entry)
+    coord.data = {sn: ChargerState.from_mapping(sn, {"charging": False})}
+
+    coord.async_apply_optimistic(sn, charging=True)
+    assert coord._optimistic[sn]["charging"][1] == 1090.0
+
+    entry.options = {OPT_RECONCILE_TIMEOUT: 30}
+    coord.apply_options()
+    coord.async_apply_optimistic(sn, charge_mode_pref="SCHEDULED_CHARGING")
+    assert coord._optimistic[sn]["charge_mode_pref"][1] == 1030.0
+
+
+@pytest.mark.asyncio
+async def test_charge_mode_select_rolls_back_when_scheduler_disagrees(coord_factory):
+    from custom_components.enphase_cloud_things.select import ChargeModeSelect
+
+    sn = "482522020944"
+    lookups = []
+
+    class StubClient:
+        async def status(self):
+            return {"evChargerData": [{"sn": sn, "pluggedIn": True}]}
+
+        async def summary_v2(self):
+            return []
+
+        async def charge_mode(self, serial):
+            lookups.append(serial)
+            return "MANUAL_CHARGING"
+
+        async def set_charge_mode(self, serial, mode):
+            return {}
+
+    clock = [1000.0]
+    coord = coord_factory(client=StubClient(), clock=clock)
+    coord._reconcile_timeout = 30
+
+    async def _no_refresh():
+        return None
+
+    coord.async_request_refresh = _no_refresh
+    coord.data = await coord._async_update_data()
+    select = ChargeModeSelect(coord, sn)
+    assert select.current_option == "Manual"
+
+    await select.async_select_option("Scheduled")
+    assert select.current_option == "Scheduled"
+    assert coord.is_pending(sn, "charge_mode_pref")
+
+    # The next poll asks the scheduler again instead of trusting the selection
+    coord.data = await coord._async_update_data()
+    assert len(lookups) == 2
+    assert select.current_option == "Scheduled"
+
+    # Still unconfirmed after the reconciliation timeout: rolled back
+    clock[0] += 31
+    coord.data = await coord._async_update_data()
+    assert select.current_option == "Manual"
+    assert not coord.is_pending(sn)
+
+
+@pytest.mark.asyncio
+async def test_shared_cached_payloads_are_not_mutated(coord_factory):
+    import copy
+
+    from custom_components.enphase_cloud_things.const import CONF_VPP_PROGRAM_ID
+
+    # The API client hands the same decoded object to every 304/unchanged GET
+    payloads = {
+        "status": {
+            "evChargerData": [
+                {"sn": "482522020944", "charging": True, "pluggedIn": True, "session_d": {"e_c": 4200, "start_time": 1}}
+            ]
+        },
+        "summary": [{"serialNumber": "482522020944", "maxCurrent": 48, "chargeLevelDetails": {"min": "6", "max": "40"}}],
+        "savings": {"data": {"importedValue": 1.2, "exportedValue": 0.4}},
+        "import_tariff": {
+            "purchase": {
+                "seasons": [
+                    {
+                        "id": "all",
+                        "startMonth": "1",
+                        "endMonth": "12",
+                        "days": [{"days": [1, 2, 3, 4, 5, 6, 7], "periods": [{"rate": "0.3", "type": "off-peak"}]}],
+                    }
+                ]
+            }
+        },
+        "export_tariff": {"data": {"buyback": [{"rate": 0.05}]}},
+        "vpp": {
+            "data": [{"id": "e1", "start_time": "2030-01-01T00:00:00Z", "end_time": "2030-01-01T01:00:00Z"}],
+            "meta": {"rowCount": 1},
+        },
+    }
+    pristine = copy.deepcopy(payloads)
+
+    class StubClient:
+        async def status(self):
+            return payloads["status"]
+
+        async def summary_v2(self):
+            return payloads["summary"]
+
+        async def charge_mode(self, sn):
+            return None
+
+        async def savings_today(self, date):
+            return payloads["savings"]
+
+        async def import_tariff(self):
+            return payloads["import_tariff"]
+
+        async def export_tariff(self, date):
+            return payloads["export_tariff"]
+
+        async def vpp_events(self, program_id, **_kwargs):
+            return payloads["vpp"]
+
+    coord = coord_factory(config={CONF_VPP_PROGRAM_ID: "PROGRAM"}, client=StubClient())
+    for _ in range(2):
+        data = await coord._async_update_data()
+        await coord._async_refresh_domains(("savings", "import_tariff", "export_tariff", "vpp"))
+        for schedule in coord._schedules.values():
+            schedule.next_due = 0.0
+    assert data["482522020944"].max_current == 48
+    assert len(coord.vpp_index) == 1
+    assert payloads == pristine
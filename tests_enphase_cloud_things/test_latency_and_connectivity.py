@@ -1,5 +1,7 @@
 from datetime import timedelta
 
+import pytest
+
 
 def test_cloud_latency_sensor_value():
     from custom_components.enphase_cloud_things.coordinator import EnphaseCoordinator
@@ -38,3 +40,113 @@ def test_site_cloud_reachable_binary_sensor_states():
     # Stale success beyond 2x interval -> off
     coord.last_success_utc = now - timedelta(seconds=25)
     assert bs.is_on is False
+
+
+@pytest.mark.asyncio
+async def test_dedicated_session_is_shared_tuned_and_closed(hass):
+    import aiohttp
+
+    from custom_components.enphase_cloud_things.const import (
+        HTTP_DNS_CACHE_TTL,
+        HTTP_MAX_CONNECTIONS_PER_HOST,
+    )
+    from custom_components.enphase_cloud_things.coordinator import (
+        async_close_enphase_session,
+        async_get_enphase_session,
+        enphase_session_stats,
+    )
+
+    assert enphase_session_stats(hass) == {"dedicated_session": False}
+    session = async_get_enphase_session(hass)
+    try:
+        assert async_get_enphase_session(hass) is session
+        assert session.connector.limit_per_host == HTTP_MAX_CONNECTIONS_PER_HOST
+        assert session.connector.use_dns_cache
+        assert session.connector._cached_hosts._ttl == HTTP_DNS_CACHE_TTL
+        assert isinstance(session.cookie_jar, aiohttp.DummyCookieJar)
+        assert session.headers["Accept"].startswith("application/json")
+        stats = enphase_session_stats(hass)
+        assert stats["dedicated_session"] is True
+        assert stats["reuse_ratio"] is None
+    finally:
+        await async_close_enphase_session(hass)
+    assert session.closed
+    assert async_get_enphase_session(hass) is not session
+    await async_close_enphase_session(hass)
+
+
+@pytest.mark.asyncio
+async def test_request_tracer_records_phase_percentiles():
+    import aiohttp
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    from custom_components.enphase_cloud_things.api import RequestTracer
+
+    async def _status(request):
+        return web.json_response({"evChargerData": [], "ts": 1})
+
+    app = web.Application()
+    app.router.add_get("/service/evse_controller/1/ev_chargers/status", _status)
+    server = TestServer(app)
+    await server.start_server()
+    tracer = RequestTracer()
+    url = str(server.make_url("/service/evse_controller/1/ev_chargers/status"))
+    try:
+        async with aiohttp.ClientSession(trace_configs=[tracer.trace_config()]) as session:
+            # Disabled by default: nothing is recorded
+            async with session.get(url) as r:
+                await r.json()
+            assert tracer.stats()["endpoints"] == {}
+
+            tracer.enabled = True
+            for _ in range(3):
+                async with session.get(url) as r:
+                    await r.read()
+    finally:
+        await server.close()
+
+    status = tracer.stats()["endpoints"]["status"]
+    assert status["count"] == 3
+    assert status["status_codes"] == {"200": 3}
+    assert status["avg_bytes"] > 0
+    assert set(status["total_ms"]) == {"p50", "p90", "p99"}
+    assert "ttfb_ms" in status and "download_ms" in status
+    tracer.reset()
+    assert tracer.stats()["endpoints"] == {}
+
+
+def test_request_tracing_follows_loaded_entries(hass, coord_factory):
+    from types import SimpleNamespace
+
+    from custom_components.enphase_cloud_things.const import DOMAIN, OPT_REQUEST_TRACING
+    from custom_components.enphase_cloud_things.coordinator import (
+        async_get_request_tracer,
+        async_update_request_tracing,
+    )
+
+    def _entry(tracing):
+        return SimpleNamespace(options={OPT_REQUEST_TRACING: tracing}, async_on_unload=lambda cb: None)
+
+    traced = _entry(True)
+    data = hass.data.setdefault(DOMAIN, {})
+    data["a"] = {"coordinator": coord_factory(config_entry=traced)}
+    data["b"] = {"coordinator": coord_factory(config_entry=_entry(False))}
+    tracer = async_get_request_tracer(hass)
+
+    async_update_request_tracing(hass)
+    assert tracer.enabled is True
+
+    # Options update turns it off when no entry wants it any more
+    traced.options = {OPT_REQUEST_TRACING: False}
+    async_update_request_tracing(hass)
+    assert tracer.enabled is False
+
+    traced.options = {OPT_REQUEST_TRACING: True}
+    async_update_request_tracing(hass)
+    assert tracer.enabled is True
+
+    # Unloading the only tracing entry disables it
+    data.pop("a")
+    async_update_request_tracing(hass)
+    assert tracer.enabled is False
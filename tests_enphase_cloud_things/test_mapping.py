@@ -32,3 +32,29 @@ def test_mapping(load_fixture, fixture_name, charging, kwh):
     st = mapped["482522020944"]
     assert st["charging"] is charging
     assert pytest.approx(st["session_kwh"], rel=1e-6) == kwh
+
+
+def test_charger_state_snapshot_is_typed_and_frozen():
+    import dataclasses
+
+    from custom_components.enphase_cloud_things.coordinator import (
+        ChargerState,
+        snapshot_hash,
+    )
+
+    st = ChargerState.from_mapping("555", {"sn": "555", "charging": True, "max_amp": 32, "unknown": 1})
+    assert st.charging is True and st.max_amp == 32
+    assert not hasattr(st, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        st.charging = False  # type: ignore[misc]
+
+    # Read-only mapping access for diagnostics/older callers
+    assert st["max_amp"] == 32
+    assert st.get("min_amp", 6) == 6
+    assert "max_amp" in st and "min_amp" not in st and "unknown" not in st
+    assert st.as_dict() == {"sn": "555", "charging": True, "max_amp": 32}
+
+    # Equal snapshots hash equal so unchanged chargers can be skipped
+    again = ChargerState(sn="555", charging=True, max_amp=32)
+    assert snapshot_hash(st) == snapshot_hash(again)
+    assert snapshot_hash(st) != snapshot_hash(dataclasses.replace(st, max_amp=16))
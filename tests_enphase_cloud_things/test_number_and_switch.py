@@ -102,6 +102,10 @@ async def test_charging_switch_turn_on_off(hass, monkeypatch):
 
     await sw.async_turn_on()
     assert coord.client.start_calls[-1] == (sn, 32, 1)
+    # Shown as charging right away, pending the next status poll
+    assert sw.is_on is True
+    assert sw.extra_state_attributes == {"pending": True}
 
     await sw.async_turn_off()
     assert coord.client.stop_calls[-1] == sn
+    assert sw.is_on is False
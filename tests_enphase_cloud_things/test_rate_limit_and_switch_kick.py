@@ -135,3 +135,156 @@ async def test_latency_ms_set_on_success_and_failure(hass, monkeypatch):
         await coord._async_update_data()
     # latency should still be set in finally
     assert isinstance(coord.latency_ms, int)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_throttles_per_host_and_prioritises_commands():
+    import asyncio
+
+    from custom_components.enphase_cloud_things.api import RequestRateLimiter
+
+    # 600 rpm -> 10 tokens/s with a burst of 100; shrink the burst for the test
+    limiter = RequestRateLimiter({"enlighten.enphaseenergy.com": 600, "gs.enphaseenergy.com": 600})
+    bucket = limiter._buckets["enlighten.enphaseenergy.com"]
+    bucket._capacity = 1.0
+    bucket._tokens = 1.0
+    assert limiter.take_peak_queue_depth("1001") == 0
+
+    order = []
+
+    async def _req(name, url, priority=False):
+        await limiter.acquire(url, priority=priority)
+        order.append(name)
+
+    poll = "https://enlighten.enphaseenergy.com/service/evse_controller/1/ev_chargers/status"
+    await _req("first", poll)
+    # Bucket empty: a queued poll is overtaken by a control command
+    queued = asyncio.ensure_future(_req("poll", poll))
+    await asyncio.sleep(0)
+    command = asyncio.ensure_future(_req("command", poll, priority=True))
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 2
+    await asyncio.gather(queued, command)
+    assert order == ["first", "command", "poll"]
+
+    # Other hosts have their own budget
+    await _req("vpp", "https://gs.enphaseenergy.com/vpp-mgr/api/v1/events/get")
+    stats = limiter.stats()
+    assert stats["gs.enphaseenergy.com"]["max_wait_ms"] < 50
+    assert stats["enlighten.enphaseenergy.com"]["delayed"] == 2
+    assert limiter.queue_depth == 0
+    # The burst is still reported once the queue has drained, then resets
+    assert limiter.take_peak_queue_depth("1001") == 2
+    assert limiter.take_peak_queue_depth("1001") == 0
+
+
+def test_rate_limiter_shared_across_sites_of_account(coord_factory):
+    from custom_components.enphase_cloud_things.const import CONF_EMAIL, CONF_SITE_ID
+
+    def _coord(site, email):
+        return coord_factory(config={CONF_SITE_ID: site, CONF_EMAIL: email})
+
+    a = _coord("1001", "user@example.com")
+    b = _coord("1002", "USER@example.com")
+    c = _coord("1003", "other@example.com")
+    assert a.rate_limiter is b.rate_limiter
+    assert a.client._limiter is a.rate_limiter
+    assert c.rate_limiter is not a.rate_limiter
+
+
+def test_shared_rate_limit_options_use_strictest_and_follow_updates(coord_factory, caplog):
+    from types import SimpleNamespace
+
+    from custom_components.enphase_cloud_things.const import (
+        CONF_EMAIL,
+        CONF_SITE_ID,
+        OPT_RATE_LIMIT_RPM,
+    )
+
+    host = "enlighten.enphaseenergy.com"
+
+    def _coord(site, rpm):
+        entry = SimpleNamespace(options={OPT_RATE_LIMIT_RPM: rpm}, async_on_unload=lambda cb: None)
+        config = {CONF_SITE_ID: site, CONF_EMAIL: "user@example.com"}
+        return coord_factory(config=config, config_entry=entry)
+
+    a = _coord("1001", 60)
+    assert "different rate_limit_rpm" not in caplog.text
+    b = _coord("1002", 30)
+    bucket = a.rate_limiter._buckets[host]
+    # Setup order does not matter: the lower budget applies to both sites
+    assert bucket.rpm == 30
+    assert "different rate_limit_rpm" in caplog.text
+
+    # An options update is applied without reloading the entry
+    a.config_entry.options = {OPT_RATE_LIMIT_RPM: 20}
+    a.apply_options()
+    assert bucket.rpm == 20
+
+    # Unloading a site drops its request
+    a.rate_limiter.release("1001")
+    assert bucket.rpm == 30
+    assert b.rate_limiter is a.rate_limiter
+
+
+def test_retry_after_accepts_seconds_and_http_date():
+    from datetime import UTC, datetime
+
+    from custom_components.enphase_cloud_things.api import parse_retry_after
+
+    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+    assert parse_retry_after("120", now) == 120
+    assert parse_retry_after("Wed, 01 Jan 2025 12:02:30 GMT", now) == 150
+    assert parse_retry_after("Wed, 01 Jan 2025 11:00:00 GMT", now) == 0
+    assert parse_retry_after("soon", now) is None
+    assert parse_retry_after(None, now) is None
+
+
+def test_backoff_policy_bounded_per_class_and_decays():
+    from itertools import pairwise
+
+    from custom_components.enphase_cloud_things.coordinator import BackoffPolicy
+
+    policy = BackoffPolicy(bases={"rate_limit": 5}, cap=300)
+    delays = [policy.next_delay("rate_limit") for _ in range(12)]
+    assert all(5 <= d <= 300 for d in delays)
+    # Each draw is bounded by three times the previous delay
+    assert all(b <= max(5, a * 3) for a, b in pairwise(delays))
+    assert policy.failures["rate_limit"] == 12
+    # Retry-After is a floor even above the cap
+    assert policy.next_delay("rate_limit", retry_after=600) == 600
+    # Other error classes keep their own count
+    policy.next_delay("server")
+    assert policy.failures["server"] == 1
+
+    policy.record_success()
+    assert policy.failures["rate_limit"] == 6
+    for _ in range(10):
+        policy.record_success()
+    assert policy.failures == {}
+
+
+@pytest.mark.asyncio
+async def test_limiter_wait_does_not_count_against_endpoint_budget(coord_factory, fake_http, monkeypatch):
+    import json
+
+    from custom_components.enphase_cloud_things import coordinator as coord_mod
+
+    body = json.dumps({"evChargerData": [{"sn": "482522020944", "pluggedIn": True}]}).encode()
+
+    # Status, then the summary and charge mode lookups of the first poll
+    session = fake_http.Session([lambda: fake_http.Response(200, body)] * 3)
+    monkeypatch.setattr(coord_mod, "ENDPOINT_BUDGETS", {"status": 0.05})
+    coord = coord_factory()
+    coord.client._s = session
+    # Empty bucket at 600 rpm: the next slot is ~0.1s away, past the 50ms budget
+    coord.rate_limiter.set_rate("enlighten.enphaseenergy.com", 600)
+    bucket = coord.rate_limiter._buckets["enlighten.enphaseenergy.com"]
+    bucket._tokens = 0.0
+
+    data = await coord._async_update_data()
+
+    assert data["482522020944"].plugged is True
+    assert bucket.last_wait_ms > 50
+    assert coord.endpoint_timeouts.get("status", 0) == 0
+    assert coord._breakers["status"].failures == 0
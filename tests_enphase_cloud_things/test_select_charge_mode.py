@@ -43,5 +43,6 @@ async def test_charge_mode_select(hass, monkeypatch):
     assert sel.current_option == "Scheduled"
 
     await sel.async_select_option("Manual")
-    # cache should update immediately
-    assert coord._charge_mode_cache["482522020944"][0] == "MANUAL_CHARGING"
+    # UI updates immediately; the scheduler is asked again on the next poll
+    assert sel.current_option == "Manual"
+    assert "482522020944" not in coord._charge_mode_cache
@@ -106,3 +106,101 @@ async def test_summary_v2_enrichment(hass, monkeypatch):
     assert st["model_name"] == "MODEL-NAME"
     assert st["model_id"] == "MODEL-SKU-0000"
     assert st["display_name"] == "Garage Charger"
+
+
+@pytest.mark.asyncio
+async def test_summary_v2_cached_between_polls(coord_factory):
+    coord = coord_factory()
+
+    class StubClient:
+        def __init__(self):
+            self.summary_calls = 0
+
+        async def status(self):
+            return {"evChargerData": [{"sn": "482522020944", "charging": True}]}
+
+        async def summary_v2(self):
+            self.summary_calls += 1
+            return [{"serialNumber": "482522020944", "maxCurrent": 32, "operatingVoltage": "230"}]
+
+    coord.client = StubClient()
+
+    first = await coord._async_update_data()
+    second = await coord._async_update_data()
+    assert coord.client.summary_calls == 1
+    assert first["482522020944"]["max_current"] == 32
+    assert second["482522020944"]["max_current"] == 32
+    assert second["482522020944"]["operating_v"] == 230
+    assert coord.summary_cache_age is not None
+
+    # Control actions force the next poll to refetch
+    coord.invalidate_summary_cache()
+    assert coord.summary_cache_age is None
+    await coord._async_update_data()
+    assert coord.client.summary_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_summary_v2_refetched_after_ttl_without_listeners(coord_factory):
+    from custom_components.enphase_cloud_things.const import DEFAULT_SUMMARY_CACHE_TTL
+
+    class StubClient:
+        def __init__(self):
+            self.summary_calls = 0
+            self.max_current = 32
+
+        async def status(self):
+            return {"evChargerData": [{"sn": "482522020944", "charging": False}]}
+
+        async def summary_v2(self):
+            self.summary_calls += 1
+            return [{"serialNumber": "482522020944", "maxCurrent": self.max_current}]
+
+    clock = [1000.0]
+    coord = coord_factory(client=StubClient(), clock=clock)
+    # Nothing listens for summary updates, so the status poll must keep it fresh
+    assert "metadata" not in coord.domain_coordinators
+
+    await coord._async_update_data()
+    clock[0] += DEFAULT_SUMMARY_CACHE_TTL / 2
+    await coord._async_update_data()
+    assert coord.client.summary_calls == 1
+
+    coord.client.max_current = 40
+    clock[0] += DEFAULT_SUMMARY_CACHE_TTL + 60
+    data = await coord._async_update_data()
+    assert coord.client.summary_calls == 2
+    assert data["482522020944"]["max_current"] == 40
+
+
+@pytest.mark.asyncio
+async def test_summary_cache_ttl_option_applies_without_reload(coord_factory):
+    from types import SimpleNamespace
+
+    from custom_components.enphase_cloud_things.const import OPT_SUMMARY_CACHE_TTL
+
+    class StubClient:
+        def __init__(self):
+            self.summary_calls = 0
+
+        async def status(self):
+            return {"evChargerData": [{"sn": "482522020944", "charging": False}]}
+
+        async def summary_v2(self):
+            self.summary_calls += 1
+            return [{"serialNumber": "482522020944", "maxCurrent": 32}]
+
+    clock = [1000.0]
+    entry = SimpleNamespace(options={OPT_SUMMARY_CACHE_TTL: 3600}, async_on_unload=lambda cb: None)
+    coord = coord_factory(client=StubClient(), clock=clock, config_entry=entry)
+
+    await coord._async_update_data()
+    clock[0] += 300
+    await coord._async_update_data()
+    assert coord.client.summary_calls == 1
+
+    # A shorter TTL counts from the last fetch once the options change
+    entry.options = {OPT_SUMMARY_CACHE_TTL: 120}
+    coord.apply_options()
+    await coord._async_update_data()
+    assert coord.client.summary_calls == 2
@@ -0,0 +1,308 @@
+from datetime import UTC, datetime
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+
+TARIFF = {
+    "purchase": {
+        "seasons": [
+            {
+                "id": "summer",
+                "startMonth": "6",
+                "endMonth": "9",
+                "days": [
+                    {
+                        "days": [1, 2, 3, 4, 5],
+                        "periods": [
+                            {"type": "peak", "startTime": "960", "endTime": "1260", "rate": "0.41",
+                             "rateComponents": [{"energy": 0.3}, {"delivery": 0.11}]},
+                            {"type": "off-peak", "startTime": "", "endTime": "", "rate": "0.12"},
+                        ],
+                    },
+                    {"days": [6, 7], "periods": [{"type": "off-peak", "startTime": "", "endTime": "", "rate": "0.1"}]},
+                ],
+            },
+            {
+                "id": "winter",
+                "startMonth": "10",
+                "endMonth": "5",
+                "days": [
+                    {
+                        "days": [1, 2, 3, 4, 5, 6, 7],
+                        "periods": [
+                            {"type": "off-peak", "startTime": "", "endTime": "420", "rate": "0.2"},
+                            {"type": "peak", "startTime": "420", "endTime": "", "rate": "0.3"},
+                        ],
+                    }
+                ],
+            },
+        ]
+    }
+}
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=UTC)
+
+
+def test_compiled_tariff_rate_and_boundaries():
+    from custom_components.enphase_cloud_things.tariff import CompiledTariff
+
+    tariff = CompiledTariff(TARIFF)
+    # Weekday in summer: the listed peak window wins over the all-day entry
+    assert tariff.rate_at(_utc(2025, 7, 2, 17, 30)) == 0.41
+    assert tariff.rate_at(_utc(2025, 7, 2, 21, 0)) == 0.12
+    assert tariff.rate_at(_utc(2025, 7, 5, 17, 30)) == 0.1  # Saturday
+    # Wrap-around winter season
+    assert tariff.rate_at(_utc(2025, 1, 15, 6, 59)) == 0.2
+    assert tariff.rate_at(_utc(2025, 1, 15, 7, 0)) == 0.3
+
+    period = tariff.period_at(_utc(2025, 7, 2, 17, 30))
+    assert period.start == _utc(2025, 7, 2, 16, 0)
+    assert period.end == _utc(2025, 7, 2, 21, 0)
+    assert period.attributes() == {
+        "period_type": "peak",
+        "season": "summer",
+        "rate_components": [{"energy": 0.3}, {"delivery": 0.11}],
+    }
+
+    assert tariff.next_boundary(_utc(2025, 7, 2, 12, 0)) == _utc(2025, 7, 2, 16, 0)
+    assert tariff.next_boundary(_utc(2025, 7, 2, 16, 0)) == _utc(2025, 7, 2, 21, 0)
+    assert tariff.next_boundary(_utc(2025, 7, 2, 22, 0)) == _utc(2025, 7, 3, 0, 0)
+
+
+def test_compiled_tariff_periods_window():
+    from custom_components.enphase_cloud_things.tariff import CompiledTariff
+
+    tariff = CompiledTariff(TARIFF)
+    periods = tariff.periods(_utc(2025, 7, 2, 17, 0), _utc(2025, 7, 3, 0, 0))
+    assert [(p.period_type, p.start, p.end) for p in periods] == [
+        ("off-peak", _utc(2025, 7, 2, 0, 0), _utc(2025, 7, 3, 0, 0)),
+        ("peak", _utc(2025, 7, 2, 16, 0), _utc(2025, 7, 2, 21, 0)),
+    ]
+    # Periods ending before the window start are dropped
+    winter = tariff.periods(_utc(2025, 1, 15, 8, 0), _utc(2025, 1, 15, 9, 0))
+    assert [p.rate for p in winter] == [0.3]
+
+
+def test_compiled_tariff_period_matches_the_rate_shown():
+    from custom_components.enphase_cloud_things.tariff import CompiledTariff
+
+    day = {
+        "days": [1, 2, 3, 4, 5, 6, 7],
+        "periods": [
+            {"type": "shoulder", "startTime": "600", "endTime": "900"},
+            {"type": "off-peak", "startTime": "", "endTime": "", "rate": "0.15"},
+        ],
+    }
+    tariff = CompiledTariff(
+        {"purchase": {"seasons": [{"id": "all", "startMonth": "1", "endMonth": "12", "days": [day]}]}}
+    )
+    # An unpriced period listed first does not hide the priced one, and the
+    # attributes describe the period whose rate is reported
+    period = tariff.period_at(_utc(2025, 3, 4, 12, 0))
+    assert (period.rate, period.period_type) == (0.15, "off-peak")
+    assert tariff.rate_at(_utc(2025, 3, 4, 12, 0)) == 0.15
+
+
+def test_import_cost_sensor_and_calendar_use_compiled_tariff(monkeypatch):
+    from unittest.mock import MagicMock
+
+    from custom_components.enphase_cloud_things import calendar as cal_mod
+    from custom_components.enphase_cloud_things import sensor as sensor_mod
+    from custom_components.enphase_cloud_things import tariff as tariff_mod
+    from custom_components.enphase_cloud_things.coordinator import EnphaseCoordinator
+
+    coord = EnphaseCoordinator.__new__(EnphaseCoordinator)
+    coord.site_id = "1234321"
+    coord.import_tariff_data = TARIFF
+
+    builds = []
+    real = tariff_mod.CompiledTariff
+
+    class _Counting(real):
+        def __init__(self, source):
+            builds.append(source)
+            super().__init__(source)
+
+    monkeypatch.setattr("custom_components.enphase_cloud_things.coordinator.CompiledTariff", _Counting)
+    now = _utc(2025, 7, 2, 17, 30)
+    monkeypatch.setattr(sensor_mod.dt_util, "now", lambda: now)
+
+    entry = MagicMock()
+    entry.options = {}
+    sensor = sensor_mod.EnphaseImportCostNowSensor(coord, entry)
+    assert sensor.native_value == 0.41
+    assert sensor.extra_state_attributes["period_type"] == "peak"
+
+    calendar = cal_mod.EnphaseImportCostCalendar.__new__(cal_mod.EnphaseImportCostCalendar)
+    calendar._coord = coord
+    events = calendar._get_events(_utc(2025, 7, 2, 0, 0), _utc(2025, 7, 3, 0, 0))
+    assert [e.summary for e in events] == ["$0.12000/kWh - Off Peak", "$0.41000/kWh - Peak"]
+    assert "energy: $0.30000" in events[1].description
+    assert len(builds) == 1
+
+    # A new payload object triggers exactly one recompile
+    coord.import_tariff_data = dict(TARIFF)
+    assert sensor.native_value == 0.41
+    assert len(builds) == 2
+    coord.import_tariff_data = None
+    assert sensor.native_value is None
+    assert calendar._get_events(now, now) == []
+
+
+def test_rate_sensors_write_at_boundaries_not_every_poll(monkeypatch):
+    from unittest.mock import MagicMock
+
+    from custom_components.enphase_cloud_things import sensor as sensor_mod
+    from custom_components.enphase_cloud_things.coordinator import EnphaseCoordinator
+
+    coord = EnphaseCoordinator.__new__(EnphaseCoordinator)
+    coord.site_id = "1234321"
+    coord.last_update_success = True
+    coord.import_tariff_data = TARIFF
+    coord.export_tariff_data = {
+        "data": {
+            "buyback": [
+                {"start": 0, "end": 959, "rate": "0.05"},
+                {"start": 960, "end": 1259, "rate": "0.15"},
+                {"start": 1260, "end": 1439, "rate": "0.05"},
+            ]
+        }
+    }
+
+    clock = {"now": _utc(2025, 7, 2, 12, 0)}
+    monkeypatch.setattr(sensor_mod.dt_util, "now", lambda: clock["now"])
+    scheduled = []
+
+    def _track(hass, action, when):
+        scheduled.append(when)
+        return lambda: None
+
+    monkeypatch.setattr(sensor_mod, "async_track_point_in_time", _track)
+
+    entry = MagicMock()
+    entry.options = {}
+    sensor = sensor_mod.EnphaseImportCostNowSensor(coord, entry)
+    sensor.hass = object()
+    writes = []
+    sensor.async_write_ha_state = lambda: writes.append(sensor.native_value)
+
+    sensor._written = sensor._fingerprint()
+    sensor._schedule_boundary()
+    assert scheduled == [_utc(2025, 7, 2, 16, 0)]
+
+    # Unrelated polls leave the state alone
+    sensor._handle_coordinator_update()
+    sensor._handle_coordinator_update()
+    assert writes == []
+
+    clock["now"] = _utc(2025, 7, 2, 16, 0)
+    sensor._handle_boundary(clock["now"])
+    assert writes == [0.41]
+    assert scheduled[-1] == _utc(2025, 7, 2, 21, 0)
+
+    # Availability changes are still written
+    coord.last_update_success = False
+    sensor._handle_coordinator_update()
+    assert len(writes) == 2
+
+    export = sensor_mod.EnphaseExportPriceNowSensor(coord, entry)
+    clock["now"] = _utc(2025, 7, 2, 12, 0)
+    assert export._next_boundary(clock["now"]) == _utc(2025, 7, 2, 16, 0)
+    assert export._next_boundary(_utc(2025, 7, 2, 21, 5)) == _utc(2025, 7, 3, 0, 0)
+
+
+def test_export_tariff_cache_lru_and_ttl():
+    from datetime import date
+
+    from custom_components.enphase_cloud_things.tariff import ExportTariffCache
+
+    cache = ExportTariffCache(max_entries=2, ttl=60, past_ttl=3600)
+    today = date(2025, 7, 2)
+    cache.put(date(2025, 7, 1), {"d": 1}, now=0, today=today)
+    cache.put(today, {"d": 2}, now=0, today=today)
+    assert cache.get(date(2025, 7, 1), now=100) == {"d": 1}  # past dates live longer
+    assert cache.get(today, now=100) is None  # today expired after 60s
+    cache.put(today, {"d": 2}, now=100, today=today)
+    cache.get(date(2025, 7, 1), now=100)
+    cache.put(date(2025, 7, 3), {"d": 3}, now=100, today=today)
+    # Least recently used day was evicted
+    assert today not in cache
+    assert date(2025, 7, 1) in cache
+    assert cache.stats() == {"entries": 2, "hits": 2, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_export_tariffs_fetched_concurrently_and_cached(coord_factory):
+    import asyncio
+    from datetime import date
+
+    state = {"active": 0, "peak": 0, "calls": []}
+
+    class _Client:
+        async def export_tariff(self, day):
+            state["calls"].append(day)
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            if day == "2025-07-05":
+                raise RuntimeError("boom")
+            return {"data": {"buyback": [{"start": 0, "end": 1439, "rate": day}]}}
+
+    coord = coord_factory(client=_Client())
+
+    first, second = await asyncio.gather(
+        coord.async_get_export_tariffs(date(2025, 7, 1), date(2025, 7, 10)),
+        coord.async_get_export_tariffs(date(2025, 7, 1), date(2025, 7, 2)),
+    )
+    # Overlapping queries share in-flight day fetches
+    assert len(state["calls"]) == 10
+    assert 1 < state["peak"] <= 4
+    assert date(2025, 7, 5) not in first
+    assert len(first) == 9
+    assert set(second) == {date(2025, 7, 1), date(2025, 7, 2)}
+
+    again = await coord.async_get_export_tariffs(date(2025, 7, 1), date(2025, 7, 4))
+    assert len(again) == 4
+    assert len(state["calls"]) == 10
+    # Day fetches go through the endpoint budget and breaker
+    assert "boom" in coord._breakers["export_tariff"].last_error
+    assert "export_tariff" in coord.endpoint_ms
+
+
+@pytest.mark.asyncio
+async def test_export_tariff_refetched_after_ttl(coord_factory):
+    from datetime import timedelta
+
+    from homeassistant.util import dt as dt_util
+
+    from custom_components.enphase_cloud_things.const import EXPORT_TARIFF_TTL
+
+    calls = []
+
+    class _Client:
+        async def export_tariff(self, day):
+            calls.append(day)
+            return {"data": {"buyback": [{"start": 0, "end": 1439, "rate": str(len(calls))}]}}
+
+    clock = [1000.0]
+    coord = coord_factory(client=_Client(), clock=clock)
+    today = dt_util.now().date()
+    tomorrow = today + timedelta(days=1)
+
+    first = await coord.async_get_export_tariffs(today, tomorrow)
+    assert len(calls) == 2
+
+    clock[0] += EXPORT_TARIFF_TTL - 1
+    assert await coord.async_get_export_tariffs(today, tomorrow) == first
+    assert len(calls) == 2
+
+    # Today and future days expire after the TTL and are fetched again
+    clock[0] += 2
+    refreshed = await coord.async_get_export_tariffs(today, tomorrow)
+    assert len(calls) == 4
+    assert refreshed[today]["data"]["buyback"][0]["rate"] in {"3", "4"}
@@ -220,3 +220,165 @@ def test_vpp_event_today_binary_sensor_no_events():
     attrs = binary_sensor.extra_state_attributes
     assert attrs["event_count"] == 0
     assert len(attrs["events"]) == 0
+
+
+def test_vpp_event_index_queries():
+    """Test the VPP event index orders, counts and answers range queries."""
+    from datetime import UTC, datetime
+
+    from custom_components.enphase_cloud_things.vpp import VPPEventIndex
+
+    def _utc(*args):
+        return datetime(*args, tzinfo=UTC)
+
+    index = VPPEventIndex(
+        {
+            "data": [
+                {"id": "c", "type": "battery_charge", "status": "scheduled",
+                 "start_time": "2025-10-05T00:00:00.000+00:00", "end_time": "2025-10-05T02:00:00.000+00:00"},
+                {"id": "long", "type": "idle", "status": "completed",
+                 "start_time": "2025-10-01T00:00:00Z", "end_time": "2025-10-04T00:00:00Z"},
+                {"id": "b", "type": "battery_discharge", "status": "completed",
+                 "start_time": "2025-10-02T00:00:00", "end_time": "2025-10-02T01:00:00"},
+                {"id": "bad", "type": "idle", "start_time": "not a date", "end_time": None},
+            ]
+        }
+    )
+
+    assert [e.id for e in index.events] == ["long", "b", "c"]
+    assert index.events[1].start.tzinfo is not None
+    assert len(index) == 4
+    assert index.status_counts == {"scheduled": 1, "completed": 2, "unknown": 1}
+    assert index.type_counts == {"battery_charge": 1, "idle": 2, "battery_discharge": 1}
+
+    # The long event still overlaps a window after the short one ended
+    assert [e.id for e in index.overlapping(_utc(2025, 10, 3), _utc(2025, 10, 3, 23))] == ["long"]
+    assert [e.id for e in index.overlapping(_utc(2025, 10, 2), _utc(2025, 10, 5))] == ["long", "b", "c"]
+    assert index.overlapping(_utc(2025, 10, 6), _utc(2025, 10, 7)) == []
+
+    assert index.next_event(_utc(2025, 10, 2, 12)).id == "c"
+    assert index.next_event(_utc(2025, 10, 6)) is None
+    assert index.future_count(_utc(2025, 10, 1, 12)) == 2
+    assert index.current_or_next(_utc(2025, 10, 3)).id == "long"
+    assert index.current_or_next(_utc(2025, 10, 4, 12)).id == "c"
+
+
+def test_vpp_index_rebuilt_only_for_new_payload():
+    """Test the coordinator reuses the VPP index until the payload changes."""
+    from custom_components.enphase_cloud_things.coordinator import EnphaseCoordinator
+
+    coord = EnphaseCoordinator.__new__(EnphaseCoordinator)
+    coord.vpp_events_data = {"data": []}
+    first = coord.vpp_index
+    assert coord.vpp_index is first
+    coord.vpp_events_data = {"data": []}
+    assert coord.vpp_index is not first
+    coord.vpp_events_data = None
+    assert len(coord.vpp_index) == 0
+
+
+def test_vpp_event_store_merges_windows_by_id():
+    """Test windowed VPP fetches are merged by id and windows are authoritative."""
+    from datetime import date
+
+    from custom_components.enphase_cloud_things.vpp import VPPEventStore
+
+    def _event(event_id, day, status="scheduled"):
+        return {
+            "id": event_id,
+            "status": status,
+            "start_time": f"{day}T00:00:00.000+00:00",
+            "end_time": f"{day}T01:00:00.000+00:00",
+        }
+
+    store = VPPEventStore()
+    store.merge(
+        {"meta": {"rowCount": 2}, "data": [_event("a", "2025-10-01"), _event("b", "2025-10-20")]},
+        date(2025, 9, 24), date(2025, 10, 31),
+    )
+    # Older history backfilled separately
+    store.merge({"data": [_event("old", "2025-08-10", "completed")]}, date(2025, 8, 1), date(2025, 8, 31))
+    # Next window: "a" completed, "b" was cancelled and is no longer listed
+    payload = store.merge({"data": [_event("a", "2025-10-01", "completed")]}, date(2025, 9, 25), date(2025, 11, 1))
+
+    assert [e["id"] for e in payload["data"]] == ["a", "old"]
+    assert payload["data"][0]["status"] == "completed"
+    assert payload["meta"] == {"rowCount": 2}
+    assert store.covers(date(2025, 9, 24), date(2025, 11, 1))
+    assert store.covers(date(2025, 8, 5), date(2025, 8, 20))
+    assert not store.covers(date(2025, 8, 20), date(2025, 9, 30))
+
+
+def test_vpp_event_store_uses_local_dates_and_prunes(monkeypatch):
+    """Test windows match events by local date and old entries are evicted."""
+    from datetime import date
+
+    from homeassistant.util import dt as dt_util
+
+    from custom_components.enphase_cloud_things.vpp import VPPEventStore
+
+    monkeypatch.setattr(dt_util, "DEFAULT_TIME_ZONE", dt_util.get_time_zone("America/Los_Angeles"))
+    store = VPPEventStore()
+    # 03:00 UTC on Oct 2 is the evening of Oct 1 in Los Angeles
+    evening = {"id": "eve", "start_time": "2025-10-02T03:00:00+00:00", "end_time": "2025-10-02T04:00:00+00:00"}
+    store.merge({"data": [evening]}, date(2025, 9, 28), date(2025, 10, 5))
+    store.merge({"data": []}, date(2025, 10, 1), date(2025, 10, 1))
+    assert len(store) == 0
+
+    def _event(event_id, day):
+        return {"id": event_id, "start_time": f"{day}T18:00:00+00:00", "end_time": f"{day}T19:00:00+00:00"}
+
+    store.merge({"data": [_event("june", "2025-06-10")]}, date(2025, 6, 1), date(2025, 6, 30))
+    store.merge({"data": [_event("oct", "2025-10-10")]}, date(2025, 10, 8), date(2025, 11, 14))
+    store.prune(date(2025, 7, 1))
+    assert [e["id"] for e in store.payload()["data"]] == ["oct"]
+    assert not store.covers(date(2025, 6, 1), date(2025, 6, 30))
+    assert store.covers(date(2025, 10, 8), date(2025, 11, 14))
+
+
+@pytest.mark.asyncio
+async def test_vpp_window_polling_and_backfill(monkeypatch):
+    """Test the coordinator polls a bounded VPP window and backfills on demand."""
+    from datetime import UTC, date, datetime
+
+    from custom_components.enphase_cloud_things import coordinator as coord_mod
+    from custom_components.enphase_cloud_things.coordinator import EnphaseCoordinator
+
+    now = datetime(2025, 10, 15, 12, 0, tzinfo=UTC)
+    monkeypatch.setattr(coord_mod.dt_util, "now", lambda: now)
+    calls = []
+
+    class _Client:
+        async def vpp_events(self, program_id, start_date="", end_date=""):
+            calls.append((start_date, end_date))
+            return {"data": [{"id": f"ev-{start_date}", "start_time": f"{start_date}T05:00:00+00:00",
+                              "end_time": f"{start_date}T06:00:00+00:00"}]}
+
+    coord = EnphaseCoordinator.__new__(EnphaseCoordinator)
+    coord.vpp_program_id = "prog"
+    coord.client = _Client()
+    coord.endpoint_ms = {}
+    coord.endpoint_timeouts = {}
+
+    coord.vpp_events_data = await coord._async_fetch_vpp_window()
+    assert calls == [("2025-10-08", "2025-11-14")]
+
+    # Inside the polled window: no request
+    await coord.async_ensure_vpp_range(datetime(2025, 10, 10, tzinfo=UTC),
+                                       datetime(2025, 10, 20, tzinfo=UTC))
+    assert len(calls) == 1
+
+    # Older month: fetched once, then served from the store
+    for _ in range(2):
+        await coord.async_ensure_vpp_range(datetime(2025, 8, 1, tzinfo=UTC),
+                                           datetime(2025, 8, 31, tzinfo=UTC))
+    assert calls[1:] == [("2025-08-01", "2025-08-31")]
+    assert {e["id"] for e in coord.vpp_events_data["data"]} == {"ev-2025-10-08", "ev-2025-08-01"}
+    assert [e.id for e in coord.vpp_index.overlapping(datetime(2025, 8, 1, tzinfo=UTC),
+                                                      datetime(2025, 8, 2, tzinfo=UTC))] == ["ev-2025-08-01"]
+
+    # History beyond the retention period is dropped by the next window poll
+    now = datetime(2026, 1, 10, 12, 0, tzinfo=UTC)
+    coord.vpp_events_data = await coord._async_fetch_vpp_window()
+    assert {e["id"] for e in coord.vpp_events_data["data"]} == {"ev-2025-10-08", "ev-2026-01-03"}
+    assert not coord._vpp_events_store().covers(date(2025, 8, 1), date(2025, 8, 31))